@@ -1,8 +1,10 @@
 import numpy as np
+import weakref
+from array import array
 
 from CampusEnv import CampusEnv
+from map_store import MapStore
 from typing import List, Tuple
-import heapdict
 
 
 
@@ -11,25 +13,114 @@ class Node():
         self.state = state
 
     def succ(self, env):
+        graph = CampusGraph.of(env)
+        return [(Node(graph.targets[i]), graph.costs[i], graph.actions[i])
+                for i in range(graph.offsets[self.state], graph.offsets[self.state + 1])]
+
+    def h(self, env):
+        return CampusHeuristic.of(env)(self.state)
+
+
+class CampusGraph():
+    """A map compiled into array-backed successor tables.
+
+    The successors of state s are the entries offsets[s]..offsets[s + 1] of targets, costs and
+    actions, in env.succ order, with holes and self-loops already filtered out. goal flags the final
+    states, which are never expanded.
+    """
+
+    _graphs = weakref.WeakKeyDictionary()
+
+    def __init__(self, env: CampusEnv) -> None:
+        self.nrow, self.ncol = env.nrow, env.ncol
+        self.initial = env.get_initial_state()
+        n = self.nrow * self.ncol
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        self.costs = array("d")
+        self.actions = array("b")
+        self.goal = bytearray(n)
+        for state in range(n):
+            if env.is_final_state(state):
+                self.goal[state] = 1
+            for next_state, cost, action in self.edges(env, state):
+                self.targets.append(next_state)
+                self.costs.append(cost)
+                self.actions.append(action)
+            self.offsets.append(len(self.targets))
+
+    @staticmethod
+    def edges(env: CampusEnv, state) -> List[Tuple[int, float, int]]:
+        """(next state, cost, action) for every move out of state that a search may take."""
+        if env.is_final_state(state):
+            return []
         result = []
-        actions = env.succ(self.state)
-        for action in actions:
-            n = env.succ(self.state)[action]
-            if env.is_final_state(n[0]):
-                result.append((Node(n[0]), n[1], action))
-            if not n[2] and n[0] != self.state:
-                result.append((Node(n[0]), n[1], action))
+        for action, (next_state, cost, terminated) in env.succ(state).items():
+            if next_state is None:
+                continue
+            if env.is_final_state(next_state) or (not terminated and next_state != state):
+                result.append((next_state, cost, action))
         return result
 
-    def h(self, env):
-        nrow, ncol = env.to_row_col(self.state)
-        closest = np.inf
-        for goal in env.get_goal_states():
-            grow, gcol = env.to_row_col(goal)
-            distance = abs(nrow-grow) + abs(ncol-gcol)
-            closest = min(closest, distance)
-        portal_price = 100
-        return min(closest, portal_price)
+    @classmethod
+    def of(cls, env: CampusEnv) -> "CampusGraph":
+        if env not in cls._graphs:
+            cls._graphs[env] = cls(env)
+        return cls._graphs[env]
+
+    def bind(self, env: CampusEnv) -> None:
+        """Makes of(env) return this graph, e.g. one compiled in another process."""
+        self._graphs[env] = self
+
+
+class HeuristicField():
+    """Heuristic values for every state of a map, computed once and then looked up by state.
+
+    Subclasses implement compute(env), returning a NumPy array indexed by state. of(env) builds the
+    field on first use and caches it per (heuristic, map), so any heuristic that can be tabulated
+    plugs into the agents the same way.
+    """
+
+    _fields = weakref.WeakKeyDictionary()
+
+    def __init__(self, env: CampusEnv) -> None:
+        self.values = self.compute(env)
+        self.table = self.values.tolist()
+
+    def __call__(self, state) -> float:
+        return self.table[state]
+
+    @classmethod
+    def of(cls, env: CampusEnv) -> "HeuristicField":
+        fields = cls._fields.setdefault(env, {})
+        if cls not in fields:
+            fields[cls] = cls(env)
+        return fields[cls]
+
+    def bind(self, env: CampusEnv) -> None:
+        """Makes of(env) return this field, e.g. one computed in another process."""
+        self._fields.setdefault(env, {})[type(self)] = self
+
+    def compute(self, env: CampusEnv) -> np.ndarray:
+        raise NotImplementedError
+
+
+class CampusHeuristic(HeuristicField):
+    """min(Manhattan distance to the nearest goal, portal price)."""
+
+    portal_price = 100
+    goal_chunk = 256
+
+    def compute(self, env: CampusEnv) -> np.ndarray:
+        rows, cols = np.divmod(np.arange(env.nrow * env.ncol), env.ncol)
+        goals = np.array([env.to_row_col(goal) for goal in env.get_goal_states()]).reshape(-1, 2)
+        closest = np.full(rows.shape, np.inf)
+        # Chunk the goals so the distance matrix stays small on maps with many G tiles
+        for i in range(0, len(goals), self.goal_chunk):
+            chunk = goals[i:i + self.goal_chunk]
+            distance = np.abs(rows[:, None] - chunk[:, 0]) + np.abs(cols[:, None] - chunk[:, 1])
+            np.minimum(closest, distance.min(axis=1), out=closest)
+        return np.minimum(closest, self.portal_price)
 
 
 import time
@@ -62,195 +153,583 @@ def print_solution(actions,env: CampusEnv, sleep=0.75, arglist: list=[]) -> None
             break
 
 
+class SearchTimeout(Exception):
+    pass
+
+
+DEADLINE_CHECK_MASK = 1023  # Check the clock once every 1024 expansions
+
+
+class SearchObserver():
+    """Receives search events from an agent; every hook is a no-op unless overridden.
+
+    Agents only call into an observer when one is attached, so an untraced search pays a single
+    None check per event site.
+    """
+
+    def on_expand(self, state, g, open_size) -> None:
+        pass
+
+    def on_generate(self, state, parent, action, g) -> None:
+        pass
+
+    def on_reopen(self, state, g) -> None:
+        pass
+
+    def on_goal(self, state, actions, cost, expanded) -> None:
+        pass
+
+
 class DFSGAgent():
-    def __init__(self) -> None:
+    def __init__(self, observer: SearchObserver = None) -> None:
         self.env = None
         self.expanded = 0
+        self.observer = observer
 
-    def search(self, env: CampusEnv) -> Tuple[List[int], float, int]:
+    def search(self, env: CampusEnv, start=None, deadline=None) -> Tuple[List[int], float, int]:
         self.env = env
         self.env.reset()
-        total_cost = 0
         self.expanded = 0
-        actions = []
-        open = []
-        close = set()
-        node = Node(self.env.get_initial_state())
-        open.append(node)
-
-        return self._recurse_search(total_cost, actions, open, close)
-
-    def _recurse_search(self, total_cost, actions, open, close):
-        node = open.pop()
-        close.add(node.state)
-        if self.env.is_final_state(node.state):
-            return actions, total_cost, self.expanded
+        observer = self.observer
+        graph = CampusGraph.of(self.env)
+        offsets, targets, costs, actions = graph.offsets, graph.targets, graph.costs, graph.actions
+        start = graph.initial if start is None else start
+        close = bytearray(len(graph.goal))
+        # The current branch: its states, their g, the next edge to try from each, and the edges taken
+        states = array("i", [start])
+        g = array("d", [0])
+        next_edge = array("i", [offsets[start]])
+        edges = array("i")
+
+        close[start] = 1
+        if graph.goal[start]:
+            if observer is not None:
+                observer.on_goal(start, [], 0, self.expanded)
+            return [], 0, self.expanded
         self.expanded += 1
-        for child in node.succ(self.env):
-            if child[0].state not in close:
-                open.append(child[0])
-                actions.append(child[2])
-                total_cost += child[1]
-                result = self._recurse_search(total_cost, actions, open, close)
-                if result:
-                    return result
-                else:
-                    actions.remove(child[2])
-                    total_cost -= child[1]
+        if observer is not None:
+            observer.on_expand(start, 0, len(states))
+        while states:
+            state = states[-1]
+            i = next_edge[-1]
+            end = offsets[state + 1]
+            while i < end and close[targets[i]]:
+                i += 1
+            if i == end:
+                states.pop()
+                g.pop()
+                next_edge.pop()
+                if edges:
+                    edges.pop()
+                continue
+            next_edge[-1] = i + 1
+            child = targets[i]
+            child_g = g[-1] + costs[i]
+            edges.append(i)
+            close[child] = 1
+            if observer is not None:
+                observer.on_generate(child, state, actions[i], child_g)
+            if graph.goal[child]:
+                path = [actions[e] for e in edges]
+                if observer is not None:
+                    observer.on_goal(child, path, child_g, self.expanded)
+                return path, child_g, self.expanded
+            self.expanded += 1
+            if deadline is not None and not self.expanded & DEADLINE_CHECK_MASK and time.perf_counter() > deadline:
+                raise SearchTimeout()
+            states.append(child)
+            g.append(child_g)
+            next_edge.append(offsets[child])
+            if observer is not None:
+                observer.on_expand(child, child_g, len(states))
         return None
 
 
 
-class UCSAgent():
-  
+class IndexedHeap():
+    """Binary min-heap of keys ordered by priority, indexed by key for O(log n) decrease-key."""
+
     def __init__(self) -> None:
-        self.env = None
+        self.heap = []
+        self.index = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, key) -> bool:
+        return key in self.index
+
+    def priority(self, key):
+        return self.heap[self.index[key]][0]
+
+    def push(self, key, priority) -> None:
+        # Inserts the key, or moves it to its new slot if it is already queued
+        if key in self.index:
+            i = self.index[key]
+            old = self.heap[i][0]
+            self.heap[i] = (priority, key)
+            if priority < old:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        else:
+            self.heap.append((priority, key))
+            self.index[key] = len(self.heap) - 1
+            self._sift_up(len(self.heap) - 1)
+
+    def rekey(self, priority, keys=()) -> None:
+        """Queues keys as well, recomputes every queued key's priority as priority(key) and
+        restores the heap."""
+        queued = [key for _, key in self.heap] + [key for key in keys if key not in self.index]
+        self.heap = sorted((priority(key), key) for key in queued)
+        self.index = {key: i for i, (_, key) in enumerate(self.heap)}
+
+    def remove(self, key) -> None:
+        i = self.index.pop(key)
+        last = self.heap.pop()
+        if i < len(self.heap):
+            self.heap[i] = last
+            self.index[last[1]] = i
+            if i > 0 and last[0] < self.heap[(i - 1) >> 1][0]:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+
+    def pop(self):
+        heap = self.heap
+        last = heap.pop()
+        if not heap:
+            del self.index[last[1]]
+            return last[1], last[0]
+        top = heap[0]
+        heap[0] = last
+        self.index[last[1]] = 0
+        del self.index[top[1]]
+        self._sift_down(0)
+        return top[1], top[0]
+
+    def _sift_up(self, i) -> None:
+        heap, index = self.heap, self.index
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if item[0] < heap[parent][0]:
+                heap[i] = heap[parent]
+                index[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = item
+        index[item[1]] = i
+
+    def _sift_down(self, i) -> None:
+        heap, index = self.heap, self.index
+        size = len(heap)
+        item = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if heap[child][0] < item[0]:
+                heap[i] = heap[child]
+                index[heap[i][1]] = i
+                i = child
+            else:
+                break
+        heap[i] = item
+        index[item[1]] = i
+
+
+class SearchArena():
+    """Search nodes stored as parallel arrays indexed by state: parent, action, g and f.
+
+    A node only records the edge that reached it, and the action list is rebuilt from the parent
+    pointers once a goal is popped. Copying the path into every generated child made memory grow
+    with nodes x depth; on 200x200_1 this took UCS peak traced memory from ~69 MB to ~1 MB.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.parent = array("i", [-1]) * size
+        self.action = array("b", [-1]) * size
+        self.g = array("d", [np.inf]) * size
+        self.f = array("d", [np.inf]) * size
+
+    def path(self, state) -> List[int]:
+        actions = []
+        while self.parent[state] >= 0:
+            actions.append(self.action[state])
+            state = self.parent[state]
+        actions.reverse()
+        return actions
 
-    def search(self, env: CampusEnv) -> Tuple[List[int], float, int]:
+
+class BestFirstSearch():
+    """Graph search shared by the best-first agents.
+
+    The open list is keyed by state, so a cheaper path to a queued state is a decrease-key and a
+    cheaper path to a closed state reopens it. Ties are broken on (f, g, state). With a deadline
+    (a time.perf_counter() value) the search raises SearchTimeout once it passes.
+    """
+
+    def __init__(self, env: CampusEnv, f, observer: SearchObserver = None, start=None, deadline=None) -> None:
         self.env = env
-        self.env.reset()
+        self.f = f
+        self.observer = observer
+        self.start = start
+        self.deadline = deadline
+
+    def run(self) -> Tuple[List[int], float, int]:
+        graph = CampusGraph.of(self.env)
+        offsets, targets, costs, actions = graph.offsets, graph.targets, graph.costs, graph.actions
+        goal = graph.goal
+        f = self.f
+        observer = self.observer
+        deadline = self.deadline
         expanded = 0
-        open = heapdict.heapdict()
-        open_set = set()
-        close_detailed = {}
-        close = set()
-        node = Node(self.env.get_initial_state())
-        node.g = 0
-        node.path = []
-        open[(node, -1)] = (node.g, node.state)
-        open_set.add(node.state)
+        start = graph.initial if self.start is None else self.start
+        open = IndexedHeap()
+        arena = SearchArena(len(goal))
+        parent, action, g, f_values = arena.parent, arena.action, arena.g, arena.f
+        close = bytearray(len(goal))
+        g[start] = 0
+        f_values[start] = f(0, start)
+        open.push(start, (f_values[start], 0, start))
 
         while open:
-            node, node_action = open.popitem()[0]
-            open_set.remove(node.state)
-            close.add(node.state)
-            close_detailed[node.state] = node.g
-            print_solution(node.path, self.env, 0.1)
-            if self.env.is_final_state(node.state):
-                return node.path+[node_action], node.g, expanded
+            state, (_, node_g, _) = open.pop()
+            close[state] = 1
+            if goal[state]:
+                path = arena.path(state)
+                if observer is not None:
+                    observer.on_goal(state, path, node_g, expanded)
+                return path, node_g, expanded
             expanded += 1
-            for child in node.succ(self.env):
-                child[0].g = node.g + child[1]
-                child[0].path = node.path + [node_action] if node_action >= 0 else []
-                if child[0].state not in close and child[0].state not in open_set:
-                    open[(child[0], child[2])] = (child[0].g, child[0].state)
-                    open_set.add(child[0].state)
-                elif child[0].state in open_set:
-                    for open_node in [node[0] for node in open.items()]:
-                        if child[0].g < open_node[0].g:
-                            del open[open_node]
-                            open_node[0].g = child[0].g
-                            open_node[0].path = child[0].path
-                            open[(open_node[0], open_node[1])] = (open_node[0].g, open_node[0].state)
-                elif child[0].state in close and child[0].g < close_detailed[child[0].state]:
-                    revived_node_g = close_detailed[child[0].state]
-                    revived_node_state = child[0].state
-                    close.remove(child[0].state)
-                    del close_detailed[child[0].state]
-                    open[(child[0], child[2])] = (revived_node_g, revived_node_state)
-                    open_set.add(child[0].state)
+            if deadline is not None and not expanded & DEADLINE_CHECK_MASK and time.perf_counter() > deadline:
+                raise SearchTimeout()
+            if observer is not None:
+                observer.on_expand(state, node_g, len(open))
+            for i in range(offsets[state], offsets[state + 1]):
+                child = targets[i]
+                child_g = node_g + costs[i]
+                if g[child] <= child_g:
+                    continue
+                if close[child]:
+                    close[child] = 0
+                    if observer is not None:
+                        observer.on_reopen(child, child_g)
+                if observer is not None:
+                    observer.on_generate(child, state, actions[i], child_g)
+                parent[child] = state
+                action[child] = actions[i]
+                g[child] = child_g
+                f_values[child] = f(child_g, child)
+                open.push(child, (f_values[child], child_g, child))
         return None
 
 
+class UCSAgent():
+  
+    def __init__(self, observer: SearchObserver = None) -> None:
+        self.env = None
+        self.observer = observer
 
+    def search(self, env: CampusEnv, start=None, deadline=None) -> Tuple[List[int], float, int]:
+        self.env = env
+        self.env.reset()
+        return BestFirstSearch(self.env, lambda g, state: g, self.observer, start, deadline).run()
 
 
 class WeightedAStarAgent():
 
-    def __init__(self):
+    def __init__(self, heuristic=CampusHeuristic, observer: SearchObserver = None):
         self.env = None
+        self.heuristic = heuristic
+        self.observer = observer
+
+    def search(self, env: CampusEnv, h_weight, start=None, deadline=None) -> Tuple[List[int], float, int]:
+        self.env = env
+        self.env.reset()
+        h = self.heuristic.of(self.env).table
+
+        def f(g, state):
+            return (1 - h_weight) * g + h_weight * h[state]
+
+        return BestFirstSearch(self.env, f, self.observer, start, deadline).run()
+
+
+
+class AnytimeAStarAgent(WeightedAStarAgent):
+    """Anytime Repairing A* (ARA*) over a decreasing h_weight schedule.
+
+    The first solution comes from the largest weight. Each following weight reuses the previous
+    search: states whose g improved after they were closed wait in INCONS and rejoin OPEN, and OPEN
+    is re-keyed rather than rebuilt. A weight w orders OPEN by g + w / (1 - w) * h, the same order
+    as WeightedAStarAgent's (1 - w) * g + w * h; w = 1 orders by h alone (greedy best-first).
+    Weights must lie in [0, 1].
+    """
 
-    def search(self, env: CampusEnv, h_weight) -> Tuple[List[int], float, int]:
+    def __init__(self, heuristic=CampusHeuristic, observer: SearchObserver = None,
+                 weights=(0.9, 0.8, 0.7, 0.6, 0.5)):
+        super().__init__(heuristic, observer)
+        self.weights = weights
+        self.bound = None
+
+    def search(self, env: CampusEnv, h_weight=None, start=None, deadline=None) -> Tuple[List[int], float, int]:
+        """The best solution found before the deadline (or the optimal one), or None."""
+        result = None
+        for actions, cost, expanded, bound in self.improve(env, h_weight, start, deadline):
+            result = actions, cost, expanded
+        return result
+
+    def improve(self, env: CampusEnv, h_weight=None, start=None, deadline=None):
+        """Yields (actions, cost, expanded, bound) whenever the cost or bound improves, where the cost
+        is at most bound times optimal, until the bound reaches 1 or the deadline passes."""
         self.env = env
         self.env.reset()
+        observer = self.observer
+        weights = [w for w in self.weights if h_weight is None or w <= h_weight]
+        if h_weight is not None and h_weight not in weights:
+            weights.insert(0, h_weight)
+        if any(not 0 <= w <= 1 for w in weights):
+            raise ValueError(f"ARA* weights must lie in [0, 1], got {weights}")
+        graph = CampusGraph.of(self.env)
+        offsets, targets, costs, actions = graph.offsets, graph.targets, graph.costs, graph.actions
+        goal = graph.goal
+        h = self.heuristic.of(self.env).table
+        start = graph.initial if start is None else start
+        arena = SearchArena(len(goal))
+        parent, action, g = arena.parent, arena.action, arena.g
+        close = bytearray(len(goal))
+        incons = set()
+        open = IndexedHeap()
+        best_goal = start if goal[start] else None
         expanded = 0
-        open = heapdict.heapdict()
-        open_set = set()
-        close_detailed = {}
-        close = set()
-        node = Node(self.env.get_initial_state())
-        node.g = 0
-        node.f = 0
-        node.path = []
-        open[(node, -1)] = (node.g, node.state)
-        open_set.add(node.state)
+        reported = None
+        self.bound = None
+
+        g[start] = 0
+        incons.add(start)
+        for weight in weights:
+            # OPEN is keyed on g_scale * g + epsilon * h, which is h alone for the greedy weight 1
+            if weight < 1:
+                g_scale, epsilon, limit = 1, weight / (1 - weight), weight / (1 - weight)
+            else:
+                g_scale, epsilon, limit = 0, 1, float("inf")
+            open.rekey(lambda state: (g_scale * g[state] + epsilon * h[state], g[state], state), incons)
+            incons.clear()
+            close = bytearray(len(goal))
+
+            # ImprovePath: expand until no open state can beat the best goal under this weight
+            while open:
+                if best_goal is not None and open.heap[0][0] >= (g_scale * g[best_goal] + epsilon * h[best_goal], g[best_goal], best_goal):
+                    break
+                state, (_, node_g, _) = open.pop()
+                close[state] = 1
+                if goal[state]:
+                    continue
+                expanded += 1
+                if deadline is not None and not expanded & DEADLINE_CHECK_MASK and time.perf_counter() > deadline:
+                    return
+                if observer is not None:
+                    observer.on_expand(state, node_g, len(open))
+                for i in range(offsets[state], offsets[state + 1]):
+                    child = targets[i]
+                    child_g = node_g + costs[i]
+                    if g[child] <= child_g:
+                        continue
+                    if observer is not None:
+                        observer.on_generate(child, state, actions[i], child_g)
+                    parent[child] = state
+                    action[child] = actions[i]
+                    g[child] = child_g
+                    if goal[child] and (best_goal is None or child_g < g[best_goal]):
+                        best_goal = child
+                    if close[child]:
+                        incons.add(child)
+                    else:
+                        open.push(child, (g_scale * child_g + epsilon * h[child], child_g, child))
+
+            if best_goal is None:
+                return
+            lower = min([g[state] + h[state] for _, state in open.heap] + [g[state] + h[state] for state in incons],
+                        default=g[best_goal])
+            self.bound = min(limit, g[best_goal] / lower) if lower > 0 else 1
+            # Parents may have improved since their children were closed, so the path can be cheaper
+            # than g[best_goal]; report what it really costs
+            path = arena.path(best_goal)
+            cost = 0
+            state = start
+            for step in path:
+                i = offsets[state]
+                while actions[i] != step:
+                    i += 1
+                cost += costs[i]
+                state = targets[i]
+            # A weight that neither found a cheaper path nor tightened the bound has nothing new to report
+            if (cost, max(self.bound, 1)) != reported:
+                reported = cost, max(self.bound, 1)
+                if observer is not None:
+                    observer.on_goal(best_goal, path, cost, expanded)
+                yield path, cost, expanded, reported[1]
+            if self.bound <= 1:
+                return
+
+
+class IncrementalAgent():
+    """Lifelong Planning A* (LPA*): repeated searches on a map that changes between them.
+
+    g and rhs (the one-step lookahead of g) are kept between calls to search(). After
+    update_cells() only the states whose incoming edges changed are re-queued, so a small edit
+    repairs the part of the search tree it touches instead of searching from scratch. All goal
+    states lead into one virtual goal with zero-cost edges. The heuristic has to be consistent,
+    which CampusHeuristic is since every move costs at least 1.
+    """
+
+    def __init__(self, heuristic=CampusHeuristic, observer: SearchObserver = None):
+        self.env = None
+        self.heuristic = heuristic
+        self.observer = observer
+        self.start = None
 
-        while open:
-            node, node_action = open.popitem()[0]
-            open_set.remove(node.state)
-            close.add(node.state)
-            close_detailed[node.state] = node.f
-            if self.env.is_final_state(node.state):
-                return node.path+[node_action], node.g, expanded
+    def _initialize(self, env: CampusEnv, start) -> None:
+        self.env = env
+        graph = CampusGraph.of(env)
+        n = len(graph.goal)
+        self.goal_vertex = n
+        self.goal = bytearray(graph.goal)
+        self.succ = [[(graph.targets[i], graph.costs[i], graph.actions[i])
+                      for i in range(graph.offsets[state], graph.offsets[state + 1])] for state in range(n)]
+        self.pred = [[] for _ in range(n + 1)]
+        for state, edges in enumerate(self.succ):
+            for next_state, cost, action in edges:
+                self.pred[next_state].append((state, cost, action))
+        for state in range(n):
+            if self.goal[state]:
+                self.pred[n].append((state, 0, -1))
+        self.h = self.heuristic.of(env).table + [0]
+        self.g = array("d", [np.inf]) * (n + 1)
+        self.rhs = array("d", [np.inf]) * (n + 1)
+        self.start = graph.initial if start is None else start
+        self.rhs[self.start] = 0
+        self.open = IndexedHeap()
+        self.open.push(self.start, self._key(self.start))
+
+    def _key(self, state):
+        value = min(self.g[state], self.rhs[state])
+        return value + self.h[state], value, state
+
+    def _update_vertex(self, state) -> None:
+        if state != self.start:
+            g, best = self.g, np.inf
+            for parent, cost, _ in self.pred[state]:
+                if g[parent] + cost < best:
+                    best = g[parent] + cost
+            self.rhs[state] = best
+        if self.g[state] != self.rhs[state]:
+            self.open.push(state, self._key(state))
+        elif state in self.open:
+            self.open.remove(state)
+
+    def _successors(self, state):
+        if state == self.goal_vertex:
+            return ()
+        if self.goal[state]:
+            return (self.goal_vertex,)
+        return [next_state for next_state, _, _ in self.succ[state]]
+
+    def search(self, env: CampusEnv, start=None, deadline=None) -> Tuple[List[int], float, int]:
+        """Plans on env, reusing the previous search if env is the map last planned or updated.
+        The expanded count is the work done by this call."""
+        if env is not self.env or (start is not None and start != self.start):
+            self._initialize(env, start)
+        self.env.reset()
+        observer = self.observer
+        g, rhs, open = self.g, self.rhs, self.open
+        goal = self.goal_vertex
+        expanded = 0
+        while open and (open.heap[0][0] < self._key(goal) or rhs[goal] != g[goal]):
+            if deadline is not None and not expanded & DEADLINE_CHECK_MASK and time.perf_counter() > deadline:
+                raise SearchTimeout()
+            state, _ = open.pop()
             expanded += 1
-            for child in node.succ(self.env):
-                child[0].g = node.g + child[1]
-                child[0].f = (1 - h_weight) * child[0].g + h_weight * child[0].h(self.env)
-                child[0].path = node.path + [node_action] if node_action >= 0 else []
-                if child[0].state not in close and child[0].state not in open_set:
-                    open[(child[0], child[2])] = (child[0].f, child[0].state)
-                    open_set.add(child[0].state)
-                elif child[0].state in open_set:
-                    for open_node in [node[0] for node in open.items()]:
-                        if child[0].f < open_node[0].f:
-                            del open[open_node]
-                            open_node[0].g = child[0].g
-                            open_node[0].f = child[0].f
-                            open_node[0].path = child[0].path
-                            open[(open_node[0], open_node[1])] = (open_node[0].f, open_node[0].state)
-                elif child[0].state in close and child[0].f < close_detailed[child[0].state]:
-                    revived_node_f = close_detailed[child[0].state]
-                    revived_node_state = child[0].state
-                    close.remove(child[0].state)
-                    del close_detailed[child[0].state]
-                    open[(child[0], child[2])] = (revived_node_f, revived_node_state)
-                    open_set.add(child[0].state)
-        return None
-
+            if observer is not None:
+                observer.on_expand(state, rhs[state], len(open))
+            if g[state] > rhs[state]:
+                g[state] = rhs[state]
+                for next_state in self._successors(state):
+                    self._update_vertex(next_state)
+            else:
+                g[state] = np.inf
+                for next_state in self._successors(state):
+                    self._update_vertex(next_state)
+                self._update_vertex(state)
+        if g[goal] == np.inf:
+            return None
+
+        # Walk back from the goal along the predecessors that realise g
+        actions = []
+        total_cost = 0
+        state = min(self.pred[goal], key=lambda edge: g[edge[0]])[0]
+        final_state = state
+        while state != self.start:
+            parent, cost, action = min(self.pred[state], key=lambda edge: g[edge[0]] + edge[1])
+            actions.append(action)
+            total_cost += cost
+            state = parent
+        actions.reverse()
+        if observer is not None:
+            observer.on_goal(final_state, actions, total_cost, expanded)
+        return actions, total_cost, expanded
+
+    def update_cells(self, env: CampusEnv, cells) -> None:
+        """Moves the planner onto env, a copy of the planned map with the given (row, col) cells
+        changed. The edges out of each cell and its four neighbours are re-read from env; moves
+        that reach a changed cell from further away must have their source cells listed too. A
+        change to the set of goals changes the heuristic, so it restarts the search."""
+        if self.env is None:
+            self._initialize(env, None)
+            return
+        sources = set()
+        for row, col in cells:
+            for r, c in ((row, col), (row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if 0 <= r < env.nrow and 0 <= c < env.ncol:
+                    sources.add(r * env.ncol + c)
+        if any(bool(env.is_final_state(state)) != bool(self.goal[state]) for state in sources):
+            self._initialize(env, self.start)
+            return
+        self.env = env
+        changed = set()
+        for state in sources:
+            edges = CampusGraph.edges(env, state)
+            if edges == self.succ[state]:
+                continue
+            for next_state, cost, action in self.succ[state]:
+                self.pred[next_state].remove((state, cost, action))
+                changed.add(next_state)
+            for next_state, cost, action in edges:
+                self.pred[next_state].append((state, cost, action))
+                changed.add(next_state)
+            self.succ[state] = edges
+        for state in changed:
+            self._update_vertex(state)
 
 
 class AStarAgent():
     
-    def __init__(self):
-        self.hidden_dwarf = WeightedAStarAgent()
-
-    def search(self, env: CampusEnv) -> Tuple[List[int], float, int]:
-        return self.hidden_dwarf.search(env, 0.5)
-
-
-MAPS = {
-    "4x4_1": ['SGFT', 'TPLA', 'FFPF', 'AHHG'],
-    "4x4_2": ['SFGA', 'LHFT', 'AFPF', 'TPHG'],
-    "4x4_3": ['SLHH', 'TFPF', 'FFAT', 'GPAG'],
-    "4x4_4": ['SFFP', 'AGHF', 'FAHT', 'TLPG'],
-    "4x4_5": ['SFAT', 'GFPP', 'HLAT', 'HFFG'],
-    "4x4_6": ['SAGP', 'LFFP', 'FHFH', 'TATG'],
-    "4x4_7": ['SLPT', 'FHAT', 'GFFP', 'HAFG'],
-    "4x4_8": ['SLHF', 'TFFA', 'GAPH', 'PTFG'],
-    "4x4_9": ['SFGP', 'FPHA', 'FTTL', 'AHFG'],
-    "4x4_10": ['SPHL', 'ATHT', 'GFPF', 'FFAG'],
-    "10x10_1": ['SHTFFFHHFA', 'TFLTTFTFAA', 'ALALFHFHTT', 'FHFFFHAFHA', 'TLFFLFAATG', 'LLAAHGPFFF', 'TFALLFFHTH', 'TLHAAHTLHL', 'FPLHTLGFFT', 'HFLATTFHTG'],
-    "10x10_2": ['SFAALFTLLP', 'FHHFFAGLLH', 'TLFHTHTATL', 'FHPLFFAFHL', 'AFTAAFHFLT', 'THAAHHAHTL', 'LTTHHGFTHA', 'HFLFFFFTFT', 'AFFGFFLHAT', 'TAFTFFTFLG'],
-    "10x10_3": ['STHFFFFHTF', 'HFAAALATAF', 'HHFTGAHLAG', 'TAHFFHAFLF', 'FTLLLFHATP', 'TTFGTHTATF', 'FLTFAATFFT', 'FTPLHHHLHH', 'AFAHLLTTFL', 'LFLFFFFLHG'],
-    "10x10_4": ['SFATLFALLG', 'FHPAHFAFAL', 'FHTHAHFFTT', 'FHFHFFHLFF', 'AFFTFAFFHL', 'HAHLTTATHH', 'TFTFLTFFFL', 'LGFTTHTLHL', 'TAPAALTLAT', 'HTGAFHLFFG'],
-    "10x10_5": ['SALAFTAHGF', 'HLHFLFATLT', 'FALTHHFLAT', 'GHFTFFFLFH', 'LTLHPATHLG', 'HFATHHTTTT', 'FFLAHHTATT', 'FFLFLHFFFF', 'FFAAPAFHTA', 'FLFFTALHFG'],
-    "10x10_6": ['SAFFFAHAHF', 'HLLLHTAATF', 'HFFTTHTHAL', 'TTFTAPFAPF', 'FFHTTAATLH', 'LTHALHHFFL', 'LFGAHAFFGH', 'FFTFLLLLTF', 'TFFTFLTHFL', 'FFAHHTAFGG'],
-    "10x10_7": ['SFTHAFHAPL', 'FFFTAFHTLF', 'FFHFAAALAF', 'LHFHTHFFLA', 'HFLLAFAAFF', 'HFTHTLTLFT', 'FHGTHTTFFA', 'FHLPLLATLT', 'FFFHGGALHH', 'THATTFTLTG'],
-    "10x10_8": ['SFTFLGHALT', 'AAFFLPHGFA', 'HFAHHTFFTF', 'TFHTTTTHAA', 'LAHLAFFHFL', 'LAFTTLLAFL', 'FFHAFFTPTF', 'HAFLHFAHTF', 'HGLFLTFTTH', 'FTHFHLALFG'],
-    "10x10_9": ['SFLFFHTAAL', 'FFFTLFPLPA', 'FTLTTHHHTG', 'FAHFAFTTTL', 'FHAAHLLLAH', 'FHTHTAGGFA', 'FTLFHLFTFF', 'TFFLHFFTFL', 'HAHLAAFHFL', 'THAFATFHTG'],
-    "10x10_10": ['SFAPLFFTGL', 'FFATFAHTLL', 'FAAHLHHFGH', 'LHAHHFFFFT', 'PFTTLTALFF', 'FFTHTFFGAF', 'LAHTFLLLTF', 'HLTHFAAFLT', 'FAHHAFHATT', 'TFTHTLFAHG'],
-    "50x50_1": ['SFHTFLFHFFFFTTTFFAHAFFFFFTAFAFHALAAFHATTFFLFFHAFFA', 'TTFTFFTFFFFHFHTTFTFFHTTFHAFFAHTFHFFFFLFFTHFFFTFFFF', 'FFTFTLLLLTFFFHATTHFFFLAATFFFFFLATLHFHFFFFFFHTFFFFT', 'LTHFAFFFLTFFFFFFALAFFTFATHFATFFFAHFHFAFLATFHFHLHAT', 'TLFHFTFFFFFTTLFTFLFFTTFLATTHAFAFHFATFTFFHLTFFFLFFT', 'HFAFLTTTFHTFALFFFFAFHHFFFLFAAHTTFFLFLFFFHFFFFFFFTF', 'FFTTFHFATFFFAFLFFFTTLTATFFLALFFFFFTFTTAFFFTFFFATTT', 'FATFLFFHLTFAPFFTFFTLTFTFAFHFAFFHTTTFFFFTFFFTFFAFFT', 'HTATFFFGTTGLFHGFFFFFTFFHFFFLFLTFFFFFFTTTFLFAHHFFFF', 'FTFTFFHTFTLFTHFFFTFHFHTTHLHFAFAAAATFHLALFFFTFLTFTH', 'FFAAFFFAFFFTALTFLAFTFTFFFFFHFAHTLFFFFFFTLFTTLFAFFF', 'FFHAHFHAFAAFATFHFFLLFTLFFHFFHFTLFAFLTHFFLHFFTTFFHF', 'FTTLAFFFFATFLHATFFHLFFFFTFFFFFFLTHALAATFFAFAFTFFHT', 'TFFLTFAAHAAFFTHAHFAFHFFTFFFGFAHTFFFTTLGFTTTFFFTFFL', 'FTTHTHFTFTFLHFLAFFFAFFLFTAFAFHFAFTHFHFFFFAFFFTFALF', 'FHFAFFFHAHTLTFHLFFFFAFTFFFFFFTFHFTFTTFLTTTFFFHFATT', 'AFAFFATAAFLFFATTTFFTFTHTLFHHHHHFTFTTTFLHFTAHFFFHFF', 'HFAGHHTFFFTFFHFLFHFFLFFFLTAFTFLLLTFTHTFLHLFHAFTLFA', 'FAHFLTLLAATFHAFLFHFFFAFAFTLATTHAFFAHFHFFTFLTTHFHFF', 'TFLFFAFFFHFTHTHFTTFFFFFFFFFTTTFFFAFFHHFFFAHAFHTTHF', 'FHFFFGFTHHFFTFHTFFFFFFTFFHFTTATAHHFTAFAFFTGFFFFFAA', 'FFATATFFFLFFHHFTFFTFFTTAHATFFFFAAFFHLFFTHTFLFHTFAF', 'LFFFAFHFFFFFFAAFTHFFFFTFFFAFFFTHFTFTTHFFTFTFFFAHAH', 'ALFFFTFFTFHFLTTTFLHFHFATFFTFAAAFFHAFTTFHTFFFFAFLFH', 'TFHFFFTALTFHFFFFLFFFTAFTFFFAFAFFTTLFFAFTFHAFFAFFFT', 'FTTFFATTFFTLFFFFFFHHAFFFALFAFLTFFFFFFFLLTTLTATHHFF', 'FFHFFFAHALFFFLTTFHLHLFAHTFFLFFLFATFFFHFTFAHHATTLFL', 'ATFFTFFATHTLLHFFTFTAFLFAFFFAFTHTFTTTAFTFFAFTLTTHHT', 'ATTFFTFTFTTFFTALFTGFTTTTFTLTAFAHFFFAFLFLFHAFFFFTTF', 'TTFHHFALAATHFFFTFFFFLFHAHTAFFTFTFAFFFHFHFFHHFFFFHH', 'TFFFFHFFFFTLFFLHTFFFFHFTATTFLTFFFFFFFAHFFFAFFHFHTA', 'TTTHFFFHHFTHHFTFAFATAFHTLFLHFFFAFFTFTLAALHFTTFFAFF', 'AFFATFHTHFFFFAFAFFFFFFAFHFAFAFFHTFHFTAFLAHFAHFTFLT', 'FTTHFFFFFFAAFFFFAFTTFALTTFTLFAFFHHFFFFTTFFALFFLTLF', 'AHTFFFFFHLFFFALAFFFLFTFHFALHFFTTFFTTFTHTTFTHTTTAFF', 'TTFTLAFTFHFFFAFAFFFLHFTTHFTTTATTTFFGAFAFFHHFFAFAFF', 'FAHAFFTTLAFLFFTHLTHFFFFFFAFFFFTFTFTFAFTHFTFTAHLTTF', 'FFAALTFTFHFAHFFTTFTFFFFAFHAFFFLTFHFFHFFFFFFFAFFFFF', 'AFAFFFTTFTFFFTFFFHTHFFHFTTFFFATFAFAHTFFHFFFTFHFFTF', 'FAFTTAFHAAAAPHFTFAFFFFTTLFHAHTTFFFTHAFTFAHTLAFTFAF', 'LAFTTFFTAFFAHHFTFLLAFHFFLTFFTTTTFFFFFFFHFFTTFTLTTF', 'FLFAFFAHFFHFFFTFFHFFHHFLFTFFATHHTFALFFTHTTHFFTFTHF', 'ATLTFFFTLFFFTFTLFFFLTFFTFLTHTFFHFFLFFHTFAFFTTFFFFH', 'HHAFFFHLTFTFFTTFFTLTHFFFFFFFLFFFFFAFTFFFFFTLFHFFLT', 'FATTLLLFFFTHFTLALFAFHHFLATAFFFAFTFATALLTFFFFFFFFFF', 'FAFFTFFFATFLFFAFLAFFFFTFTTHFFFTFHAFTFHHFFTHFFFTFHH', 'FHTATTTFFFFFLTFHTAFTHFAAGFHFFTFHFAAFLFFLHFTHFFHLAH', 'AFFTLFFTHFFFLFTTLLFATFAFFAFAHHAFTATTTHFFTFFFFTFHFT', 'FFHLFFHHHTFFTLTAFFFFTTFTTFLFTFFLFTTTFFFFTATLFTLFTF', 'AFFHFLAFTTTFLFHFFFLFFAAFTLFFALAFAAFFAAFFLFTFFTTAFG'],
-    "50x50_2": ['STTTAHFFLFHFFTFTTFLLATFFALFFFFAFFFFFFTFFFFFTTFFTAL', 'FTLFFATHFFFFFTFTTTATTHHFTFHTAFHTFTTATFLAHFTHFFFFAA', 'FFFAAFFFTHFHFFLFTFAFAFFHFFFALHTAAATHAAFFFTTHTTFFLF', 'FTFAFAFHAHAATTHTAHAFFFHFTFTHFLFFTLATFFFFAFFLTFTHFF', 'HFFTTFFAFFLFHHHFTAFFLFTTFFAHHTTFAFTFTAHTFFAFLFHHFF', 'LFFTHHHFTTTAFFFFFTFHFFTFFALTLGAFFFAFFATAFFFFHHAFFL', 'HFATFHAFLFHFAAAHFHLAFFTFFTFFAHFFFFFFAHTFTFFFFTATFA', 'FFFFFFFTFFFLAALLTLTHTHFFFFFFFFFFFFHHFAFFHFTFTTFTTA', 'FFLFFALFTFTFTHHLTFFFFTAGAFFAAFTAFTFFFAHTTTFTTFHALT', 'FTALHFHHLTTTFALFFFLFFTFFHTLTFLFFFAHLHFFLHAFHTFTFAT', 'HFHFTFFHFHFTHAFLFTHFHFAFTATFLFFATFFFHHAAFTFFAAFTFF', 'TAHFTFFAGHFFFFFTFFFFAHAFFFFFTAFTFHFTHFLATATTFHTFFT', 'FFAHTFHFFHAHHFTTHHFTFHFFLLHLFTFTLFFFFFAFFHLHFFFFFT', 'FTHLHFLAFALTHFTAHFTFFHFFTAFFTLFFTFHFFATHTTFHFTLTHT', 'TTAAAFTFFHTAFFFFTHLTTTLLHFFFALFLFFFFHFTLALHHAFALFF', 'THTAHFLATTFFTLFLFTAFLFFFFFHFFHFTFFTFLAHFHTFHLFTHTF', 'FFATFFHHTLFFAFAFFTFFTTFTFFAFLLFFFFHTAATFFLFHHTFFAT', 'FTFFTATTFFAFFFFLFFFFTTFFFATFFFHFAFLAHFFAFHTFHFHFFA', 'FAFHTFTFLFTTTFFTFTHLFTTTFHFFAFFFTHAFHHATFTFAFFFHLF', 'FFFHFFLFTTHTHATFAFTTFFFFTAFFHTLFFFFTTFAFAFFTFLFHFF', 'TATFFLFFFFTTFLFFAFFFHFTFTAFFFFAFFAFFFHHFFFFFFHTLFA', 'FTAFFLTTTTFFFTFFFFHFFFHLFFFHHLTFFFFFALFLAFFLHFTFFF', 'FFALFTFAAFFAFFATFAFLFAFFALFFTLLATFFFAFFTLAFHHFFHAF', 'TFFTFFGFTTTFFFLTFFFFHTATHFFFTTATFHFLFHFFFTHFHLHTHF', 'TFFTFLLTFFAHAFTFFFFFLTFTAFLLFFHFFTHFTTTFFFAFFLHTFL', 'FFLTTTTFFLLAFTTFFFFFHTAHAFAFFAFLFFFFAHHFATAFAFFFFF', 'FAFTHTFFTLTFHHHFLFFTHHLFFTTTFAFTFPFFAFFTTTTFLAFFFF', 'FFLFFTAHALHFTTFHFLLFTFFFTHFFFAFFFHTLFLFFAFTAFFHHFF', 'FFFHTFAFAHTFFFFFHLAATAFFFFFFFTFGFFFFTTFFFFFFTLFAFA', 'FFLTFFFLAFFTLFATFFFFFFLFTAFFHFLAFTHFFTFFAAFFFFTFTA', 'TTALTFFLATFLLLFFFFTLHFFLAFFFFFAAFFFFFFFFLFHHFAHFFH', 'ATHFFFTTAFFFHFFFFHFFFTTAFAFHAHHTTTFTAFFATFFAFTFTFF', 'FTHFFFFTFAFFTTTFTFTTHFFFHPLATLFFFTFFFATFHFHTFFHFFL', 'FFFFLFTFFLTTFFLFTFAAGFAFFFFFATFTTFFTFFFATHFHFFATFL', 'FHTFFFFFFFATFFFTAFHATFAFHHTTHLFFFHFFFTTTTFTTFHTATL', 'TTTFFAFTTFFFFFFHTTFFFTTFFFATTFFFHHAFAFALTFGFFFAAFF', 'TAHFFLFFFTFFTLTLTFFTLFAFFTHFFFHFLFFTFFFFFFLTTFAHFT', 'FFTHTFTFFTFFFTFLLFTTATFFHFFTTTAHTFFFTFALALLHFFFFLF', 'TLLFFFFAFTHFAFFFFTFAFFTAFLFTFFFFTHHALAFTTFFTFFTFFF', 'FFTFTFFTFTFFFLHFFFTFTTFAHFFFFHFFFHHHATFFLFFLTAFATH', 'LFHFTHTATAALLHFFFFAATLLTTFFTFLTFFFFFFLFFTFHFAFHFFF', 'TTFTTFFFTTTHFGTHHFFTFHFFAFFFFTFTTFAALTFFFFFATFFFFT', 'FTAFTAFTAATLFFFHHFFFFFGHLFAAATFHHLFTHTFFLTTFGTTTAT', 'TFHFTFHHFFFHTTTFFHAFTFFHHAHHLTHFHTTFLHFTFFTFTFTTFA', 'LTFLTFFTFFFTFFFFFFTFFHFFFAFTFFTALTFFFFLTAFFHFFHFFH', 'HTFFTHTTFFFHAHFTLFFFLFHAFTGAFTAHTFFFLLFFFFTFFFHAAL', 'FTFFLAFTAFFFAFFFHFFTFFFLFATFTFFLATTTFFFFTLAHTAFFLF', 'AAHTTTFAFHTFFFHTFAFTFFFFAFLFFFFTFFTFAFFAHTFFHTATFL', 'HAFLFHFHFFFFFFLAFAFLFHLATLFFLALAFAFTFFFTFTHFHFHFTH', 'FFFHFFLLHFATHFTFTTFHFFFFFLFHTAFFFTAFAFAFAFHHFFFATG'],
-    "50x50_3": ['SFFFFFFATALFTTHHALFFFFFAFHHFFTFHTFFTAFTFFTLAFTLFFF', 'FFFTHFTTTTHTHFHFHAAFLHFTAHHFLFFTHFFFATAFFFFFFHFFLT', 'LLFFATTFHTFHHFTTHFFAHFFTTTATFFFFHLFFFLFFTLLHHTLFFL', 'FFLLFFFTFFFFTATFATTLLFFAHFTTTFFTLFFAFFFTLAAHTFFFFT', 'FFTTFHFAFFFFATHAAFFFFAHFTFTFTFTLFHLAFAFLTHFHAFLAFF', 'FTHFATLTTFFFTHTHFHFFHAFFTTFFTAFFTFTFFFFTTTHTFFATFT', 'FTFFFFTFFTTLFFFTLAFFHAFATFFFFAFFAAFFTFAHLAFFFAAATF', 'FFTAFTTHFFFAHHFTTTLTTFHFFFFHLFFFTFHFFFLFGFFFFTFHFT', 'FLFFTAFFLFAHFFLFFTFHFFFFLAHFTFATLTFTFFHFPFFFTFTFTA', 'TTHTFAFFFTFFFFFFFFFHHTTFFHATATHFHLFTLTFHFHFTHFFFFA', 'FAFATFFFFAFFFHHFAFFFTLLATHTTTFFLLTTHTFFTTTFHFFHFFT', 'LFFHTFFFFLFTFFHFFLFLAATATLFFFFHFTFHFTFFTLFFFFFFFFF', 'HFTALFFFLTHLATFAHFHLFFAFFFFAFLTFFHTFFTFFFFHAFFFHTF', 'HTFFFFHTHTLLFFFTAFFFAFLHFFHLFFFFTFHAAFFAFLHFATTFHA', 'ALFFTTHFLTAFFTFFHTHATTTFHFFFTTFFFHTLFTTFFHTTAHATFT', 'LFFFFFTFFTFAAFTFFATFTFLFAFAFFFTFLTFTHFFAFHFFATHALT', 'TTLHHHTFTAFTTLFTFAFTLTFAFTFFAFFFTTFALHAHFFFFFTTHFF', 'ALFFTFFFTFFFFFFFFFTFFTFAFFHFTTFFFFTTFFTTFHFFLFHFHF', 'AFFFLTFFFTTFTFFFHHFFFFFTTFFLFFTFFHTFTTFTLFFFFAFTLF', 'HAFTTFHFHFFAFAHFTTFAFATFFFHTFHFFFFTFTHHTFFAFFLLAFF', 'FFHHFHFAHTFFAFATFFHFFFFLFLFTATHLTFAFFTFLFAFLTATHFH', 'FFTTFFFAAFFHAFLFTAFTTHTTFFFFFAFFALFTFFHHFFFHTTFFTF', 'ALFLTTHFFFATFTFFFTHFFFFFTFFFAFFFFAFFFFFFFFFFFHHFTF', 'HHFAFTTFFTTTHHFFAHFHFFFFFTFFFFTFFFHTLTTTFFHTGHFHAF', 'LTHLFHTFFTLFFFHTHFAFHFGAFFTAAHFAFFFLLFFHFHFFAHFLFL', 'TGFFTLAFFAFFLAFATFFFFTFLHTFHLAFAFTTFFLFFHTFLLLFHAF', 'LTTFHHHFTTFFFFLTTTTFAHFAFAFLFFFLFFTFHFFFTTFFFFFFLT', 'TFLFFTFFLFTFFFHLHTATHLATTATFTFLFFAHTHFALTTTTFTFFFL', 'HAFTFFAFFFHHFFFFFFTFLFTLHFTLLTFFHAFTATFHTHLALFFFAF', 'LFFFTAFLTATFFHFHAAFFLAHFFFHTTGAFFATFFTATATLFFAFAFT', 'AFAAFTTTAFFFFFFFAFHFLHTTHTFTFAFFATTFTFLTFLHTFAFAFF', 'TFFFTFLFTAAFFTATLTFTFFAFFAFFHTFFTFALTAFLFFATFLAFFT', 'FLFFLTATHFFFTAFFFFFHFFFLLAFFLAFHFTFLFALTFFAFHFFHHT', 'THFTTFFTAFFTATLFTFHFFALFFAFFTTTAAAAHTATFFHHFFFFFAH', 'LFAHHAAHALTALFFFFFHFTFAAFFALTFTFTTFTATAFTTLATFFATF', 'HFFHHFFFLAHFAFFFAHATTHFTFFATFLFFFFFTAFFHTTLFFTHATF', 'FHAHTFFHFHTGFFHFFTHFHFTLFFTTFAAFFFLHFFFFTGFTFFFFFF', 'FFTTFHHAFTLFPFTAHTLFFFTATFFLTFLFTHFALHTTFATFHFFHTF', 'AGTFTFHFTTFFHLHFFHLFFLFFTHFFTFTTTFTGFTFAFAFFFFTATF', 'FHFFAHFFTAFFFFTAHFFFFTFTFFFAAFFFTHLTTTTFLAFTAHFFLF', 'LHFFFFATFFAHTTLTFFTTFTFFHAFTFFFHFAFTHHFLFAAAFFFFAT', 'TFFTLFFFTHFTFTFFFTFFLFFFFHFFHHALFFTATTFLFFFFFFFFFA', 'TFTATFATTFHFLFFFFTFLTLHHAFFHLAHFHFFFFHLFTTFTFHFATF', 'HFFFFFLAHTFLTFAFFTLFAFTTAAATLAFTAFAFAFGHTFFFHFFHLA', 'FALFTTTFHAAFFFTHTFFLFFFTFFLFFFHAFFATFHFFHFFLFHFFFF', 'FFFFHTFFFFFFFHTFTLTFAFAHATHALHFFAHTFTFTFAFHAFTFFFF', 'TAFAHLTTFFFATLFFHHFFFFTFFTTTFFLFAFFFFFFHAFFFTFFFFT', 'LAHFAHHFFAFHFFAFFFGFFTAFFTTFAAFFAHFFFFFTFFTFFLFFAF', 'FFFHHFFTFFATTFTFHFLHFLFFHLAATFFFHTFFATHFAHFFTFLFFF', 'FFFTTFTFFFFAFAFFHFAFFFFFTFHFLTATFFFAFLAFTTLLLFFFFG'],
-    "50x50_4": ['SFLFFFFLTAFFTFFHFFFFFHHAHFFFFHAFTTFLFHTFFTFTAHFFFT', 'TFFHATALFGFAFAHTFLFAFFTFFHAFFFFFFFHHFHFHTHFFHTFFFF', 'HTAFTHAAHTFFAFFHHFAFFFTGAFFTFLFLFPFALTLFFHLFFFTFFF', 'LFFFFTAAFFFTFATAFAHHHFFFFFFLTFTFFFFTFFATTFFTTAFATT', 'FATLLFFHAFHFTHFATHLHAFFTLFFAHLLTTFFLHFFAHTFTFFFFFT', 'LFTAFFTFHHHHFFHTFALFAFTHLTFFTLTFFHFTFLATLHFTFAAFHF', 'HFTTFFATFFFTFTHFFFLFFTFTLFFTHFFFTFFFFLAAFATAFFFFFF', 'FALLAFFFAFTFTFTFFLTTTTFTHFFFFTFHHFFFFHHHTLAFFHLTFF', 'ALFFFFFTFTALHATFTFFFFFFFTFTAAFHFLFTFHFFFTFLLTAAHAF', 'FFFFTFFFTTFFTFTTFFTAFFFTLTFHFHFHAFTFHLFFFFAFFFFFTF', 'FAAFFFFFAFFAFFFFHFFFLFHHLHFAHFLFTFFTFLFFHTFFHLAFTF', 'THHFLFFFLFFHTFFLAFFATFTHTFTTFLFLLFFFLHFFFATTFLAAFF', 'TAFFFFFFFTHTFFTTFFTTFFFTATFTLFFATHHTFATATTFTAFHHFH', 'FFLAFHLFLFHAATFTFTTTFFTFATFFAAHFAHTFFFFTFFTFTFFTTH', 'HTTFAHFTHFFFATHAFFFTFFFAFFFFAFTFFAFFLAFFHFTFTFHFTT', 'HHFFAFLTFFFFTATAHTTFLFFFFHFHFTHFTFFTFFFLFLFFATTFTF', 'TFFTHFTFFAFFTTFFFFFAHFATHTAFFFATHHFFFTAFFFFATFFAHH', 'TAFFTTTHFTAFFTTAFFFFFHFAFLFHFHFTTFHFATFHGFFFAHFHHF', 'FFAFHLFAFLFFAFTTFFFAHFTFTLFFTAAFFHTFHAFLATAFTLAFLT', 'AFTLFFTHLFFLAHAAATFFTFFFFFAFTHTLTFFTTTAFAHFAAFFLLT', 'TFFFFTFTLHFFAFAFFTFTFHFAFFHFFTLFHAFLHFLFLFFFFTTFTF', 'HTFAFFFFTTFATFLLFFFAAFLFHFTFFTFFFHHTHFFALTFAFFFFLA', 'FHTFAFFTFTFTAFHTHATHFAHAFTLAFFATLTTAFFFLFFFATATHTF', 'AALHFAFFFAFFFFHTTTAFFAFAAFTLFFFLFFFTHAFTTFFTHFLLFL', 'AFTHHLALHFAFHFHHAFFFFTTFFFLFAFTFHTTLAFTFFLFFFTHHFL', 'LHFTFLFFHFTHFFFFLATLHTFFHTALFFHHFFFAFFFLLLTHFFFFHH', 'TTAFTFFFHTFTFAFFHFTTTTFTFFFTAAFFAFFLFFALLAFFFFTHFL', 'FFFTFHFFFHAHFFFLFFFHLFHFLLTLAHHTTFFTTLHLFAFTHFTFLF', 'FTFFHLATFFFFFAFFFFTLTTFFFFFTTFFFFLFTFFFFFTFFFFHTTF', 'ALFFTTFTTFHTFTTHTFFHTHTLFLFTAFFTFFHLAFFHFFATFFFFHF', 'FFFHTAATHFAFATFTFFTAFFATAFFFFFALFFFHATFHTTTLFTFFTF', 'TTFPFLTFTFFFTTTLFTFFTHHTTFTFHFFAFHAFHFLHFFFFTTTFFH', 'FHTFTLFFTLTFFATHFTFFFFHFFFFGAFLFTHFHTFATFFTTAFTTHT', 'FTFFTFFHTFFFFFTFFFTTFFTFTTATTFFAFFFTFFTFFFTTFFFLFF', 'FTFLAHLTFAFFFFTFFLTTFFHTTFAHFFFFFLHFFHLHHFLFATLAFL', 'TFFFATFFTFFFTFFAAFTFTAFFATHTFTFFTFHHFFTAFTAFFTFFTF', 'FFFFFLTFTFFFFATTFFHFLHTFAFHFTFFFFFTFLFHFAAAFHTATFA', 'TLAFAFTHFFAFFFFFHTFLTLFLFFHTFFFTGFFTFTHLTTFHHHFFHA', 'ATFHFLTFFTAFFFFFHGTLFFTTHFFFFLLFFTFFFFFFFFAFTLFFTA', 'FFTAFTFAFFFAFFTATTTLFFFFLAAGAFLAHAFFFTFFFFAFAAFFFT', 'FTFFTTFTFFHFTHHTFLATTFFTFHFFTAFAHTLFLLAFAFFFLLHFFF', 'ATFFTFAHTTALAFFFFFFTFLFLTFTFFATTFTLLTLHHHFFFFAFFHA', 'FFFFFATHHHFAFHGFFTFTHFTLHAAHATFFFAFFFHHFFFFFFFHFFF', 'FALTFFFTAATFFFTFTHFLFTFFTHFHFATFHTFLTFALGHFFFFFTFF', 'FHFGTHTFFLTFATLFATTHFTLFFTHFFAAHFTATTFFHFFFAHLAAAF', 'TFFFFFTTALHFFTFFHHTHAFFFFHFTFATFLTTHTAFHFHFFFFHTTF', 'LALTFFFFATHAHHTHTFHTFFFATFFHFFAALFFAATFFFLFFFHATFF', 'FTFHTFFFTHAFFFTGFATFFAFLTFFTALFTFFHFTTFFFTHLFTLFFA', 'TTTHFFLHFAFFFLLAFFFFFFFFTAFFFHFFFLFHFFFFFFAAFTFHFL', 'LAFFFAFFAFLFATHFALFFHTATFFFFFTTLFFTTFTFFFFAFFFHFAG'],
-    "50x50_5": ['SFFFTHFFFFLHTFFHAHHFFFLAFFFFTFHTHTFFFTTHATHLATALFF', 'HFTTLATFTTTALFTTFTFTHFTFTFHAFFFFATFFFTFAHTTAAFFFFL', 'FLFFFLTLTHAFFFFTFAATFFTFHLFHATFFFTFFTTTTTFHTLATFAF', 'LAFFFFHFTFAFTLTFFFFHFAFFTHFFFGFFATHFALFTFTFAFFTHAF', 'FFLTFFFFFLFTFLLFFALFFFTFFAFFFTHFFAFFTHFFATFTFTFHFF', 'FFFTHTTFFAHTTLAFFTFFFFAFLTFFHTTAATTAFFTTFAFFAHAFAF', 'GFFFAFFFHFAHHTHTFFFTFHTALTTFTATFFFFLAFFFFFTLHFFHFF', 'FHFFTFFAFTFATHFFTFHFFFFFTFFAFFFFAFTLTFFFAFFFALTHFF', 'AHFFFLAFFAFHFFHFTFFFFFLTTHLFFALFTALTATFFFTGFAHAFTT', 'FTFFFTTTFHFTFTHTHTFFHTAFTLFTFLHFAHATFTTTFTTFTFHTFH', 'HFHFFLFHAFFFFFFHTFFFHFFTFTFHFTTTFAHTFLFFTHHFFFAFFF', 'FHLATFHAFTFFFFFFFFFTTFFLTATAALHHAHFTTFFTFFFTFFFFFH', 'FFAHFFTFFAFATAFFHAFFFFFLAAFFFTFATFHAFTLFHTFFTFFLFF', 'FFTFFFFFFATFFFFLTTFFFHHFATFLFTTHTFFTAHAFTTFFAAHFFH', 'ATFFFAFTFFAFFFFLFFFTFLTFFFAHAAFFFFHHFFHTFAAFAFATLH', 'FAFFHLTFTHTFFFLFFFAFLTTHTFHAFFFFFFFFFHFTHFHFFFFLFF', 'HLFFFTFLFFTLAAHATLFTHFFTTFFHFTLALAAFTTAFFAFLGTTHFF', 'TFAFTHFFAHHFFLTFFFALFHFTTFFFTTFFFFFHAFFLATTFTFHAFF', 'LHFLTFFLTTFLTTTFFFFFFFFHAFFFFFFFLAFFHLFFFFLHPFFHFT', 'TTATFTFFTHHTLFFFFFFFFAFAHFLFLFFFAFFFFFFFTFLFFAFHFF', 'AGTFFFHTFTFLFTFLFFTTHFFHFLFFTALATFHATTATFHFFLTHFFF', 'FTFFFLTFHAFTTTTTFFTFTFTHTTLTLFAFAFALTFFFHHFFAFFFFF', 'TFFHHFHAFTFTTTGFTAAHFFTTLFFTFFHFFHHFFLAFFFTFFFHFFF', 'HHHTFFALAHFTTHTLHFLFTLFTAFFFTFFLFLFFTTFHFHFHTLLFHT', 'FFTTFALFFALTFFFFTTFTFFGAFAAFFFLTFFHFFTFFFFAFHAFFLF', 'TFFATFFHFLFFFAFTTFTAFFTAFTFFFTFTTTFFFTFFFFHHLTTFAF', 'LHFTFFTFLTATLFTHFAHLTATFTFTFHHLAFLHFAHFFFTFHFTHFTA', 'HTFFTTFFFTTTAFFLLFGTFFFFTATFFAFFFFFTFAHLHTFFTFAFFT', 'FFTTFFFFTFFLTFFFFFAFAHHFFLHFFFFFLFHFHFTFHFHFFTHHHA', 'THTLAFFHTTTTFFFTFFFAHHHTHFFAFAPFFTFLFTFHFFTTGTFTTH', 'HFAATTLFFLTFFAFTFHFAFFFFTFTFTLFFHHHFATFHHLFFTHAHAF', 'FFFFLFFALFFFFTFFHTFAFFFFTATTHFHAFATAHTLFFTTHHTFFTL', 'FLFLTFTAAFFFFHLTATTAATFLTFFFFLLFFHFAFHLFATATTFATAF', 'FAFAFHAFHFLFFFFAAFTTTHAFAFFLFTTTFFFFFHHLAFTFTLAFFT', 'FTHTFTFTLTTFHFHFLFATFHTHFTLALFALHHFFHFFFAFFFFTTFLF', 'TTHFTTHFHFFHFAFFLFHFTFFTTFTTHFFFFFATTAFFFFFFFFFTHF', 'FFFAFFFFLFAFAFFAFFLTALFTLFFFHFFHTTTFFHFAAALTFHFFFT', 'TFHFTHTTFHFHFAHTTFTAHAFFAFTAAFHAAFFFFTTFFFFFFLLTFT', 'LFHFLLAFTTTAAFLFFTHFFFFTFFHFFFTTFFFFFTLATHTLAFTFAH', 'FTFLFFTATTFAFHFHTTFFAFAFALATFFHFFLFFLTLTHFFFTFAFLH', 'FFFAFFALFFHTAATFFATFFTFFFFTAFFFTHFLLAFFLTFHTATFTFH', 'FHFFFAFALTTFHFLFFFAAFTAFFTTFHFLFFHFFLLFTFFFFFFTTHA', 'FFFFFTFFFLTHLFAFFFHFFFLFFFAFAFFGAAFFFFFALGFTFHTLFA', 'FFFFHHFFFTFTHFFTFTTLTFTLFFFFFTFTFFAFTFFALFLFFAAFFL', 'TLFAFFHLFFTFTFFAFAATFFHLFAAFTFTTFALFFFTAFFTFTFFHFF', 'FTTAFAHHFFFAFFFLLLAFAFFTFFFFHFTFFHHFFHTFFFTFFHATLF', 'TFFFAHTAFHFFHTFAFHFAAFHFFFFAAFHTFTHALTTHTTFFHLFAFA', 'FFHFFFHFFLTTFATFFHATFHAAFTFFLFFAFFLFATAFFTHLLFALFF', 'FHFTFFTTHFTTFFFHFAFFTFFFFHFTHFFFTHALFLLTFFATFTFLFH', 'AFLLFFTHFFFTLAFFHFFFFFTFTFAFFTHTHTALLFHFATFHFATHFG'],
-    "50x50_6": ['STHAFTFTFGHFHHHFHFHFFFFHATHFHTFFFFFAFFHFFHFLTHHFFF', 'FFFALGTFALHFHTLFFTFFFTHFFFFFFAHTTFFFTTFTHFFFLLTTLH', 'FFFAFTFTTFFFATFFFFATFFFTLTTTTFFTFTFLATAAFFLFFTFFFF', 'AHTFHGAFFAFHHAFFHTFTHFFFFFFFAFLFAFAAFFHATFFFFTFATT', 'HFFHTLAFHATHHAFHFFAFFFFATTAFFFATFLFHTLTFTHFFHFFFFH', 'LTFFFHFFAAFAFHHLFHFLFTFFHTFFAHTLHHAFHFLAFAHTTLFFHL', 'FFTFTFFAFLFFHFFFLFFFTHFFFAFLLFTFTAFTFFHAHGFTHHHFFF', 'FTAFFFHFTLFFHFHTTFALFFAFFFTFFFFHAFTFFHFTTFHATFFFFF', 'HHTHAFFHTATTFFLFLLFFFTFHFHFTTFFFFTFTAFFFFFHFFTTFAF', 'TTTFLLFFTFFFFTLFTFFTFHFTFHFHFHFTFAFAFAFAFFHLHAFFAT', 'TAFFLFTLAFLFLATLFTFFLHFTHFFFTTFAFTLFFFTAHAFFAFFFHF', 'LPFAFFTAFLHAFFHFFTTTFFFFFATFFFFLTFFFTHTLHFFATAFTFF', 'LFFTTFTAFFLFFFAFAFLATFFFFFFAFFFHFFTAFFTFFFFTFFFTFF', 'FFTHLLHAFAFTTFTFHAFLTHFFFTFATTHFAFLTATFFFFFFFTHFLF', 'FHTHFAFFFFFATFHFTAHFTHAFFFFTTLFATTHFFATHTHFTFAFHTH', 'FTFFFFFFFFAHAFFFAHFFTFTHLLFFTFTHHFHAFLLFFFHFFTFAHF', 'AFFHTFTFFFFTTFFFFLFFLFFLFLFAFAFFFAAFTTFHFFTLFFATHA', 'FFTFFFLATTTFTFLFFTTFFFFFTTFTAFFFLAFLFLFFFFHTFFHTHF', 'FHHFATFTAFFAFFFFFFHTTTFATLFTFTFAFTFTFFFFTLFFFHFHHL', 'THFLHAFFFFFHFFFFAFLFLFHFATFAFTHFTFFFFTTFHTAFTFTFLF', 'HFFHFAAAFFHTLHHLATHHFTLTFFLFHFFFFLFHFFATATFFTFAFFG', 'AFHAFAHFTTFHFTFHTFTFFTAFFFHTFTAHTFTFFTFLFFHFLFFHFF', 'TGTAAATFFLHFAAFHAHFTGFAFFLTFFFAFFATAFAAHFFTAFALFHF', 'LFATFFHFFFFLFFTALTHFTFFTHFFFHLFFTTTFFFFFFFFFFTTAFH', 'FTFFAAATTLFFLFTFAFTFFFLFFFTFTTFFAHTFFTTFHHTFFTFFTF', 'LTFTAFTFFTFFFTHAFAFFFFFFFTHALFFFHFFLFFTTLFTFAFFTFF', 'FFFLFLLTAFFLLFTAFTFFFHFTAHALFFFHTLFFTAFFFTFLLHFFAA', 'FTAFTATFALFFTFAFFTTFTFLFFTAFFAHFFTFTFFFFFFTTLFFFFF', 'FFLFATHFFFALFTAFHTTFFTFFTLHTTFFFTFFFFFFTALFHFFFFAA', 'FHFTTFLAALFAFTFFLFFFFLATFHFHAHATHHFFFFHFLFFAFFTFFA', 'THFFFFFTHTFFAFFFFATTFFAAFAHFTFLFFFHTFFLFFFFFLTTFFF', 'LFTFLATFFLFHHFFFFTFFHTHTHHFTTTFFTFFHHFHFLAFLAHTTFF', 'ALFHHAFFATFFFAFATFFTLTTFFLFFFFFLFHTTLGTFLTTFTFAATF', 'TFFTFFLFTFATFTFHHFFHTTFAFFFTLFTTTFFTFFAAHFFTHFFHFA', 'TFFHFTFHFFFFATFTHFFHTTFFHTHLHFAATFTLFAFLAFFAAFFFTF', 'FTLLFFTAFTAHFTFAAFTFFTAFLFFFTAFFFTFTHFFHTFFTFFFTFT', 'TFFFHHFAFFLFFTFLTFAFFHLTAFLTPFTFAHFGFHFHFHFTHATHTF', 'ATTFFFTFTTFFFFTAATFFFAATHFLFLATFHFFHTFFTALHHFFTFFA', 'FHFTFHHHLTFFTFAFFHFLLFFFHLAHFFTFFFFFAFFFHFTTFFTGTH', 'LFTFFFHFFFAFHTTFFHTTFFAHATFFFFTFFAFLFFTTAHLTFTTTTF', 'TFAAALLTFHFAFFHFTFLTLFLFFFTTHFLFTLHLFFFAHFTFHFHHTH', 'FTAFFFFFHAFFHAAFFTFLATFFFLFFFTAATTTTTTAFLLFFTHFAFT', 'FATLLAATTFLFAFFLAFFFFFFFFAFTTTHTFTFFHTHFAFFATTAFAT', 'LHTFLAHTATFFALFFLFTATFFLFLALLAFTAFFFTTAFFFTAATFFFH', 'FLFTGFHAAFAFTFLFTTFTTFTFTTHTHLFFLTFFAFTFTAFHFTFAFL', 'TFTFTTAFTFFLFTATTTTFFLHFFTTHTFFTFFFTFFFHLLFLHTTTFT', 'FFFLFFHFLFTFFFLFTAFFFFFTFATFTTFTATFHHTHFAFFFFFFFAF', 'FFTFFTFFTTLTTHFAAFAFHFAFFFHFFFFFFFFTFFHFAHFTFFAFAH', 'TTFFALHTAHFLTLTHFTTHTFLFFLFTHFAFFFFFFFTFFAAFTTFHLF', 'AHTFFAFLAHAFLFFFFTFFHTAHTFHFFFFHAFAHAFFAFLFFFFTHFG'],
-    "50x50_7": ['SFTFHTAFTTTFLFHTFHFFTFFFTTFFTFTFLFFAATAFFFAFFFTAAT', 'FLFFTFFHAFTLFTAFAFHHPFFAHTALLFTTLHTAAAFTFFFTLFATFT', 'FAFFFLAFHFFLTLFAHFHHAHHLAFFTTFLFLTFAFFFFFFFFTHGAFF', 'FFAFLFTTATFFTFFFTFHFHFFALTFAFATFTFFFFAFFFTAFTFFFTF', 'FAFTFFAFFFTLFFFTTALFFFLFTFTTAFFFFHTATFAHFFTFLTFATF', 'HFHTTAATFAFTHTFLTFHFFFLTTTFFFAFLLFFTFFFTHHTFFFAFFL', 'FALFFALFTFAFTTFLHFFFFHFTFTFFLFFAFFHTFTFFFLTHGFLAHF', 'FLFHTFFTHFHFAFFFFLFFTTLFFTTLAFFTLFFLHHFFFHFHFFFTFA', 'LHLFFFHFFFFFAFTATTFFLFFHLHFFTFFFLFATFFLTFHTFFFLTTF', 'HFLAFFTTTTLFAFHFTFTFFFHATLFHFTTFFFFHAAAFFTFAAFFFTA', 'HTFTHFFTFALALHFTFFHLAHFAFLTFTFFFAAAFTFLHTTFFFFTHTA', 'FFFFFTFFFTTFFHFLFFATTFFFAFFFTFFFTAHFAFFTTHFHLFFFHF', 'FFFLFFTFHFFFLHLTTFFTAHAFTTFFHAFHATFFTFFFTTHFFLTTHH', 'HTHTFFLFAFFTTFTHFHATFFTFAFFLFHAHFFHAFFLAHFHFFFFHAF', 'FAFHFTFHFAFFAFFAHFFHFFFFFFFFFFFFFHATFTLHAATAFAFTFL', 'LFFFFFAFHAHAHFTTFTTFFFFFAFFFFFTFFLHFFHFTALFTFFHTLT', 'TFAFHFLFFHFFLTHFTFAFATFHLFTFHTFFTAFFLLTFTFTFFFTFFT', 'FFHFFFTTFFTFFFLFLTFTFHFAHTFFFTFTFFFLFHHTTHHFTHHFFT', 'TLTHLFFFFTHFATFTAATFFTFFLFHHFTFFAATATHAFHFTFHFTFFF', 'FLFATLTTFFFFTTLTTLFTFFAHLTFFFTTFTTTTAFFFAFFAFTTFLL', 'HLTTFHFALFAFHTLFFAFAFFFFTTFHFTTFAFFFFHLLFFTFAFATFT', 'FTFFTFFFLTFAATFTAFTTFFFHHFAFTFLFTLLAHATFFTHTFAHTHF', 'FLLHHFFATTFAFATTFFTHFAHFTFFFTFFTFFATTFLLHHFFTTTFFF', 'TTAAFTHHFFFATHFAAFAFAFFFTFFATFFFTFFFHFHFFAFAFFFFFT', 'FAFFFFFHTFFFFFFFFFTALAFFFFTAFLHTTHATHFAFAATHTHFFAH', 'FTTHFTHFLFLFFHATHHAHFLFHAFLAHFFFFATLTFAFFFTLFHFFTT', 'LALFAFLTTLTFFFFTLLLTFFTFGAFFHFFHFLHHFTTFHFHFFFFHTA', 'FAFHTAAHTAFLFTGFFTFTLFHFTHFHHFHTFAFTFTTATFFFHFAFFA', 'FFTFFFLHHTFATFTFFFFTFAHFFTHFFFLFFTTHFFFTHFLFFLTATT', 'FFFAFATFTFFFHFFHFFFFAFHFATFAFFTFTFTFFFTFFTHFFFFFFH', 'TFTFFLAFFTFTFFTFTTFFTTHAAFTFTTLTAHTFTLFLFFHAHFHFLF', 'TFFFAAAFFFAFFFFFHHFAGTFFLFAFFFFFFHFFTFTFATHFFTFTTF', 'FFLTFFLLATAGFATFFTFFTHHHHFAFFLFAHFTFHGFLFFHFAFLFTH', 'HFFALTFFFLLFAFTAFTFAFHHTTHLFFFFFFAHFFFALHAHFTTFLTF', 'TFLAFTFFFFTFFTTFFFHAFFFTFFFFLAFFFATFAAFFFFFFFTTTHT', 'TLAHFFFAFFTFTAFGLFFHTFFFFFFFFLFLLFFFFATFFHAALFFFTF', 'FTAAHTLAFHAFFLTALFTTFTHFFHFAFFFLFTFTFFAFFFFFTFFFFH', 'LLAFFFLFHFFFTFAFALHLTFHATTFFFAALFLTFFTLTHFTFTFHFFF', 'FFTHFAHFFTFTFAFTTFFFHFAAATFFHTLFFFTTFFAFAFFFFAFAAL', 'FLTFFTFTLTFFFFAFFFFFFHLFFFLFFATTTFFFHTFFFFFFFFATFA', 'FTFFAAFTFAFFFFAAFHFLFHFFTAPFFLFFFTLTLTFAHFTAHTHFFF', 'TLLFFATGTHHFTLHLHFLTFHHFFLFFFFFFFFFFFFTFFAAFFTAFTA', 'HLAFFTFHFAHALTHALFFFATHFAFFFFFAFFGLHFHFFHTAFFHFFFF', 'FTATFFFHTFFFTFFTLFHFTTFAHFTAHHTGFHALFFATFFHTFFTFFA', 'FFFHTFFFFTTAFAFHFAFFTFTHFTTTATFFFAFLHHFTFFLFFFTFTH', 'ATTFFFFTTHFFTTFAFFFFFFAHTTAFFAHLFFAFLFAHFTLFFFFFFA', 'FFFTTFFTTHTTLTAHATFTFTFTAAATHTFHTFHLFTFFHFFFAFFAAH', 'HLFFTFHFFFFFLTTFFFFFHFFAHTFFAFFTTFFFHFTLLFFFFFLFFT', 'FTFTFHFTFFFFFALFLAFLAFFFTHHTTTTFHHFTFTHHFHTTFHFTFF', 'FFTTTTFFFFFTFTHHHFFTFTLTLFFHFHAATFFFTFFTHHFLFAFLLG'],
-    "50x50_8": ['SAAATHFLFLFHLFAFTFLTFFAAALFFFFHFFTFLAHFFTFAAAHFHHT', 'FFFFLHFLAAAFATFFFFFLTTFTAFFTTFTFHLTFFFFTLFTFFFAFTL', 'LFFTTFAFFFHFATAHTFFTFTLFFFFFTTFTFTFFTFTHFAFTTFFHFF', 'FHLFAHAFFTFTLATFTATTFFFTTAHHHTHFHTTFFFFFFFFFFFFLAF', 'FFFTFFAFFAFFGFFFAFHLTAHAFTAFFFTTTFFTTFFTGFFFFLFLHH', 'FFFTFFTFFHFAFTTFFFFHFFFFLTFFHAATTAFHFFFFFLFLFHLFLF', 'LFHAFLTFTTTTTTFFTAATHFTTFTTFFFFFTTHFFFLLAHFHATALFH', 'TAAFHFHATFFFAFFFFFATFFATAFFAFFFFFFFFFHFAFFFFFFTFAF', 'FFAAHFTHFFFAFFFFHLFLTATLFFLTATAFFTHHHFFFHAFFTAFAHT', 'AFFFTFLTFFFFHAFTHFHFTHFFFFFTFHTFTTFATTTFFATFFHFFFF', 'FHATLLHAHTHFFFHTFAFFFFFFTTFTAFTFFFFAFFHTFFHAFAATAT', 'HTFATTFTFHAATFFLFFFTATLHFHHATFAATFLTFFFFFFTATTHFFF', 'TAFAFAFFFFFTLHFLHFTFHFFLFFFLALATHHHTFFTTHLFAFHATFF', 'TTFFFFTTFHFFAFHAFFFAFFFFFALFFHTTTLFFTFHFFTFFTFFFFF', 'FFTLFTFAHTTFFFHHALFFFFATHFHFFFFFFTFTLGHFFFFHLFFFTF', 'ATFAHFTAFHLFTFTTFAFFAAAAFFTLPLAHLFTGATAAFTTAFTTFFF', 'FFAHAFTTFTAHAFAHFFFTHFFFFTFTFFTFAAFHTFLFFTFFFTFTHF', 'FFFTTFTTFFTFHFFTHFFFTTFFFTATLTFFFHTTAATLALFFFFFLHF', 'FAFHFAFHTFHATFFHFTFFFFHFHAFFFFFFFFFLFHAFFAFTFFFFLF', 'FFHFFAFATTFTATTTFFFFLFFFFTFFAFFTATFFTFFFFFTLFHHFFH', 'FFTAALALTFFFAFTFTTTFHFFFTFFHTFTFFALLFFFTTFFFLALHFT', 'THLHFLFFFFFLFTFFATHAFHTFHFFFFFFTAFTTLFFFLTFHHLTTFL', 'LAFFTFFFFTFHFTFFTTFFHAFFFFAFTFTTFFHTFTTFFTFFFFTFTT', 'TFLHAHTFATFHTATAFFTTFTLTLTFFFATFFLTTTFLAALFFTAFFTT', 'FFAHFTFFFFHTHFFFFTTTTLALFFAHFFHFTFFAAHAFFFTAFFATHL', 'AFFFAFFFFFFLFFFHFFATHFFFFFHHFAAATFFHFFFTFHTLTFFFLF', 'FFFATLFALTLAFFFFAFAFHALFAFFHATAHFHFFHFHFAFFFFTLHTT', 'TFHHFFHLFFFFFHFFHTGFFFTLLFTTATAFFLFAFFAHHLFTFFFFFF', 'FFAAGATTFFFFFFFFHLFHFFTFLHTAFFFFFLTFFHATTAFTATFFFF', 'FTFAFFATFLTTHAFFFTTTFTHFFFFFFLFFFFFHTHFTFGHHFFLTAH', 'FFHAFFTAHFFALHAHLTFLTHFTFTFALLFATTHHFFFFTFFTALFFHT', 'TTHFFHFFFFAGTFALFFTLLFAFFTTFFHFLTTLFGHTLFFFFATFHFH', 'FFFHFTFAFFALFHALTFFTFFFLAFFHTFFLFTTHHAFTFAFHLTFLFL', 'TATTFFALFLFLFFFFTFTLLTHTFFHHFTTFAFTHHFFLFLHAFFTTHT', 'FLFFLFFLAFLATFFFTFFLLFFFFLATATTLLFFAFFTTHFFTFTHFLH', 'FFHFTFHHFFAFFFFTLATLLFFFAFHFTFFTTTTLFHAFTTHFFTFFHT', 'FTHTTFFFFFLFFHTTTFFFFHFFFTTTFHFFFFFFFFFHFFFHTFFFFA', 'FTTFFFFFHAFFTHFFTFFFFFTHTAFFFFAHFFFTTFLATTFHTHFFFF', 'FFAHFFFAFLFLFFFTAFFTFTHTAATFHAFAFTAFFFTHFFFFFFHHGF', 'LFTAHFFFFFTFFFTFFFFTFFHTFAHTFTFTFFFALFHHFFFFFATFAF', 'FTFHAFTTLFFFTFHTFTAFHFLTFTTAFTFHFFTFLTAFFFFHHAFFAF', 'HTFTHFAFTFAFFTTFTLFFLFFHFFAHTFFLFTFFTTFFFLHFATFAFT', 'LHHFTHFTFLTFFAFFAFTTAHFLFAFLTFFFFTLLHHATFFTFHFFFTL', 'TLFFTFHLFFFTFTTFAFFFFTTFFTFLFFTFAHAFFFTFAFFHAFFTTL', 'FHTFFFGFHHFFFTLFAFFTFFFFATFFFTLLFHAFATFHHFTFTFAATF', 'TAHFLFAFTFFFHHHFTLHFTFLFHTFHFAAAHFTAFTFFTFTFAHFFFH', 'HFFLHALTFHFFTFHPHFFTFAHTTFFLFHTTAHTHFAAAFALATAFFFA', 'HHFATHFFAFFTFATLFFAHFAFFFHHTHLTFLLALTFFTTLFFLFLTLH', 'AFFLFHTTHAFLTLFAFTFFAFHFFFTTFHFFFFHTFTFFFFAFFFTFFL', 'FLAATFTHFFHTTFFLAFTFTFHTFHLFLFFFTFLFFTFFLAAFFFFAFG'],
-    "50x50_9": ['SFHFTHTFFHLHFFFFTHTHTFTAHFFTFTAFTTAFHFFLFLFFHFATFH', 'LLFHLHTFFFFHHFAFTTFFFHFHFFHAFFFTFLFFAFFAFTFHHFFALL', 'TFFAGFFFLFFALTFFTAFHLHTAFLFTLFFFFTFLHFAAAHFTHFFFFF', 'FFFTFFFFTFAATAFFTLFHFTFTFFAFAFFAHFATHFHLLAGFFFAAFF', 'FHFLAFTFFFFFFFFFTFFFATTHTAAAFFTTHTFAFTFTHAFFHFFFFA', 'TFFHTLFFFFFHFFLFHTTTFFFLFFFFFHLTLFHFTLLPTFTHFHFTTF', 'AFFFFFFTFTFFATFATFFFTAAFHTTFFFFFFTALFTFFFHTFFFFTLF', 'LAALFHFHAFTFLAFFLFTFFFFFFHTFLTTLFFFLFFAFFFTFHFALAF', 'HFFFFHTFFAHFFALFAFFFFTTFFAFFFFHFGLFATTLFFTFFLATFHF', 'FFAFFFTAFFFFFLFFTTFTFTFFALAFTFFAFFFFTGTAFLTHFFLAAF', 'FFTFFTFLFFFLTFHFTFLFTFHFTFFFTFFFFFHLLATHFFTTFHFFAF', 'FLFALHFFLFFAFATFHHHHFLFFAFTTFAHATFTAFFFFTFTAHTTLAF', 'FTTFFFFFAFHLAHTAFFHTFAAAHLFAFAFFFAFFTFFFTFFFFHHTTF', 'AFHTAHFTTFFTFFTFTFFFFFFTHFFFTHTTAAFFTALTAFFTTFTTFL', 'FTFFFTHFLATFFATTTFAFTHHFFFAAHLFFHHATHTFFTTFFTFFFLF', 'TFAHTFTFTTHTFHFFHFFFHLHTLLHALTATTFLTTFHFFFTFHTFLHT', 'FFAAHFTFFFFFTFFFHTATFHFTTTFFAAFFTTALFTAFLFFFHAAFTF', 'LFAHFTFLFFFFFFTTFAFFTFHFFFFFTTFTFAFTTFTFLHFLFFFHAF', 'LALFFFFTHFTATATTLFLFFFAFFFFTTTFFALLFTFFAFLFFTFFLFF', 'TTFFTFTFLAFFFFTAFTFTHFFAFFFFFTFTAAHLLTTAAFTAHFFTFF', 'TFHHFTFHATHTTFFTTFFTHAHHATFLFLTFTHFFATFFFLHFTTHHFF', 'LFFTAFAFFFTFTFAAFFATFAFLATLALLTTLHTTFFFTFHFAFATFTH', 'FTHFFFFTTLATHFHLFTFFFTAFFFTLFTTFATFFFTAHFALFFTFFFH', 'FFLFALHFFLHTTFAFFTLLFLTFTHFLFFLHFFFFFAHFFFFFHTFFFF', 'FTTFHAFTFATTHHTFFTFLHFAAFTAFTFTFLFFFHFFFFLFFFFAFAL', 'TTFTFFAFFTFFFTHTLFHAFFAFFFFLHLTFFFTFFHFFLTAFAFTFTF', 'HHFHFLFFFFFFTFAFHFFTFFFTHFFTHHFFFFFFATTFAFFFFHFFAH', 'TAAFFHTGFFHTHAFFFFFFAAAFTLFFHFAFTAATFTFFAFFFFHTFTF', 'AFAFFTHFHHTFFHFAAATLFHLHFAFFHHFTTTFFTLTFTHTHFFATHA', 'FFFHFFFFAFAFFFFFTHALFFFTFTFFGFHFTAFTFAFLFTFHFTFFTL', 'FLTLFFGLALFHHFLTFFFFFHTFFFFFFFTFTLFFHTFFLFTTFTFTFF', 'TFTHFFAFTFTFHTTAFLAFHFFHAFTFFTHFTFTFFTTGFFFHFFHTFA', 'FFLTFLFFFAFAFAAALHFHFFTTFAFTTATHAAFFTFTFFTHFLFFLTF', 'TTFFFFFTAAAFFFFFAHFFFHFFHFFTTTFFATHFFFFFFFFAFHHFFF', 'FHTTAFATFTFFFFATAFLLAFAFAFFFAFHGTHFHFTFFHHTHFTTHTT', 'FFTHFFFFFFFTTLAHFAFFFLFTAAHLFHFLATFLAAHAAFTFAGFAFL', 'HTFLAFFLFLTLFFLFTTAHAFTFFTATFHFLFHTFFFFHTLFFHFFFFL', 'ATHFFHFFTTLFAHHAFFFTFAFFATLLAFAFLFAHHFFTTHFFTLFAHA', 'FFFFFFTFTTAATFHFFPHLFTATTLHFTFHTFHTFFFFFAHFFFTFFLF', 'FFFTFTATHFFFFLFHFLLTLHTFATHTFFATHTHHTFTFFFFFFFFHTF', 'HLTHFAFLFFLTAAALFFFFTFFFTTTFHTLFTHHFHFATFTLATATFFF', 'FTFFAAFAFHLLFFTTTFFATTFAFFTLATHFFFTHHFFTTFFFFFFTLF', 'AATATFFFFHTATFFFFTFFFLLTHFAATTFAFFFLFTFFTLAFHTFFFF', 'FFTHFFFTAHLFFFTFFATFFFFAFFHHFFFFAFFFFFTFFTFFHFFHLF', 'LHTHFLHFTTTAFFFFFHTFFHFFFFFFFFFFFFTFATFFFFLAFFFFAF', 'FHHTFTFFTFHFHTTTFFFFHTFFFFTFTTHFLATFFHTTHAFFFAFFTA', 'FFAFHALTFFFTLFFATTHAHTFHFHFHHTTFFTLLTTFHFTHHFFFATT', 'FLFFFHFAGFHLFFTFATFTFFFFHFTFTFFTTTFFTLHFHHFFTFTATL', 'AFATTALLFFTFHAFTFFFHFAFTTATFTFTLFHFTTFAHLFFFFFFTFF', 'FHTFFTFFFHFFLFFAHLFATHFTFFAFHAALLFTLFFAFAFFFFFFTLG'],
-    "50x50_10": ['SFFTFFFFTLTTTTFFFHFATTFTAFGFAFATFFTGHTFTTFHHFFTHHF', 'FAHFHFTTAFFFFHFAFFHATFHATFFFHAFATFHFAFFTTATTFTTFFF', 'AFFFTTFTHFFATFFHFHTHTFFFFFFTFFFFFFFHFLLLFFFFFAFFLA', 'FTFFLLTFFHFTTFLLHFLFTAHFHFTAAHAFTFFAFFFFHFFAFFFTFA', 'HFTATTFFTTAHLFTFHFTFTFHFALTFFFLAFFAAFAFTAFLFHHLFFF', 'LFTAFFFTLATFFTAFFFFFLFFFFFFTLFFLFTTTFHFAFLFAFTTAAH', 'TTLFTTTTTFFALFATFFFHFHFAFFFAFFHFHAAFLFFFFFLAFFFAFH', 'FHAFAFTAFLFTHFFFFLLTFFFAFTFFFTTFFFFAALFLFFFLFAFTTF', 'FLFFLHTFFFFFHFAFTFHFFFAFFFFTFFFAFFHAFHHFFTFLFFFFFF', 'FFTHTHTFFTHTTLFFTAFHFTFFFFFHFLAFFHFAFFATFFTFFFALTF', 'FFHFLTHAFTTFFTLFTFFFFATFTHAFFHFTFHFTFFLFFFLTFFFLAF', 'HGAFFAAFATAATFFLTHLATLFFAFHFFLFAAFFFHTFHFHTFFAFFAF', 'AFAFTTFTLLLHTAFAFTAFFAFFFATFFFTFFTTFFFTLFFTAFFTFTF', 'TFTFFTFAFHFLLFFFLTFFTHFTTTATFAFFFHTATTTFFFFHFFHHTH', 'FTLFTFLFFLFFTFAFHFFTFFFFAATAFFAFTFAHALFLFTFFFTTTFT', 'FFTFTFLHAFATFTFFFTFFTFTLFFTTFFHFFTTFHFFTFHAHTTHHAF', 'FTFHLTHAAFAFTLATLTFAAAFAFFFFTTFFFFFFTFAAAFFTFFAHFF', 'FATFAHATALTFFFFTFHHFFFFHLFAHFTLFFTFFFFFATTTFHFFFHT', 'TTHHATFFTFAATFTTFTFFATFLHAFFHTAFTFFFAALFFFTHFLAFFF', 'TATFTHHFLFHFFFFAFLAATFTLFTFFFFTTTTHAHAFTATFTFHFTFF', 'LFFFHTFTFTHTFTAAAHFLFTTFFTAFFFFAFLFFLTFFFFAALFTFFF', 'TFAFHFLTFTFFTFFTTLFFHFFFFHTLFLAAAHFFFFHFFFALFFAFHF', 'FFHAFAAHTTATFTHFAAFFFFFFHFFFFFATHHFFHFHFHTTHHFFATA', 'FGFFFFFFFLHFLTTLFAFFFFHFHHHFHHTFLFFFFAFTFAFTHLTTFF', 'TFTFHFFHFATFAFFTTFFFFFFLHFFFHLLFFFFLFHTFFAFFATFFFF', 'FHHFFATATFTFTHLHFFFFLLTHHTFFHTAFTFAATTFFFLFTHFTHTT', 'FTFAFTLTHTAFAFFHAFHFHFHFFFTGHFTLFFLFAAAHFFTLFTFFTT', 'FAHFFFAFAATTFTFFTLHAFLLTHFFFFHFFFHFFALLFATFAFFFTAF', 'FFAAFLTFFHFTLFFFFHTTFAFFFHTAFTFTFTFFTTFFLTAAFTTFAF', 'FHHTTATFFFFFTTHLFHFFFFFLFFTFFTLTLHFHHTLFHFATHFTFLA', 'TFFFTHFAHFFAFFTFFFFLFHTFFTTFFFAFLFHFFFFFTFFFFFGTFF', 'FHFATFFHTFFLFATLHFLTLTAAAATHFAFTFFAFFTLTGFAFTFTALT', 'HAFTFFFFAAPHFFFHLFHLTFFTHLFFFHHFFHTHTLGFFALALTTFAF', 'FTFALTTFHTFFFATFFTTFFFFLHFAFHLTFFLLHFTFAFFFFFFTFFF', 'AGFFAFTFLTFHAFFLTFATFATFFAFFFTFATFFTFAFFTHTFLFTFAF', 'FTLLLFTHFHHFFHFFHFFAFFHHFFLFFTHALFFFFHFTAFAFFFFTFF', 'HFHGTLLFTFHTLFHAFTFTHLFFFFAAFFFHFFFFFTLFAFFFTFAHTF', 'ATFFFFAHTFLFFAFTTHFFTFTFFTTTTAHFFFFFFLTFTFFLHHAFFL', 'FHLHTTTHFAFFFTHFFTFLFTFFAFHAFFFFFFFFTFTFHHTFAFAFFT', 'TAFLTLFFFTHFFFLFTFFHFFFHFHFFHLFTFFTTFHFFALTLFHTFFF', 'FAATTFHLTAAFFTFFFFFFLTFTFFFHLTHFFHFFFFFTHFFFHFTLFA', 'FTTTFHHHFHFALTTTLTFATFHFTALHFTTTFFHFFHHTTTFFLFHFFH', 'FFFTTTFTTFFFFTFFLHFHFFHFFFAFFATATFFFFFFTFFTLFAFFFH', 'AFFTHFLFFFFFLHFFAFTHFFTAAFLAPTHAGHLHTFHTFTTFFLFLFF', 'TFAFHLFATTFFFTFHFFFFTHTTHTAFFFALTFTFLFFTFFAAFHLATL', 'TFAFFFTFTFFTFFFTTFFFAFAFFTFFFFFATTTFHFATFFFFLTHTFT', 'FFTAFTFFFHTHFFTTLTFTFFFTTLFLFAFFFFAFTLFFFFFATLATHL', 'AFAFHFTFFAFTFHTFFTFLHTFALFFFFLFLLTFALFLFFTTTHFFFFH', 'HFHHFFHTFHHTFFFHHFHTHTTLAFTAFFLFFTAFLFTTALHTFHFHFT', 'FFALTTHFFHFTFAFFHAATTHFTAFHFTFFFFFLFAFFATFTLFFLFFG'],
-    "200x200_1": ['SFFFFLFFFFLHATTFFFAFTFAAFFHHHTTTFFFFFFLFLFFFATHAFAALTFFTTFHTFTFTHLTLFFFTHTHFAFFTFFTFFATATFTFFFFFHFHHFFLTHTTHFFFTFFTAHFFFHFFFHFFATLFTFLFFFAAAFFFHFFFFFFFAALHAFAFFFTHFFATFTFFHTFFHFFFTFFHFAFTTAHFHFFFFTFFF', 'AFAFTFHLLFFFFAFFFFFFAFFFHTTFFFHFATAHHFHTHLFATTAFAFFTHFFFHFAFFFTTATFLHFHFAFFAAFAFFFHHTLTFFFFFFFFAFHFAHAFFFFAFLFAFFATTFTLFAHFFFALTHHAFATHFFFTFAFFTFAFAFAAFFFTFHTFTAHLFHFFLFFFTFFFAALHHFAFTTFFLFAHHAFTFFTTF', 'FATFFFFLFTHFFLFTFFTFFFFTFFFTAHFFHFTTLFFFTAHAHFFTTFFHTLFHTLFATTFFFLTAATHLTFTHFLFFFFFTAHATHHHTFHFLTHTFAFLFLFFFHTHFLTFFAFFTFHLFHTTATLFHTAFFFHATLAFATFFFHAFFHHTFFLTAHFHTFTAFFFFAAFFFFHAFFHFFFLFFFFFFLFFFFAFF', 'HFFTHFFFFTTTFALFFHFTFFFAAAFFTAAFAAAFAFFTAFFHLFFTFALFATTTFLTFHLFFATFHFFAHHTFFLFTHFFHTTFFHTFFFHLAFFHFFLFFFLHTFALFTHTTAFTFAFFHHTFFFFFHFTFHFAHTFTFHTFTTFTFAFTFFHFTFFAFHFLFHFTAAFFALFFFFFFFHAAFAFFAFHFFLTLFTH', 'TTTHAHAFTALLFTATATTFFFFFHFLFTHLHAFTFTLFTLTFTTTLFFLALFFHAHLFTHFLATTAFFAFHTFTTFHTTFFFFFFFFFFFFTATFAATFFLAHFFLTFFAFTFHHFFTFHLFFLLFTAHATFLAAFFFFFFFHATFAFFAFTFFFTLFFFFFFFLFLFAFFFTFFFFFFLHFLHFFFTLTLTFFTFFFF', 'FHFTATTHTAFFFTHFFTHFTLFHFHHFFFFTFFFFAAAAHTHTFTFFFFTFTHATFTAAFFLFATHLTHTALTFFAAFFTFLATFFFTAFFFFFTTFAFFFFLFAFFTLLFTFLTFTFFFFTTHFFHHTTHHAFFFLFTFFFALFAHFFFTTHFAAFFFFFLFTALTFFAFFHFHTFFLTFHFFAFFFLFHFHHHATFT', 'FFFFFHHFLHATFFFTFFTTFTTFFHFFFFAFFFFLFFFFTFFAFFFLATFFHFFFAHFLHTAFTFHFTFTFAHFHTFHALFLTLAHFTLATTFFFFFFLTHFTAFFFAFFFFFHTTFTFLFTLATFFFFFTFFFFTFFHHFFFHAHTFFAFFTHFTFFFTTLLTTLHAATFFFFHFFFAFHFFFTAFFTLTAFLTHTFF', 'FHFHFHFFTFLFTHFTTHFFTALFFAFLTFATHHFFFAFLFFHTTTFFAFAFHFLFHFTFFFTTFAHAFFFHFHAFTFFFFFFFFAHTAFFTFTTAFFFFTFFAFFTFHFFFFFFHTAFFFTFHHFFFFFFTTFAFTFFHTFFFFHHFAFTAAFFFLTFTHAFAHFFFAFFFHAHHHFTATFFFHFFFTFAHLFHFTFFF', 'HTFLFFATFTFAFAAAHHHLTFTAFFFFHLTFTTLFFFFFAATFTFFFLALAFAFATFTFFAFTFFAFFFTHFFLTFFFAFALFTFFTAFHFFFFFTFFHFFFAFFFFLLTTFFFFFFFTTFFHFFFHATFFFHHTAFTTFHFFFHFFFHFTFTAATTTFTFFHFFFFFFFFHFHHFALLHFLFTLFFAHHTFFALHAFF', 'FHTFHLFFFFFFFLFHFHAAAFFFFFFLTTFFTFFTLFTFTTHFHFFAFAATFFFFFAFFTFFAFTTFFFTTFFLATFTTLFFFFLTFFFATFHHTFFFFFFTTHAATFFLHHAFFFAFFTTFFFFAALFFTTFHTFAFFTFFAFFFTAFFLLHFLFFFFFFAFFTTAFFFLATATFFLTFFTFFFHALFFHFTAHFAFF', 'FFHFFFHFFALFLLFFFATTHATFFFTFAFFTTLFFFTFLFLFTHTFTFTFFFLFATAHLFTFFAFLFTTFLATFHFFFFFAHTFLTTFFFLHHTHAAAAFAFFATFTLFFLAFAFHLTFTHHFFFTAATTFFFFAFTFFFHAFFHTHFFFFTFFFFFFLHTLFFFTFFHFFFFFFFTFTFTFFFHHAFHTHTFTTTLFH', 'TFHTTATHFFAFFFFLFTLFHLFFLFTFAAFTFFFLTFFFTLHFFAHFHLHFFFFTFFFALLAHATFLLALFFFHFTFFFTFFHTFFFATAFTAFFFHAFLFFFFFFTFHFHFTFFALTHFFATHTAFLTFFHFFFHFHTTHTTHLLFAFHTFHLFAFAFFFAFTFLAFAFTHAFTFFFTTFTFFFAHFFHTFTFFFFTA', 'AAATTHLHLFFFHFTHFAHAAFHFLFTLLTATFFFTLFFLAATAHALLHFHLFHFLFFTTFTFTFHTFFAFFALTHFFLFFFFTAFFFFFHHFFHHTFTFFFFFHFLFTFTFFTHTFLAATHTFFFFTFLFAFHFFTHFTATFTFTFTFFTFFFFFFFFFTLAFFATHFFFTTTLLHHHHFAFFHLFFTFFFLAFFTFAF', 'HTLFFFTTHLFLAFHFFFLFFFFFFTFTLHFHFFHLTFFTLAHFFATTALLHFFTTFFFFFTFFFFLFFTFFTHFALFFFFTLLTLHLHAFFFFFAFTAFFHAFFTHAFFFFLFFFFAHFFFFLLFTFFALFAHFFFFFLFAFHFTTFFFFFTFFFFFLFFLTFFTHLFTTAFLAAHTFFFAALFLTHFAFFTFFFFTFH', 'FHHTFFFFTFFTFTFFFAATTAFFFTTFTFFFFATFTFTLHAAFFTAFAFAHHFAFFAFLFTHLFFTFFTTTFHAFTFHFFFFFFALFFTTFFTHTLAFTFFLFTFFHFFATFLFTFFHTHTTFFLHATAFFLAFHFFAFFTHFFFTHFFTTLFFHFFTFFHTTFTFHHTTTLFFTFFFHFFHFFHFHFFHAHHHFHTTF', 'FTAFFFFTFTHFFTFFFHLFTFFTFTALTFFFTFFFFFFFATFAFATTFTFFFFFFLHTLFFAFFHTFFFHFATFAFFHFTAFTTLTFLFTFTFAHHFFTTFFAHHHHTHTLTFFFFLFFFHTLHALFAFTTHFHFAFTTHAFFLTALLFFFFFFFTAFFFAFFFTLFFLATAFFFLFFFFFFHTFHTHFTFAFFHFFFF', 'FHFAFFAFFHTFAFTTATHTAFTTTFALTFFTLFTHLFHTHHTFFTFFHFTFHAAFFFTFFTTFFHAHFATFTTFHFALTTHTFTAAFFLHFFFFATLHAFFHFFHHFLHFFFTHFTFFFFTAFFTFFFLLFFFFFTFLHFHTFTLAFFFAHFAFFFAFFFTHFTFFFFAFFFTHTFFHLHFFTFAFAFHFFFALTFFFH', 'FFAFFTFFAFFFTFLHTFAFAFAFFHAAFFFFTLFTALFFLALFTFFHFTHTLHFFFFFHFTFFHHFFTFAHFFFFTFFHFHFLFHHHFHTTFFFFHFFFFLFFFTFTAFHFFTAFTFFLTFAHFTFLTFFFFFFFTFFFFALFFFHFLFFTFFFAHFFFFLHFTFHTHTFFTTAFFTAFTFTFFFTFLLFFFFAFTFFT', 'FLTFFFHFTTFFFFATHFFFTTFAHLFAFLLAATTHHAFTFHFFFFHLAHFTTFFTAFAFFFFHFFHFHFFLFFATFFFTAFTAFFFLTFFAFFFFLFFAHFTTFHFFTFFFAHFTTHFFHFFFTAFFTFTAFHLAFFFFTLFAFATFFTFHLAHFHATFFTLFTHTFHAFFFFTFFTFTFHFFFAAHAFTFFFFHTFFF', 'FHAFFTFTTTHFFLAFLTFFAFFLFFFFHAATFFHFHAHFFFFFFFTLFHFFAAAHHFHFFHLHFFTFHFTLFALFAFLFFLFFFAAAFFFAFHFAFFHTTTTHFHTHLALFAFTFFHFFFHTAAFFFHAFHHHFFFFFLFFTFHAFFFFFHALFHFFFTFFTFFFFFTTHTATFTFLLAHHAFFLTFLFTHFFAFFFFF', 'FFFLFFFATHTTFTFTLFFLLFHFFFLFLFLHFHFLFFTHLFFFFFAAHLTFLFAFFFTFFFFFHFFFFAHAFFFFAFLHFHFFTFFFFTTFFHFLLFTFAHFFFAFHTAFTFAFHFFTFATFHLFATTTFAFFFAALHFFAFFFHLTAAHTFFFTLFFTFHFFHHLFFFTFFTFFFAFFLFTFFHFFFFAHFFFLFHFF', 'FFTHFFFHFAFTFFFHHAFFFHTFTAAHHLFHTHFHFATFFAAFHTHLFFFAHLAAAFFLHHFHTFAFFAFFTFFTATLTTLFFFALAFTTFFFFFFAAFLFTAFFTFLAFFTFFHFHHFFAFAAAFFFFTFFFLAFHFFFFFFTTFFFTFTHLAHFAFTTFFFLHTFFFHTFLTAFFHFFLAFLFHLTFFHFLFFFFFF', 'TFLTHTHTFTAFFFTHTFHTFFFTFHFFTFFFFFFHTTTFHFAFHLFAFAFFFATAFFFATTTTHATFFLTFHFFTFHLFTFHFFFFFFFTHFHTFHTFTLFFTLHFHTFHFTFLHLTTAHFFFTTFTLFTTFFAHFAFTHTLAFTLFHFHFHFHFHFFHTFFFTFFLFTAFTFATATLHFFFFFFTFLATFTAFAFTFF', 'FFFTLTFFAFFAFFAFFTLLHAHHFAFAFLFLTHHFHFFFTAFLHFTFHHAFLHATHFHFTTHTHFTFFFHFHLHFFTFFFATFFHTTFFFFFFTHTFFFTAHAAFHTFFTTFFHTFFFFLFLFFTHFFTHTFFFTTATFFTFLHFFTFFHTFFTLHFAFHTALFFALFFAFFFHTFTFHAAHFFFLFHHFAFHTHFFAH', 'ALAFAFFFFFFAFFHATFFFAFTFHHFAALATTLFFHHTFFTTTFLFHFAAHFTTFHFTFFTAFFFFATATHFFFAATFFTFTHFAFLFFFFAHTAHFAFHFTFAFTFFFFAFFALHFFFLHHFLFFTFTAFFFFAFFFFFATFFFFFFFTFTAHTTFHFFFFLFFAFFTFFHFAFHHFTHHFFHFATHFAFFFFTHFAF', 'FTFFFFAFFFFAHFFTFFTAFFHFLFFFFHFFALFFFTFFFLFFFTTFFFFHLFFFTTFFHFATFFFFFLFTLFAFLFFAAFTTATFFFFHFFFFFHTTFTTHALHTFHFFTLHATFTLTFFTFTFFFFFFFFFHFFFFTHAFTFFFTFALFFFAFAFHFTFFFAALLFFLTHTFFLHLFAAFFLTHFHAFTFTLAHFFL', 'FFFFFTFFFFFFHFHTTAFHFTFLFFTHHFFFFALFAFFFFTAFTTHFLHFFLLFFTFTTFFFFFAAHFFFLTTFFFFTFTFHFFFTFAFAHFFTFFLAFHFAFTHFFTHFFFLFFFTHTTAFFAFFTFAFAAHFTAFFFTAFHFHFFTTLFFLFLFFHTFHLAFFFAFHALFTFFFFFFFHFTTFFATLFFAFAHFFLA', 'FAFFTTAFFTFATFFFLLHFFFFATAATLFFTFTHTTFTTTLHTTFFTFHFFFTFFFTTHFHFTTAHFAFFFHTALFFFHFTHAFFAAHTTFFFHFHFLFFFFFFTHLHFFAFLFTTTFTAFALATHHFFFAHFHTTAHATFHFFFAAFFHFFAAFFFFTFFFFTHFTFFTFAAHFTAFAFHFTFFAFLLFHTHFLAFHT', 'FFFFHFFFLLFAFAHAHFFTATLFFFFFFFFALFTFFFAFFFFTHAFFFHHTAFFFFFAFTFLAFTHFHAFHTFFFFFHLFFTHHFLTFFLFFLHFAFTTAFFFHAFFTHFHFFFFFTTFFFLHFHAFAFLFTTAFFFLFLTFAFFFAFTFFFTFHFLHFFFATTTFFFHFHFFHFLFTFFFHTFFFLHHFFTFTTTTFF', 'FFFFFLATAFFTFFLTFLATLFHAHFTTTHHFFFAFTFFTAFAFFTAHFTLLTFFFFFTAFLLFLTFFFFHFTTAFLFFFFHFFFHFFHTFFHFFLFFTLFHFFFFTFLAFAFFFLFHFFAHTFTATFFHTFFFHAFLFFFFFFFFTFFFFAHTFTLHFFFHFTAFTFFLHFHFFFFFAAFTLFFFFFHLAFFFHHHLAA', 'FFTHHFFTFAFFAFHFFFFFFFTAFLFHLAFTFAATHAFHFFAFTFTFTFFAFFFFFAFFFHFLHFFFFFFHHTFFFATFFFAHTFTAFAATTFFFLATFFFFHFFHTFTFHFHFFFFTHFFFTTFLFTFTHFFTFFLTATTTTLFFFFFFTFAFFFFFAHHFFFFLFFFAAFFTFFFFFFFFTTFFTHFFFFFTFFTAF', 'TFTATHFFFFFTFFLFFFFHFFHLHTAHFLTATTAHFAFLHFAHAFALLFFHTHFFTTAFAFFFFFFATTTFHLFTFHTFLFFFFAFFFFFAFHFTHAAFFLFLFHATFFFTAFFTTTHHHFFTAFFFLHFFTFTFFFFAHFFLFAHLFAFFFFTFTTTATFFFLHHFFFFHTTFFFAFTHFLAFATTTLTFAFAFFTAA', 'HFFFFFHTFLFFAFTTAFLFFFAHATFTHTFTFFAFFTHTLFHTHFFAHAAHFATTAFLTTTTFAHTFFTFFLFFFTFFFTTTFHFFFFLFFHFLLAFAFHTFFTATHFFFFAFATHHFFFTFAFFFFFTFFAAFFFAFTFFHFFFFFTFTHFATAFFAAFFFAAFFHTFTFFFHFFFHFFFFFFTFLFFFFTFFFFFFF', 'LFTFFTFLFFFTTHTFFFFFFTAFTHTTFFTFFLFLFFATALFLAHAFTFFHFFFAHATFFFFAFFFHLAFTFFFTFFHFAFFFTHAAFFTLAAFALHATTHFTAHAFFATFLHFFTFAFHATTFFATHAFFFTTFFAFFHAFHFHFFFFTAFAFHFFLHTFAFFFFFFAAATHFFLFAFFFFLTFHFFLTFLHLFAFHA', 'LFFFFTFFFTTFFHFTFTTAAFHHTFFTFFATFHTHFFFFAHFTFAFTTFFLTFFFTLHFFFHFALHFFTFTHFFFAHHHAATAFAAFHHFAFFFTFAFFTFTFFFAFTATFLHFAFFTFTFTHTFLHHHTFHFATHHFFFHAHLFLFFFLFFLFFFFLFFHHFTFTAFFAFTHFLHLFTTFHLFAFFATFHLFAFTFHT', 'HTFATHFFTLHTTAHFHFFHAATFTTHTFLFHHTTFFFFTLFFHTLAHFAFFFFFFFFFFFLFFLHTTFHFTALAFAFFFFFAFFFLFAAHFFTTLTAFFHHFFLLHTFFTFFFFAFHFFFTTLTAHTLFFFFFFFFFAFAHFTFFFFTALFTLTTTAFAFFFTFFTTAFLLFFAFFFFFLFFFLAFAFFFALLFHHAFF', 'FFFFTFHHFFTFFFFLAFFTFFLFFHHFFFTFFFFHFFATLATAHTFLTLFLTFFFFATFTFTLFFFFAFTFFATFAHAHFTFFFTFTAAFFFLFALLTAFFFALFAAAHFHHTTTFHFTFHTTTTFFFTLFFFATFFLFHTAFFFFFAFFFTHFHFLAFAHTLTTHALHFAFTTFTFAFTHAFHHLTFFFFTAAFHFFT', 'HFFAFTFTFFHHHFLFFAFFTTAAHFFFFFFFFLFTLFTFTLHFFHHLLFTFFTFFTHAHFHFFTFFTFFFFFFFLFFFFFFFFFTLFTFFFTHFAFLHTAFFFFFFFTFFFFLFAAAFFTHFFFHFAAFFLHFFFATFAFHFLAAFHLFFAFFFFFFFHFHLTTFFFFLFFLFAATFFFLHFALHLLFFLTHFFFTHTH', 'TFAFHFAFFHFFFFTAFTFTFTFHFFAFTTAHFHFFFTFAFFFTHFFTAAALFTHAFAFFFFTHFTTFAHFFFAFAFHFAHTFHFFTFLFHFHHTFFTTFAAFHFFTFFHFAFLLFFFFAFHFFHATTTFFLTTFFATFFFTTFFAHFFFHHHATTFHFFFFFFFFTTFAFTTFFFFFHFHFHFFFFTAFFTTFFFLTHF', 'FFFFHFFTFLHFHLFAFFALLTLTFHFFLAFHTLFFFTFHFALFHFFTTFTFTHFHFHHHHFHFFHFHTLHFHFFTFHFTLFAFFLFTFTAHFTLFFFAFTLTTAAFTFATAHFTFHFFTFFLFFAFLFLFFFTHTFFFFFAFHAHLFHHAFFAFLHFFAFFFALHHLHFFFFFFAFTFFHAFHFHTLFFTFFTFLFFTA', 'TFFFTTTAFTTTAHAAFFAAFFFFAFTAFFAFAFFTFTFTFFTTTFHFFFHTHTHTAFAHFTHLAHFLTFFLALFFLFFHHAAHFHTLFFAFFFFFTTFLHHTAATFFFFFHTTHLFFFFFLTATFFFHFFFFTFFHTFTAAHFTFLLLAAFFFFFFTFATFFFFFFFFFFFHFAFFLFFHFFFFTTFFHFFHTFFFFTF', 'FTFFTTFTTFTFTFFFFFFTFAFLTLTATFFTFFFLAFTFAFFAFFHHFLFFFTFFFFFFTFHHHHFAFHFTFAHFFFFFHTFFTTFHFFHTHAHTFFHTAAATFFTLTFLFLFFFFFAHHFFHAFAAHFFFFFFLFTHTHTHTFFFFFFFHHHFFFFFAFFFFTFHAFFHTFFALFFFTFFTLTFFTAFTFHTFFFALF', 'TLFFFTAAHHFLFTTFFHLFAFTFHHTFFHAFLLATFATALTFFFTTLFTFAFAFLFFFFFHTFTFTFLHFFFHFHFLFTFFFHFLHFFFHTFAAFLLATFAFALATFATFLFFFLAAAFFLFAAFLLFTFFFFFHFTTFFHFTFFFHLFFFAAHTFFHFFFFFFTLAFTFFFFFFFFFFFATFHFALFFFFTFFHHFAT', 'FATFATFAAHTFLHTHHFFTTFTFFFFTFAAHTHTFFFFAFLFFFLAFLFAHHAFFFFFTFLFFFFFFFTTFAFFFTFTFTLFHHFFFALFTFFFFFALHLTLATLHHHFFFFFAHHFTATFFFLFFTFTTHFAFHTTHFFTATFTAFAFFTTTTFLFFLLFFAFFFTFFLFLTFAFTAFTFFFAAFFFFFFTAFLAHHF', 'HFLFTFFHFHFFFAAFFHFFFFHFTTTFFLFHLHFTAFHFHAFAHHHHFFFFFFLFFFAFHFFAHFTFTLFTAFTALTFFFFFLFFFFFATFAFHFHTFFTTHHFFFTFTLATFLFHFFFFFFHATFFTHFFFFHAALLTAFFFFFFHFTFFFTTFFHHFFFTFFTTLTHFLHHFHFTHFFHHHFLAFFLFFFALFFFFT', 'ATFFFTTTTFHTLTTFFHTFFTHHTTLLFFFFHHFAFHFFFTLFAFFFFTFFFAHLLFFFAFFATTFFLTAHATHFHFFFFHFFFLATFFFFTTFTHFFTTFLTFHFALFFFHFFFFFAFFAFHFTLTAAFFAALTFFHTAFAHFFHFFTFFAFFFFFFFFFHFFFTAFAAFAFATFTFFHTLLFFTFAFAFHTAATFFF', 'FHFFFATFTATHAFFHFFFFFFHFLLFFFFFTHATHTFFLHFALHHFFLFFFFAFFFHFLATLFFAFTFFTHFHHFFFAFFHFTHFFFHFFFAFFFTFAHFFFFTFFHTFATLAFTFTFHFTFAFTFFATHAFHAALTATLHFHATTLFFFTFAFTLTLFALTFFFLHFATTFFFHFALFTFFHHFFFTFFAFFFAFFHF', 'FTFFFTFTTFFFFAATFFTFFHHFFTFAFFHFHFFFFFFFFFTHFTHFFFLFAFFTLFHFATFFFTFFFHFFFAFFFATHHFALFHFFHAFFAFFFHHFFFLFHLAFFFFFATHFFFFLAFFFHFFFFFTFTTFFTFAHHLFHTHTFFAFTHTAFFFFFFAHFHTFTHATFLFHFFTAFTLFFFFFTFTFFLFHHAFALH', 'FFAFFLTFTFFAHAFFFHLAHFFLFLALLFFFFFAHFFFFFFAFFAFTFFTFAAFLAFFTTFFFHTFTAFFFFLFTTFTHTHALTFHTHLFTHFFFTFTFFHFAFALFLFHHFFFAFHTFFFFLLAFLHAFAFHFFFFHFFFTLATHLFFFTFFTFHFFHHFATFFHLFTHFFAFFTAAFFTAAHTFFTFFHFAAFTHFF', 'ALFAFFFFTHTFHFHHFFFFFFFTFFTFLLLTFFTFTFHFFTFLFFFFFHFFFFFFHHFAFFLTHAFFFLAFTFTHFTFFLAAFFFHHHHTAFHATAFTLHTFFAFATFAFFTFFTFFFFFTAHFFFTLFFFFLHFHHHFFFFAFLLLTFAFATFFTHHFFFLALFHHFTAHFFFFTFHTFATLFFAFHHFFFFHHLFFL', 'FHATTTTTFFAHFTAFFFFAATFFHTTTTAFTFFAFTFFTHLFHFFLFAALFLTAHTLTAFFTFTFFFFALTFFFFTFHFTFATFTLLLHTHFLLFFFFFFLTFTAFAFFTFTLHFFFLFFLAHFFTFFLFAFFLFFFFTFFLATTFLFHTFHFFATFFLHFLLFFFFLTTAFLFTFTFHTAFAAFFHFFTFFFFFTATH', 'LTAFLLFLFFHALTFAFFAFFATLFFFFTFFAHHFFLTATFFTHFFFFFFFFTHFFFAHHLHFFHFTTFHTFFFLALLFFFFATLHHFTHTTFFAAFFTFFFTFHAHHFTTFFTFTHTFLTFFFTFLLFLTFFLFFFFLFTFFHTFAHLFFTFATTHFAFFTTLFHFFLFHFLAFFFFFFTHFFFFHFATFTFHLFFFHL', 'FALTLFFFFFAHTFHAHFFTHFFTTATFFFAFTFFHFFFHTFFAFLFAAFFATFFTAFHTFTTFTTFTFFFLAAFLTFHFFAHFFTLFFFLAFFATTFHAFFFHFFAFFTHFTFHAFFAFHFFTFFFHAHAFFFFFFFFHFAHFLHHFHFFFTFFHLTFFFFFTFFFHATHFHHAFALFFHLHFAFFFALFFAFLHTFTT', 'FATFFFLFFAHFHFFTLLTFLTTLFFLAFTTTLAFFTLFHAHLFFLAFTFTLFFHFHFFFLAFTFLFAHFTTLFFFLFFFFTFFLLFHHFFATFAFFTLFFAAFFFAATFFTFLTFFFTAFFHFTFFTFHFTHAAFLAAAFAAFATHFFFFTFAFLHFFFFFFFFLTTLFFTTFHHFHFFTHFTFFFFTHFLTFFLHFFF', 'AHFFLFFFFTLHFFFFFLLFTFTTLFTHTFFFFLFFLTFFFFAFTFLFLFTHFFTTAFFFFFFTFHFHHTFHAATFTTHTFLFFFTFFLFFFFFHHFFFAFTTFAFFHFFFFAAFFAATFALAALTHFFHFTAHHFTHFFFFFFAAFFHFTAHAFTTAFHFLLFFFAFFFFFTTFFTTTAFFFHAFFTAHAFFFFFAFAT', 'FTFAHFTAALHLFFATFLFFFFATAFAHFFTFFFTFALHHFAFHAFAAAHFFFFTHFFHALAFTHHHFLFFFHFFTLFFFAHFTFTHFFFTLFFFFTAFFFFTFHHFFFFFAFLFHFAFATFTFHFTHAHHFFTTFTLFAFFAFTTLHTTFATTFALFFAAFFFHFFTTFFTFFHFAFFTTHFTLFHTFFFATHFFAHFA', 'FHFTLAHAFTAFFAHFHFFFLFFFFHFAFATFFHFFATFFTHALLTAFAFTAFTFLAHAHFTTFHTFAFFLHTFFFFAFFFTTAFFFLFFHLLAAATFHHFFFFFFAHHFTHTFFATFFAAFFFHTLFFFTFTTHFFALAFFFFHLTHTFTTAFLAFFFLAFFTFAHFAFLTAAHFLAFFTHFLTAFFFFLATTFAFHTA', 'FHFHFHFTFFFTFHTTTAATFLTLFAFLFFFFFFLHFAFAFFTFFLFFTHHHFTFFFFFFFATFAFHFHTFFFTLTFFFAAHFFFLHFHHFHAFATFTALFFFHFTFHLLTFTFTFTFFAFHFFLLALHFTFHFTLFFFLFHFFFLLFHFTHTHTTFTTFAAFFFFFFFHFAATHFFFTFFFTTHFAFFLFTHFHAFFLH', 'FFFAFHTFHFTFALAAHFTFTFFTAFTFFTLFFTFFFAFAAHTFFTTFTAFFTLFAFHHFFFFFFFFFFFFFTTFFTFFAAFTFAFAFFHHFFFFFHHFFTFHAFLATFFFTHTFFFFHLAFFFFAFATFLLFFLFTFFFAAFLFHTFFHTAFFFFFTTFFAFTFTTAFFFHFLFFTLFLLTHFFFLFHFHTTFFFTFFF', 'FTFTHAHALFFTFLTFFHLAFTFAFTLAFFTTFTATTFFTFTAFLAFFFFFTFAHFFFFFFAFFFAALFFFHHTFHTHLFHAFTTTFFFFHALFAFTTFFFLFFHTAHFFFTTFFTAAAAFFFTFFFLATFHHFFFFHHTFLFFFFTTHHFFTATHFFAFFLTLFHLTFTFHHFATFFLFHHHHTHFFFFFAFAFFLAFF', 'FFFHFAFLFLFHTFLHAFTFFLFATHFATTFFFFFAFFFFAFFHTFFAFFFHFTFHTHFHTTFAFFFFAFFFAFTFFFAFFFFHTFFFTFALFTFFFTAFTTFFFFFFLFFFFTTFAHFFTFFATHFAFAHAAFAFFFFFFLTFFFHAHHFTTFFFFHLFAFFFTHFFAFLFAFFLFFAFFFFAFHFFTFFLFTFHHTFT', 'AFFFFFFFHFHHLLTTFFFFTFLTTFFFFFFFFLFLAHTAFAFFFFFFATAFAFTLFFHTFHFFTFFFFFALTFFFHHFFFFTHFHFTFAFHTFFTFHFHTFLFTFAFFTAHFFFATLHTTTLLHTFTTFFFFFFFFHFFALTFTLHTAFLFFHFHFAFFFFFHFHFFHFTHFLHLAFLHFHFAFHHFFFFTTTFFHFTH', 'TAFFHFFTHLFHFHFFTHFFLFTFTTAFLHFFFTHFATFTFFALTFFAFFLTALHFTFFFFLLFFFFFFLHFFHATFTHTFFATAHATFAFFFHFTFFATFFFAHTHFFTTAFFFFHFFTAAFFFLTFFFFTFFLAHFFFAFFFFFFFAFHTHFTHFFFFLTFALHFHFFTAFTAFFFFHFTFFFHFTFHFFALFFFFFT', 'FFFAHHATHTFFFFFLFFHFFFTATLFFFAFFFTFAFAALHTTFHFFFFFHHTFFTAFTFTTTFFTLHFLFLFFFFFAFAFHFFFFALFTTAFFFLFFFHFFFHFTFFTFTAFLAFFHTHFATHAFFTHFFFFFAHFFFFFTFFTFFFFHTFFHFATFLFFLFFHHTFFAHFFFAAFHLFHTLFTFTTFHFTALFFTHFH', 'FHFATLATATFTHFFFTHFHFLATHTLTHTTFFTFFFTHATFHFFAATHLFFFAFHTTLFFHFFFTFFTHTTFHFLTLFTFFHTHFFLFHTHTFHFFLTLFTFFFFFFFAFHAFAFFFLAFFFTFFFFFFFTHFLFHFLFFHALLFHFAAHAFFFAFLFFLFFAHHFFHAFTFHFFAFFFHLFLFHFAHLTFTFFFFFFF', 'TATFFLLFLFHFFTFHFFAAATTHHFTFFLHFFTATLTFTTTFHTAFAFAFHFHFTFHATTFAAFHFHFFFFTHFAFFHTHAFTFFTFLFFFLFFFFTHAAFHTHTFAFFATFFFHLALTTFTFAFTAFLHFTHFLFLFFFAFAHFFHFFTFFTFFLFHHTFHALFFFTTFHLFTFFHHAFFFFFAAFFHHTFFATFFHT', 'HLFHTHFFAHTTFFAFHFFFFFFLAAFHHAFFFFFHFFHFTFLTFFFAATTFFFHFFHHFFFFFHAAATTFTTHFLTTAAFTFTFFTAFAFTFTAFFTFFFFFAFFHFHLTAFFFFTLFFFFFHFTHTTFFTFAHFFFFFFHTTHFLFFLFFFFFAHLFHAFTFLFTFFFHAFFFLHFFFFATHAFFTFHTFAFHLHHFF', 'FFFFAFHHHTFHFAHFFFHFHAFLFTAHFLAFFHFTFFFHTTFLFFTFAFHLFFFFFTTTAFTFFFFHTALFFFFFTFLTHATTFAFFHTHFFFFFFLAHLFAFFFFFFAFFFHFHAFFTHLFHHTAFFLTLFFAFFFFFFAFLFFHFFFFLHTFTTFFFAFTHTHHFFFFTFHTFAFFFTFFFFHTTFTTAHFLLLFFF', 'THATFAFFTAFFFLFHTTHTFFFFTHFHHLLFFFTTTFFLHLAFHFTLTFHFAAHTFFATFLHLFFFFHHFHFHHAFTHFTTFFFHTFFHFFTFFLFFFFATFFLATFFFFFFFFFFLFAAFAFFLFFHFFFTTAFATAFFFAAFFAFLLFTFFAFFHFAHHHTATFAHFFHTFFTFFTFFFHATFTTFFFHFFTTHFAT', 'FTFTTFFFFFFTHFFFTFLTATFALFFAFFLFFFFFFLFFHAFHFFFFFFHFFFLFLFAFLFFFTFFFFFFFFFFLFLFAFAFAFFHAHFFAALTFFHTHLTFTLFFFHFAFHFLLFTATFTFTALTLTFFFFTAHFFFFTTFFFTLFFLAFHFFLTFFFFAAATHFFHFHFFFLHAFLAFFLHFFFLFTHFTFAFTLFL', 'LLFALFTFFHFTFFFLLTFFTAHHFHFFFAAFFFFFFATHFTTHAAFFFFLAFFLFFFFFFFAFFHFHFFLTFHTTFFTATFFTTTFTFFFFAFAFTFLAFFFFFHLFFFLFFFLTFLATTLAHTHHAAFFFTLFFFFTFLAFLFTFATTFLFFFFFFLAFFFFHAHFTFFHFAFTFHFATFTTFFAHALALHTFLLTFF', 'FLTTFLTFHFATLTLFFFFFFFFLATHFFFTAHFTTFAFTTFTFAFFTAHFFFTTFFFAFFAALFTHFAHFHTFHLFLLFHFHAFTHHFFLFFTFAHFAAFTFFLHFTTLAAAFFHTTTTFLHFHAHTHFLFATAFTFFFFTFFFFATFFTFLFFTLFLFFTLTHLFHLTFFHHFTLAHAHHTHHHALTFFATFAATTTA', 'TAFHFFAFTFFFLALFFTHFFFTTATTAFTTFTHATAFFFTFFTFFFAFTFTFFFLFAHAFHFTFFHTATHFTFFFLFFTTFFFFATFFFTFFTFFAFFHTHFLFATTHTFHFFATAAFFLFLAHFFHFHTFFTTFFTFTTFATFFHFTTTFFLFTATHFHTAFTHFTTLTFHAFFAFTALAAFHFHFFAALLFFFFLAL', 'HTFFFFTFAHHHAHFFTTFATFAHTFAFFFFTAFFAFTFFFFFHAAFTTFFFFHHFFATFTTAAFHFFFFLFFFFAFFFHTFAATFFFTFFAHFTFFFFFTFFFFFTFTFATTFFLFLFFTFATFLFTFFFAFFAFFAFTFTTHFFFFFTLFHFFFLFFFFFFFAAFFFFTFLFFLFHAFFFFHTLFAFHFAFFFFLFFA', 'TFFFFFHAFTAFFFTFFHFTFFTHLTFLLFFFHFHHTHFFFLFHHFAFFTTFFFLFLFFTFFAFATAFTFFAFAFAAFFLAATFFHTTTFAFHHTAFFHHFFTFFLFFFTFTFFFTAFFTFFHHTTTHFFFTLTFFFFAFFHFFFFFTFFFATTFTFHFFAFHFFHTAFTFFFFFFFFFFLFFFHFFFATATFFHFFTTH', 'FFTFFFLLAHFTFHFTFTTHFTHLHLTALAFFHFFFFHATFFAHFTFLFFFFATTFFHFFFFLFFATFHFFLHTAAFTFTFHLLFFHFFFFFTFFHFLFATLAFFFAFFFHHFTFAFHFFFFTFFAFFAAFHHFFFFFTFFFTFHAFALFFFTHTLAHFTTFAHLTFHHFLLFFFFFATFLFFFLFHFFLFHHFFFFFFF', 'FFAFTFFTHTTFAFHFTFHTTAFLAFFATFFHFFFFFFLTFFTFTTFFHFTFLHHFFFFFHHFLFFTATLFLFLFFFHFAFFFFLAFTLFFTHALFTFFFTFFFHFATAAFALFFAFFFFAFTAFHTTTFFHFFFFATFFAFFTFFFHHHFFFFFHFLFFTTFATTLFFFFTTAFFATFFTTFTFAFFFFFFFFFFALAF', 'TFFFHFFATLTFFFTFFAFFATFFHFFATLHTHTFFTTHFTFLTHTFLTTTFAFFFLFFFFTFATFHFFTFAAFFTALTLLLHALLFTTFAFHFFAAFLHAFAAAFHFHTTTFLTHLFFFTFFHFTFLFAFHHLFAFFAFTHHTTHATAFFFTFFHLFFLFFAAFAFFFFLTFHFFFTAAFFFHFFFFFAFFHTFFFFFF', 'HFFALFFFFFATFTTLLFFTFTFAHTTFLFATFFHFAFAAFHFTFAFALFFLAFTFFHAFLFHTFFFFFFAAHFHAFFFHTFFTTLHFFLFFHFFTTFFFFAAALFFAFFFHFTFAFFFFFFFFFTHLTFFTTFFHFFHFHFFFFFHTFFTAFTFFFHFFAFLTTTFATAAFAFHLTFFFFFFHTFFFHFFAFFTFFFTH', 'FFLFFFFFFFFTTFHFHFFAFTTTFHFHTHFFHFFAHFFFFFFAFAAFFFHLHFFAFHLFFLFFTTTFHFAFFHFFFFHHTFALFHTAHTLHFTHTHAHFHFFAFAFFHLFFFFHFFTTFAAHAFFHLTFFTHFLHTTHFHAFTHFTFTHFFFAFHAHFHALHFFHFHHLFFFTFAFTHTAFFFFFALHFAFTLHTFHFF', 'THAFFFFFFAFTHFFFTFFFFAFTFFFTFTHFFFAHHFTHFFFATHLFLFFHTTTHFFFTFTATFFFFFTHTFHLFFTHFHHTFTFAHLFFFLTHTFFFHAFAFFHFFFFFFFLFHFTFFFTTLAFTAFFLFFFTTAFTFFHFHTTFFFFAFFFTFFAFAFLFFHFLFFAFFAAAATTHFHAFFFFHHFLHFHHFAFFTT', 'FTTATLFATFTFFTTFFFTFFTAATTLFAHFLFTAFFTTFFFAFFFAHLTHTFLFTTTFALFTHFLFTHHFATHFFAFFFFFFLHTTTFFLFFFTFTLFTFFFFTFHFATAHLFTFFHFHFFTTLLHFHTFFAFLAFHLFAFAFALFTFFAFLHFFATAFHHFFTLFFFFHAFTTATFFHTAHHFFFFATHFFTFFLFAF', 'TTFFTFFTFHFFFFFFFTFALHFATAFHHFAAFAFTHAFTTHFFFFTHLFAFFFFATFFFTHFFTHFFLFTFFFFFLFLTAFFFLFFFFFAHATLFFATTFFAFTFFFTAFHFAFFFFHFLTFFFLFAFTTALFFFFFTFAHFTFFFHALAFFTAHFAHTAFLHFFHHTAALTHTFFTTLFLFAFLFFFFFFHFFFFTLF', 'TFFFHFLFAHLHTAFFFTLFTTFLFFFFFTHHTFHFAAFFHTFTFFATFTTFHHHFFFFFHFFFHTLHFAHFFTFFFFLFTFFALFTFLFTLFHTFFFFHFFFTHFFHFFFFFFFFFFTTTFALTFHHFFFFTHATFAAAALFHHFHTFLFTTALLTHTFFLFFHHTAFFFHFFFFFFFAFTFFFFTFFFFFTHATTHTT', 'FAHTFFFFFFTAFFFFFTHFFFFTHFHFTTFLTAFAFFFAHFTHATFTFHTFLLLFTFHFTFFLFFHFATFFFFFTAFHALFFTATFTTTFAFFFTAHFFFTTTTHFLTAAFTFLFLFFTLTFFFFFTFTFHFHATFFFFALFFFFFHFHFFTAFFFFFFTFTFFAFFTFTLHAALFFTLFFFHTFFAFTHFHFFFTTHF', 'FTAFFFTHFAHHHAFFAFHFFATFFFTFFFHFAHFLFFFFFFTTFTFFTAAHFFTTFLFFFFTTTFHAFFFFFTTTHAFFTTFFTFFHFHFTAFFAFFFTHTAHFAFHFAFFFFAFTFTFAFFFTFTTFFAHHTLFFHTFFAFFHHAFTFAFFFFFFTFTFFFFFLFFFALTLFFFFFFLFLFLATTHHHFFHFAFTFTH', 'LTTFFLFFHTFFFTFTAFTTALFTFFFFTHATLLFFHTFFTHFAFLHTFFFHFFFALFFHFLFFFTAALFFTTFHFFTFFFTFAAFTFFFHHLFLAAFFFFHAFTFTTLFFFFTTTFFFLAFFAAFFTFAFHTHTFFFFFFTFLHAFTFAFTLHFFFFFFFAATTAFLTLLFHFFAFAFFTFFTFAFHFAFFFHAFAFFF', 'HLLFHLAHFFHFLLHATALFFHFFALTFFTFFTTFTHFLFTFHFAFFFLFHTFFAHFLFFATLAHTFFTFTFATFTAFTFFFTTAHTTTFFFAATLFFAFAALFFFAFFFFTFHFHFFFATTFAFHFHAFFLFFTTLLFAFLHFAFFHATTFFTFTFHHFFFHALALFTTTFFFAHTFTHFFTHFFTTAFHFFFAFTFTT', 'FFFAHFFFFTFHFHFFFLFHFFFHTFAFHLTFFFHHFTFTFLTHFTAFFTAFATLHFTFFFLFFFHFFLTFAFFTHFALFFFATHFLFFFFALTFHLFFTTFTALAFFHTFHFFFLFTTFTHLTATAFFTFAFHTFFTHFFTAAFFTFFHTFAFFFHAFTLTFFAFFHFAHTAFTFFFFFFFAFHAFFTHFHAFFFALFF', 'ATFFTTFFAFFFFFLFATATFAHFTAFFFFHHFTFTHAHHFAAAFFLHFFFHFLFLHLFFFFFFFFLTHLHFAAFFHFLFHFHTAFFFHAFTFFTFHHAAFFFFAHFTFFFAFTFHTAFFFTAFLTLFFLLAHFLLTHTFFHHFTHLTLHFTAFFFFATATFFAFFTAHAHLLFAFHFHHHFAATFAHALFHFAATHLFT', 'HFFFFFAFLFFTAFTTFFTFFTAFFFFLFAFFTAFFTTFLFFFFTTFLFTTFAFAFHFFTAALAHFFFLFFTFALFAFAFFFTFTFAFFLHTFFTFFFFAFHFLFATFTFFFFTTLAFFLFFTTFLLFFHFFFHLFTFHHHFLFFTHFFTAFTATFFFLAHTFTTFFFFLFTFFTFTFLAFLTFLFTFHFLFFAAFHFFF', 'AFFFFFTFFFFTFFHTTFFTLAFTFFFFTHLHFFLFFFFAFFFLHAFHFFFTFFFFFLFAFFFFLFTFFFFHLTFHFAAFFFLFTFALFLFTFFTTFAAHTLAALFAATFFATFFFFFTTFFATFFFHHHTAFTAFTFLHTFFFAFFTHAFHFFFFFTAFFHHFFATLFTFFFFFFAFFTTFLFFLFTFFFLHTFATAAT', 'FFFTTLTLHHTAFFFFFFTHFAAFFTFALLAHFFTAFHAFAFFFHAHAFTLFFFFAFAFTTFHFFAFHFFFAFAFLTFHFFFAFHFFFLFFHTFHFAFHFHHHFHFFFFFFFFFALAFFFATFLFFTFFFTFLAFFFFFTHHHAFFAFTATHFTFHAHHFTFTTHAALFAFFHFHHFFFFFHFFFTAAFFLHTFHFTFAF', 'THFFAATAFTFFFLFFFHATFFFFFFTHFTFFTHTALFFTFTFFTLFFHFHFFAHFAFFHFHFAFFHTFFLFFFFAFFAFHAHFFFHFTTFFFTFFFFHFFHFTTFLFTTFFTFFFFLFTFAAFFAFHLLFLFLLLLHHHFFFFTFFHFTHFAFFTLFFTTHATFLLAHTFFFTAFHFAAFTAAFTFFFHFFTFFTLTFF', 'FFFFFFFFFFHATTHFLFTTFLFTAHFFLTTTTFHTAHFLFFHHAFAFFAFFAHTTHHAHTFATFFHLTHAFTFFFLAFTFTFFTAFHFFFAFTFAFLFTFAAAFFAFFATFHTFLFALFAFFAHFTFLFFAHFFTHFTFTAFAAAAFAHFTHHHAAFLHAFFFATFFFTAFFHTFFLHTHFFATFHTATFFAHLAFFHH', 'HFFTFFTFFFFTALFTFFHHFTHHFAHFTAHTFFFHTTHFFFFFTLHFFHFFTATTATTFAHATFFAHFLFHFAATHFTTFTHHTTFFTAHLFATFFFTFFFFAAHHHFTTATFFFFTTFFTLFFHTLHHTAFFFFTAFAAHFHTFHFFFFLTFFFFAFTFHFFFFAFTFFHATFFTFFFFFFFHTTFAHFFFFFLAFFL', 'AFFTFTHAFATTFFAFFTFTFFFTHFFFFFTFAFAFFHTHLFFFLFAHFFFTTTFTFFHTFLFFATTFFAFLFLFHLHHFFTHAFAFFTFFLFFFFFAHFTAATFFFFAFHLHHFFALHFFFFFALATAFFFFTTFFFFHFTTLHAFAHLFHHFAFATTTLFTHTTFATHTFHAATFFFFFFFFTLHLHTAFFFFTFFTF', 'TPTATFFAHFFTLFAHATLFTFLTFTTHFFTFAAFFFFFFFTHTFHTFFFFTFFFTFFHFAFFHFFAFFTFFFATHTHFHFHFFAFLAFFFFHFLTHTFAHHFTFFFFFAFHFFFLFTFFTFTAFFFLFFTFTFFFHFHFFALFFFTHATFTFAFAAFFFAFLHFFTFAFFFHFATFTAFFTTLLAAFFHFFFHLHFFFH', 'FFATFTTFFFALHLFFTFFHAFFTTTTTFHAFFHFHFFTLFLFFFFTTLTHFFFFAFATFAFAFFHFTFTFFAFFLTAFFFHTAHTFAAHFATLFTFHHFFFFHFFHTFHALTFFFFFFTFFHAFFFTTFFHFFFTFAFFFAFFFFTTTFFFFFAFTFLTHFFAFTLFFATLHFFLTFFFLFFAFTTHAFFFHHFTFFAF', 'FHFFHAHAAHATTLFHATLFTFTTLTFFTLATFAFAHFTFAAAFFTFFHFFHFFFTFAFHFTHFTFFLFFFTTAHAFFFFFFTFFFAFTTHHTAHFTFFTTFTFAHFLFHFHFFFFFFFAHHTFFFTLFFTFHHLFFLFFTATHFAHFTFTFTFAAFHFTFLFFTTAFAFFALLHHLHHFFLFAFTFFLFFLFTFFFFAF', 'TFFFTTFHFALFTHFFFHFFFLTAHHFHLFAHAFHFTFFFAATALFFTLLFTFTFTFHFFFTHFFHFFFAFFTTLFFFTLLFHFFTFHTFFAATHTFTTAFATTFFAFFHTFFAHLFFTLFHFAFFFFFFFFFATLLTTFLHTFFFHFHFFFFAHFAFHFFTTFFLFTHHFFAAHHTHFFLFFTFFAFLFFTAFLFFFFA', 'FAFFTTFHAFLFFFHAFATLLFTFFFFAHAHFAFHHTALFHTFATFLHFFFFAFTHLFATALFLLFALTTTHLFTFFFLHFATHFFFFFFHFHAFFLLFFHFTFFTFFTATAFFFFFTTFHFAFATHFTFFLFFTHFAHTFFFLFTTAFFFHTLFHAHFFTTFHHTTAHFFTFFTFFFHFLFFAFFTHAHFFFTHHHAHA', 'FTATFLTTTLFFTFAFLLFALHAAFFFLFATFFFALTFFTTFFFTHFTFATLTLATAFAFFFLHHFATFAFTFFFATFLFHFFHFFHFTFFTFFFLFFATTFHALFFAFHTALFFHATHAFLHFLAFAFFHHTFHATLHAFHFFFTFFLTFFFTAFTFFLFFFFHLAFHAFFFTFHHFLFFFFFHFLFFLHHFFTFFATT', 'FFFFTFFFFFTTTFFHFAHHFFTFTFFLFLTFFTTTLFFFTHTFAAAFLLLTHFFLLFTTAFAFHFFFAFHFFFFFFTHFTHFHFFAFTTTHTFFTFFALHHLFHFLHFFTFFTHTTTFFTFTFFFTLAFHTFFFFFTFTTFLLTFFFFFFFAFAFAFATAFFFFLHLFFFTAAFTFFTFTFLFFFTFFTHFTTFTFHFA', 'FATTHFTTALHHTFHFFFTLHAFFLFFTFFFFTFFFFFFLTFAFFTHFAFFFTALFAFHFATFTHFFTFTFHFFFAATLFTFAFFLFTFLTTLFFFFFFTFAFFFLAFFFFTHTFFFFHTFHATFTFFLFFTTFFATFFFFFTAFTAHLHLHHFTTFLLAHLTFAHAFTFTFFAFTTFFTHFFLFFFAFFHTFHLFALFF', 'TFHFTFFFAHFTFFFFFFFTFTTFTFLTTTFFFTFFTHFFTFHTLAFFFFFFFLFTFLFTFFTFFFHFTATFATTFFFFHHFLFLLFAHAHFTFFFFFTFFTFFFFFFFFFTTFTTFFFFLLFFFHFFFLFFLFAFFAFFFTTATFTFFAFTAFAHLFFFHAFFFLHHFFTTTFLFFHATFHFFFFFFFHFTHFFFLTFA', 'FATTFFAFTLFFFTTLFFTHHFFHTHLFTFHFLFTFATFTFHLFHFFFAFFFLFFLTAFHTFTTFTFFLFFFFAFFFFTFFHFTHAHLFFTHFALTTLLFHLFFTFTFTHHTAFFLHFTAHFTFTTTTFFHFAFTTTFFFFHLTFHFFAHFFFAFFTFFFTFTHFFFHTFFFFLFAAHHTLAAFFFFAHAHTFFTFHTAT', 'ATFFFFFTFFTLAHFFFTTHLFFLFTFFFFFTLATFHFFFFHTLFTTFFHHHFFLFTAFHLHFFAFFHFFTFATAFTFFFTLFAFTFFFLTFHATHLFFFFTFTHFFFFTFFATFAFTFTFFFFTTFAFALTFFLFFFFLFAFFHHFFFHTTFAFAFFHTAHTAAFFFFTFTFFTHTTFALFAAFFTAHFHATTLFFHFT', 'FFALTFHFLFFTTHTFFFTHFFLTAFFFFFHFFFTAFLAFFHHFAFFAHFTAFALAFFFFFHTLTHFTTFLAFALATTHFFTFTFFFFFFLFTLFHFFFFFFFAFTFLFAFFLFHATFFFHALFHAFTTHFTHTFTHTFTATFFAHTLHAFFHFTFFFFFLATLFFTFFHATATFLFFHFFTTTLFLFAFTFHFFATAFL', 'ATAFFFHTHAFFFFFHHTAFFLFFFFTLFFFHFFHFFFFTAFAFFTFFALFALFLFFFFTHHTFAFFTFTFATFTFFHFHTTLFFHFFFTFFFATFAFTFFFFHFFFAFFHAFFTFTLAAHFTFLHFTHFFATFLAHFALHTALFFTAFHFHFFFFTAFAFTAHTFFHLFAALFFAATFTTAFHFLTTAFFFHTFFFLFF', 'FTFLHTFTLFFFHFAFFTFHTFFFFTTFFTTFHTTFHHFFFFTAFTTLFFFFAFFFTFFTFTFAFFAHFFHAFAFHTHFFFLLAALTTFHFHFLFHFTFTFAALFFFFALLHFTFFATTFFFTHFHHAFFFAFFFATFLAFFTLFHFTLFTFHHFTFTTFTFHLFFTFFFTHTFHHLFTFHFTFFTTTAFLFATFHFTFF', 'AHFHFFFAFFFFTFAFFFFALFHFFFFLHAHTFHAAFFLTFTLHFAHFFTLFAFAFTFAFFTALFFTHTTFTTLTFTFFFFHTFFTHFALHTFLHFFFFLFLTLFFFFTFLTTFFTTFFFHFFLFFFFTHAFFTFTFHFAFFFFAFAFHFLTHAAFFATHFFFFATFATFTFFFFTFTTFAFFTLLFFLFFTAATTTFTF', 'FLLFFFFTFFATFTAFTFFTFTFTTHLTHTFAHFFFFTTFHLTHFFTAFFLFFFHFTFFAHTLHAFFFLFFAATTLHFHFAFFFTHATTHAFHFLHFTFFFFFTTFHFHAFFFFAAFATFTFFFFFTFFFAAFHLFFFFFFLTHTFTTAFLFAHFLLFAFFFTHFFHFHHFAAFHHHFFFAFFLFTFFTTFAHALFFFTT', 'FFFFFFAFFFATFFFFTFFFFTFFFFTFTFFFHAFFTFFHFFTTLHFLTFTFFLAFTFFHFAAAFFFLHHLHHFTFTFALTFAFATFTHFFTLLAAFTFFFAHFFHFFFAFFFFFTLAAHHFLFHHFFFHTFFLAHLFFFFHHTFFTTLFLTFFLFFFFFLTFFHFFAFFHTFTFTTATFFAALAFHLFTTFFTHFFFFA', 'ATHTFFFTFFTTLFTFFTFTFAFTTLFLAAAAHTTFTFFFFFAFAFAFAATFLFTTTHHHHAHFFFFTTLTHFTHFFTHLFAHFAFAFFFTAFFFFFTFFFFFLFAAFTFHFHHTFFATFLLLATHFTFFFATTLHFFLTHFFFFHAFAFFHFTTAFFHATFFFFAHTTTFFTFHFFFFFTFHFTTFFTFFHATFFATFT', 'AFAAHAFFFTTTLFHFAFHFTFFFALAFFTFFFFFAHFFTTFFFFFAFFTTTHHTLFTLTHFAFFFHAHLTTLHTFHFLTAFATFTFFFFFFTLFFFTFFFHAFFTAHLTTHTTAFHLFFFFTFFFFAATTTTFFTFFHFFFFFTFFHFFFTTTFAHFFAFAFFTHFFFAAFFLHAFFFFTFFLHTHFLTFFAHFLHFAF', 'FAHFFTFFALATAFHLFLFFFHTFHHTLFFFFTFTFFFFFAAFFFFTFFLFFFHFFLTHFAHFTATTLFFHFFAFHFTFTFTFLFHFHHTAAFFFFFFHFFTTFFFFFTFFFFFFFTHFTFAHFAFLAFFFFAFFHFLFFTFFTAFFLFFTFFFFAFFFAFFAFFHAFFLFFLTLTFHFFTFFFTHATFTTHAHFAHFFF', 'AFAFAFFAFFFFHFFAAFFFFHFTFFFTFFFFTFFFAALATTFAFHHFTHAALAFFAHFHFHLFFTLFAHHFFFFAFFFTTFFFFFFAHAHFATFHLFLFFFFTFFFTFFFHFAAFHFFHFFFFHHFALFLAFHFFAFFLFFLLFTHAFLTFFFTTTATAHHAFHAFFFFTATHLHFHFFTFHFFAFHFFFFFFAFFLHA', 'FFTFFFFTAFTFFFATFTFAFFTTFFFHLTAAFTAALTFHFAAAFFFFHLFTTAFFLFFFFFALFFFAAFAFAFFALHTFHFFLFAFFTFHFFAAFLFFFTFTFTATFFTTHHLFFHFFFFALFTFTFHTFAAFAHTTHFFFAFFFFTFFFFHLFFFTFFLFFFFFFFFFTHLAAFTHTFFFTAFTHLTHALFFHFFFAH', 'TLTLFHFFTFATFFFFFFFFTFTTHAFFFFAFLFTHTLFFFTTTAFFFHFFTTFFFFFTFHFFAFAFFTFFFFTFLATFFLFFFFTTAFFFFTAHFTHTTTFFHLFHFHFFFFLTTAFTFHHHTFLFFTFFHFTTAFLFFFFTTATFFFFFFFLFTFFFFFAAFAFAAFAFFHFFFTTLTFALHTFFHTTFFFFFFFTFT', 'HFFFFHLFFFTFHFFTTFFFFFHAAFFFFHTTHLFFFFTTAFHFTFFFAFHFFFAHFFFAFFATFFLTFTFFFFLFTTFFAFTTFAFTFHFTFFHFFFAFFHHLHFFTFALFHLFFHAATFFTAFTHHFFHTFFHFHHFLFFAHTFLTTTFHHTHFFFLAFTFFTAFFHFTFFFLFFTHHAAALAHLFHFFFFHLAFFLT', 'AHFFFFFFTTFFAATLFHFFFAHTFTFFFFFAHTTFFHFFAFFHHAALAFTFAHTFTFATFFAFHTAAFFAFFTFTFFFFLTFFFFLHAFAFAFFFHLTFHFTFFFLTAHFFFFFHFAFFFTAFFATFFFTFTFFFFFLFFHFFLFHHFFFFAFFHTTFFFFFFFFHFTATFFFFLTHTAHLFFFTFTFFTATLHFHHFF', 'FFTFFFFLHFFTFFFLHLTHFAFFATFFHFFAFFFHFFLFTFLFHFFFHHHFATTAHHFTFFFFFHAFAFAAFFAAAAAFFHFTFAHAFFFTFFHHTFHFHFALAHFFFTHFLFHTFAFTHFATFFHLLFFFFFLTHLFLAFHFFFFTTLFFFFFFAFFTATLFFAFFLLTFFFHFFFFFTAALFFFHFHTFFFTTFFAA', 'HFLFFFFATTFFFTAFHFTHHTFTTFTAFTLHFAHTAFFFAFHFFTLAFTAFFHHHAAHHFAATFTFFFHAFFFAFFHALTFAFFFFFTLFFLLHFFFFFFFFTLALFFFFLHFAFFHLFTHATTFTFTFLAFFFFFFHFFLFLFFLFAHFFFTTFFHFFFAHFTATFLAAFFFFHTAFTFLTHTATFLFHAFALATFLF', 'AAFFTHFFLHFFFFFATFFFFLTFTHFHAFTFHFFFHATFFFFLHAFFFFTTFTFAFLFAHTFFFTAFHHFTAFFTFAFFFTFFFFFFTFLLLAHFFFFHTFTLFFHFAFFFTHATTATFHTHFAFLTFTTFFLLFHFFFLLFAFFLFFFFTHHFHFFATFFFFFAFHFFTFFATTHHAFFFFFFFFTLTFFTFTFATAF', 'LFAFFTAFFFFFTFFATFHATFFFFFAFFTFFAFFFFHALHHFTTHFFFFFLFFFFAFFTATTAFFHFFFTTAAHAFFHHLHLFFFFATAFFHFFTFFATFTHFFFAFTFFHTFTFFTHHTLFFATATLFTFLFFFFHFFFFTLTLAFFHHAHFLFAAFFFHATAFFFFTFTFTFALHTFFFHATFHHTHHTTFFFHTLH', 'FFFFFHAFAHTFAFAAFAFFFTFTFFFFLTTFHFTLAFFFHATAFLFFFALHHFTFFFFTTLLFHFFFFFFLTAFHFFFTLFFTFFFFFFHFHFFFTAFFFFTFTFFFHFHFTTFFTFFTAAAFFFFHTLFTFFLAFAFFTFFHFALFFHALLFFLFFFTFFFHFFFTFFFFHHTHFFFLFFFFFTFFFFFFFHFAFLFF', 'LHLTFTHFAFFAAHTAAFFTHHFFAHAHFFFHFFAFHFHHFAFFFAFFFLFFTFATHHFFHFFFTFFHLTAFTAFHTTTFAFFTFAAFATFFHAFFFFTFFFFFTFLHFLLFFHTFTFFFFFFFLFFFFTFLFHTFAAFFAFFFFFFFHTFLLFAHFHTLFFFAFFAFFFFALFFFAHFFFFLHTTATAFFFLAFAATFF', 'FFATLFATHTHLHHFFFFAFFFFAFFTFFTFATAFFTTTHTFFLFAFTFLFFALFAHFFLAHFALLFFFTFFTFATFATFAFFFFFFHHFLHLHAFFFFFATLAHFFFFATFFFFFFFFTFAFLFHHHFFLFHHFFFFFFFHFFTFLFFTFHLTTFLLFTFFHAFHFLTTHFAFFLLLTFTFFHTFFFATFFAFFHFTHT', 'FFFHFFLHFFFFFFTFHHHFFTTATFHTFTTHFFAFTFFTFFTHFHAAFFAFFFHHTHFAFFFFHFFAAHFFTFFFFFFFFFFFFTFLAAFALFAFFFAFTAFFFTLHFFHFLHFTAHFTAAFTTTTHTFFFFTHTFFFTFTFFHFFLFFHTTHHFFFFLFFHFHFTTTATFATAFFFTTAFTFTFFFAFTFTHTHTATF', 'AFTAAFFFFFHFHFTFAHHFHHFFFFAFLHLFFHFFTFAFFFFFFFHTHFTFFFHFTFFTFTFTAFFHTAFFTAAFTFFFFHTHHHFFTFHTAFFFAAFLTHAALFAATAATFALFFFFFFHLFFFFLFFFHFLFTFFFLFHFFAFFTFFHAFLFHLTFAFHFTFFTLHAFFFFTFTFHAAATFFAFFALFFTFHTAFHA', 'HFFFTFFFFFFAHFTFFFLTHTFLTTHFAFFLFTFHFFTFAFTLTFFFFHHTTFFAHFAFFLFFLLAFFAFTTFTTFFAFFFFTTAHTFFHFATLFAHFLFHATFFFFFFTHAHFHFFFAAFFLTFTFFFFTTFFHTFHTTFFFALFFHFHFTFFHFLFATFAFLTAFHFFFTTTTLAFFTFAAFFFFTTFFFAAFHFLF', 'LFFFAFTTFTHFTLFLAFFTHFHAFFTFFLLFAHAHFFLAHTTFFFFFFHFFTFLFFAHTAFTFFTFLFFAFFHLHFLLLAAFHLFFFFTLTTHFFFFTTTFTFHFFFLAFFAFLTTLFFFFLTFFFAHTAAAHTTFLFHAFLFHTFFAFALHFLAFTLFLHLTLAHAHLFFTHFLFHFFATFTFTHFTLFFFFTFFFHH', 'FLFFHAFFTFFFLHAAHTTFFFLFHLFHLTFHTATFFFTFTFHAHFTHFLFFFAFAFFATFHFFFTFHFFFLATTHFLAFFFFHFLTTFFFAFLLFLAFHAFAFFFLFATFFFHFFHLLTHTFAFFFLFFLLFAFFFFFFAAFLHFFTFAHLFTHAAATTFHAFTFFTFAAFTTHFFFAFHHFLFTTATFTHTFFHFFLF', 'TFHFTFATHTTTFHLAAFFAFFAFFAFFHFTHATFAAFLFFHFTFFTTTFTLATFFTFFFLTTATLFFFFATATTFFHFTFFHHFFFFTFTFFALFFTFFFLFTTLTHFTFFHFFFFTFFFTFAFTFTATAFHFTFLLTFLLHAFHLFFTFLFLTHLFFHFFFHLFHFFFFTAHTTFTFFTFTAFFTFFLHFHFFFATFH', 'TLFFFFFFAALTFAFHFFFFFHAFTHFHFFAFFFFFTAHFFHFLFATTHTLFFAFTFHFFFTHHFFFTATFAFTFFLHATLAFTFFFHHFAFHHLFTTFFFAFFFTFAFFFFHFAHAFFHHAFAFFHLFFFAAFFFTFFTFLFHHATFFFFTAAFAHHFLFLLFTTFTLFFFAAFFFLAFFHLFTHFFFTAFTAFFFFHT', 'FTLFFAFFATAFFFFHHAFFFFAFFHFFTFFFFTTFLTAHHHFAFFAFFHHTTFTFFFTAFFFTATHTHFFFTAHFTFLFAALTFFTTFTFHAAFFFLFTTFFFFAFTTLFAHTFHFHFTHATFHFFAFALAFTAFFFFFTFFAFFFAAHFFTFFTTLFTFTLFFLFFHTFFFFHFTHFAFFFTHFHFATFFFHTATFTF', 'TFFTFLFFFAFLFTTHAFAFFFFFTHAFTFAFFFFFTFAFFFFFFFHFAFHTTFTTFTFLFFTAFAHAFHFFTFFFAAFTTTFHHFHFFFFFHFFHFFATTHFFHFFFFFTLTFTFFTFFHFTHFFFALTFHHLFAFTHTFFFTFLFFLHFFAFTHFFFLFTPFFFFFFFFATFFAHFTFFLFFFTFFAAFTFTLTTHFF', 'TLTHTHTFFTTHHFAHFFFFFTTFTTTLFTFFLAFAAALTTFHLTTHFFFLTFTFFFFFTFTAALTTTLFTFLFTFTFFFAAHHAFLHHLFFHFFLFLFHAFHAFFLFHLTTFLFAFAAFFFFTFTHFTATTFFFFFFAFLFFAATATFFHLHLFHFLFFTFFFTAAAFFFFFFFLFFFFLAHFTTFLFHHTTAFHHHTH', 'FHTFFFATFFTFFFFFTFFFFFFFTTFFFHHFFFFHAFAFLALFFTLFLLFTHTFAFLFFFFFFFAFTFLAFTFFFFHFAFFFTHFAFTTFHTAAFHLFHTALTFTFFHFFAFLHLFFTFAHTHFHFLFHTTFFAFTFHHTFTFFFTFHLTFTFTFFFLFHAAFFTFLFAFHHTAHFFAAFFTAFHFTTAAAHHTFFFFF', 'FAFTHFTHAFHFTFFLTTFFFFLFFTFATHHLFFAALHFALFLFFFAFHFFFLTTFLATLFFAAFFFFFTFFAFLTTFFFFAFHALLFLHLTFTHHFTTTFFFLAFFLFLFFLAHFLFFLHHTFFATFFLFFAAFTFFFFTTFFFFALFTFLTFFHTAHFFHLLHHTTAFLFTFTTTFAFTALHFFAFAFAFFFALHFAF', 'FLFFAFLHTFFFLFLFFLAFHLLATFFFFFFFTAFAHFFTFTFATATHHFHFFFFFTHFFFFALFLLLTFLFFTTFFFAATFTFATFLFFTFFFFFHFLFHTAFFFTHAAAFFHTTFTFAFFTAFTFAFTHFFFFFFAFFAFFFFFTHAFFHTAFLLFTFFTFFFATLFFFTHFTLTFHFAFTTTFFTATFHTFLTFAFH', 'FATFFFATFFAFHAAFFTHFTFHHFFTFTAFLFHFFFFFTLFFFFLAHFAHTHHFTHFFFHFFTHTATFTLTLFFAFFFALFHTFFFTFFHHFLFTHFLFFFFTLAFFHFAAFHHTATFATFFTTTAFFFHATFTFFTFTFFFFFAFAFTALFHFFFFFTFFALHFTFHAAFTAFFFLFTTFTFFFFHLHTFLFHTFLHT', 'FFFFHFTFFFHAFAFFFFFAHFTTHTLAFLLHFFTFFHATFHATHAFTTFFFFLTALATAFLHFFLFALFFFLTHALFFFTHTLFAFFLFAFFFLTAHHFTAFTTAFHFFLFFFHAFFFFHTTFTFFFFTFAAFHHFFHHFFAFAFFFFAHHALLTFFTLFFTFTFFTAFATTLTFFFFFTALFFATTTFAFTFLHHTTT', 'FHAFFFFFHFHFHAFHFFLFLFATFTFFFLFTTTTFHAFFLFFFHTHATFTHAFFHFFFAAFTLFAFHHFFFFFFFTFAFFLHFATFHFFAFFATLHAFFFTHTFTTFAFTTFFFAFFHFATTTLFTFFFTTFAFFTLTALFFTFATFTTFHFFTHFHTFFATFFLTHFFFTFTLFATFHFAFFTFAFFLTFFHFFAFFA', 'FAATAFFHFFFFFFFTAFHFFFFFFLTLALAFHFFTTFLTTLHFAFAAFFHTTFFHTALFFFTFAHHFLFTHHTTHHFAATFLFFHFFFLFLTFHTFTATAFTFFFFFHFLTFAFHFHFHFTTFFHHFAAHAHFTHFHFFATFATTFFHATLTFFAHFTFTHTFLTTHLFFFFFHFTTFLFTFHFFFTAFFHFAAFLLAT', 'FTFFTFFFFTFLFLFAFFFTFHFLFFFFAFFHTFFHFATFHHFATFTFFFFFHHLFFTLFFFAFTFFLFLFAFFHFFATTFHHTFTTFAFHTTLAHTFATFFHLTLTFHLFHTFFFFFFFLTTFFFTFALTFAFTHFTFHLFTLHTTFTFTHFFTFFFFFTFHFTFHHTAFAAFFFFFFTFHFHTTHFHHFTTTFTTAHA', 'FATTLAFFFFFTTFFATFHFAHFHAALLATTAFFLFFFAAHFFAHFLFFTFTFTAAFLFFHFALFFTTFFFTFTFHFFFLTFTAALATFHFATHFLFFTFFFFTLFFLTTLFFFFFHFATFTFFLFTAFTFTHLFFFFHFTTFHHATLFTAFAHFAFFFFLTFTHHFFAFFAFFTFFTFLTLLFFFATFFFFTFFFFFFA', 'HTTFFFTAFTLFTFFHALHTFLAFFAFAFFHHFTFHFFHFFFHHTTFFATTFLHHAFFHFAAAFFTFFAHFTAFFTFAHFTHAFTFAHLFHAFAFFHTFFFTFFFTFFLFFATFTFALALFFFFFFHHLFFTFATTTAFFAFFFTFAHFHHTALFFFFAFFFHTFTFFHTATAATFFHALHFLFFFTATTLFFTFFFTFH', 'FAFFHTHHAFFAFFFTAFFAFHFFFAFFAFTLFFFHFFFAHTTFFHTLFTTTHFTFFAHFTTAFAATFFFFTAFHLFTHFTFFAHATHFFFTFFFTHLFFFAAAFFTHFTFTHTFFTAHTFFTFFFHAFFHFAAFHTTFHLFLFFFFHFHHFFFAFFAFFAFFFFLFFFFTTTHHTFFTFFFLAHFFFFAFHFLFFLTFF', 'HFFFHFTFFTFFFAFAFFHFHFFFHFLTFFAFLAFFFFAFLFFFFHATFLHTTFTFFTFFATHFAHFFTFAFFFHFTFFTAAAFFFFFHFHTFFFAFLFAFFFAFTFFTAFAHFATTFFFFFFTFFHHFTFFHLHFAAFLTFHFFFFTFFTHTLFTLAFTTFAFTFAFLFAAAFHHFFFFHATALTFFFTAAFFFAFFLT', 'FFLFTFFATFFLAFTHFAHFTFATFAFHFTTFAFFFTFTFFAFAFHFFHHFHTFFLFTTTFFTFFFFTLTFFFFHAFFFFFAFFTTATHFFFFFTFFFALAFFFLHFFFHLFHFTFFFAHFAFAAFFFHFAFFAFFLFHFFFTFFAFFFFFTFFFLFFFTTFTTFFFHFFFTFFAFFHHAAFLTAFFAFTFFFHFFFAAH', 'FLFFATTFHTFLAHFLFTFTFFAFFTFTFHTLFHAFFFFFFAHFFFTTLAHATFLFFFFHFTHFFFHFTFFFHLFFFTAHFFHFTFHFAFHFFTTFTLFFATLTFFLATTFAAHTATFFFFTFFTFFFHFAFFTFFFHTFLFFFFTFFTFHLFFFTFTFFTFFAFFTFFHFHFFAFFTFFFATFFAFFTLAFAFFFTFFT', 'ALFTFFTHFTHTLFAAFAFAHFHALFFFLFFAFFFFLFLFFFLFTHFFTTTFTFFFFATHFAHFTTFFATFFFFFFHHTTFHFHFHHAFTFAFFFFTFFTLHFFFFFFFFFFAFHFAFFFAFAFHFLFHFAFFFFAHFFFTTLHFFHFFTHFTAFFFFFFHFFFFHLFAFFHFFLFFFLFFFLAFFFFHAHAFAFHFTFH', 'FAFFLAHFFHTFTFLFFFFTFFFTFHTFFFFFTFLAAFFFHFTAFFFFFFFFFFLAHFFAHHLFFFFFFFLHALFFFFATAFTLFFHFFFFHAHFATHFFFFHTFAFAHTFFAHTHHFAFFHAFTFFTFHHFFFHFATHTTTFHFFFFTATFTFFFFHFFTTTFFFFFFTTFLTFLHLFFFFFFHFAFAHFHLFLFLAHT', 'FLFLLTFHFFFAHFTTTFHFFTTTTFLFFLFAAFAFFFFLFFFFFFATAATHTFTFHHFTAFFFTALFFFHFAATAFFHTHTFTALFLAFHFFFFAAFHFFFFFFFTFFFHTFTHFAFFFHTFFTTFTHLFFFATTAFTFFFFHFFLFAHLFAFAFTFFFLHFFFFLFHFTTHAFATTFFLFTLFTHFTFHHATFLFFAF', 'HFTFFTFFTALFFFTHTHFFFAHFHTFAFFFFFFALHFAFFTTTAFFHATFAAFFFLFFAHFHAFFFHFFFHTFTFTHFFHATFLFLFFHFTFAFFTFTTFTFTTFFFTTFHFAFAFTFFTHAAFFHFFFFFLAFFFFFFFFFTFFATHAALATAFFATLHTHFFFALFFFFTHLFAFFATFTTHAHTTFTFFTHHAFTT', 'HTTFAFFFHFFTFFAFHTFFFTLFTAFLTFFFFLAFTLTTAATTFLFAFTFTTLFTFFFHFFLFAAHTFHFHTHFHTTFHTLHTTFTFAFLTFFFFTAFFLAHHFHFAFFFAFAFFTAFHAFTFHFHFFTHFFLTFAFTATLLAAHFFFLHTHFHLFTHLFTFLFFFFTATFHFTFTFATTFHLFLFAFHFHHTFTHAFA', 'FTFFTFHFFFFLFFFFFHFFFTAHAFLATFFHLFTFFTTHFAFFTFFFFFTFFFTFFFLFFTFHFAHTATFTFTTHFFFTTFHHLFLFAFHTTATFTTTFFFFTFTFFAFHFTFLFFFFFFFATFLFFFHFFLTFAHFFHHTTFFATFAAFFFAFFTLHHAATFLTTTAFATFTHTFHAATTAAFFAFFHHHLFFTTLFT', 'TFFFAFAFHFFFHFLTFFHATAAFTLTHHFFFHFFAFHFFFFTFTHFLAFFTHFHLLFTLFAHAHFAFAAFFFFLALFHATFTAHFTFFHFFHHFALAFTFFLFAFTFFFAFALFFTTATAFTFFFLTAFFTLFATHHALLFFTLFTTFHFFFFFAFFATFHHHTAFTAFFTHHHFFALFFFFAHTFFFFFFFLTFHFTT', 'HFTFAFFHHFTHHFFHFHFALFAFLAFHTFFFTLFFAFTFAHFFTLALATHFAHFFFFFAFAFHFFHAFFAHLTAHFAFFTFLFFAAATFFAFFFAHAHLTFAFTLFAFFTAFLLFATFFFFAFFHAFFHHFFFAHHHTHTTLFTFTHFFALFHFFFTFFFATFFFATHFTFFFFHHFATFLTTFTTFAFHFFFFAFTTT', 'AFFFFFHTTHAFFLFTFAFATFTFFFTFAATAHTTHTTFAFLHFFLAATFHFFFTFTTLFFAHFTTFFTTAFFFFATATTFFATFFTTFAFFLHFFFTFFTFFTLAHAFTFFAHFFTTFFALFTTFLFTFFHHFFFFAFFFHTFHFTTTFFFTLHLTFALFFLHTFTHLFFFAFTFLFHFFFLFAFFFAFFHTFTFAATF', 'TFHTTFFAFLFFTFFFFFTHFFLLTFFTFTLFFLHHATFFFHATHFFFAFHFLTFFFFFFFTFAHLFFLFFHFHHHFFFFTTFFTFFFLLFTFALFFFLFAFAALFFFTFFFFAATLAFHTALFFAFAFHTTFFFFAFAATHTFAFFATHFFAFFHHFFAFALFTTFLTTATHFFFLTAFTFFFFFFHFFHTFFATTTTA', 'ALFFTFTFTTFALAAFAFTFHLFTHFFFFTLFTTFLLFFHHFFFTLFAFFHFLHLLTLFTTFLAFATFFLLFHFFHLFFTHFAFAFFTAFFFLLLAFLFAHTHHFAFAHLFHFFTFHFFAFFLLLTFFFAFHTAHFLFLFFLFFHHLTFHHTTHLTFFATFTLFHFHFATFFLTLFFFFFFFLAFALFTHFAFAFTFFFT', 'FTATAAFLTHFFAFHALLTFFFFHFHLLATHFFFFTTFFTTFFFFLFFTFTTFFHATFFFFFTFTFFHFHLFHHATFHTHTHFLFLFFATFFFFHTFFFFLAHFFFTFLFFFLTFLHFLAFAFFHFFFLTHHHLLAFFLALHFFFTTATFFAFTFTLATFTTFLFHTFHATHFFFFFLLFFLFTTFTFFFFFAFHFHTLH', 'FHHFFFFFTALFATFTFFFFFFFFFLFFTFHLHFTTHLFFTTHFLAFFFFFFFFFLFFHTTFFTFTHAFAFFTFHATFFFTFTFFAAHAFTFTHLFFTFFFTLTHAFTAAFFHFAFFATFFFFFLAFFTFTHFTHFTFAFTFFATLHFHTTTHFHFTLFHLFHFFAHHLFTFFFLTAFTATTFFFFFFAFFFFFTTTAFF', 'FTFFTFFTFFFFTLFTLFFFHTFHLLFAHATTHFTFFLAAFFFFTFHAFTAHAHFTHLFAFTHHTFLFATFHLHTFFAFLFFFFFLTHFFFLTATHLFLLTFFATFFLHFFFHFLFFFFFFAAFFFFTFFHFTFFTTFFFAFTAFFTHFLFFLFFFFLAHTFFFHFFTLFFHFFFHFFFAFFFFFFTTAFFATAHFTHAF', 'TFTFTFFHFHFFFHFTFFFATFHFAATTAHLAFFTTHFATFLFFFFHTAFHTFHFFHFHFTFAFTHAFTFFAFFTFTAFAFFLATFFFAFFHFFFLTHFHTTFFFTTTFAATHFFTFTHFFFATAAFTFFFLLFALAHLTFLFLHFFFAHAFFFFFFFFAFTFLFTTLLFFHFFFLAFTFLAFTTFLFHHFFFTHTFAFF', 'FTTLFFLHHFTTFFHAFHTFFTFTFFTHFAFTTAHFATFFFFFFAFAFHFFFFFLTFHFFFFHFFTFFAHAFFAFFFHFATHFLFFFFTFLFTHHTHTHTTFFTAFHFTTFFAFTTFHALFFFHFTLFFFAHFTLTFAHTFFFHFAFFTTAAHFFLATHTFLFFAFAAAFTFHTFFFAFFLFTFFFTFFALFFAFFAFTF', 'HFAFLAFFFFFHAFAHFFFFFFTFLLTHLAFTHFFAFFFFFFFFFFFAHFTLFHFTTHFFAHFFAFATFFTHTFHFHHFHLHFLFFFFFFATAFFHFHFFAFTFFTFHFFFLFFFFHFTFTFTFAFFAFFHFFLHFHFAFATFFFTFTLFFFHHFFFFFHFFFFATFTHFAFFHFHFHFHFFHLHFHAAFTTFFFFFLFT', 'TFFHFTFFHFLTHTFFFFFTATFHFFFFFFLTFTFFFFTFFHLFFFFFFHLFAHFAFFATATHHLAFFHFFFTFFFFFLFTHTFFLFFTFFAFAFFFFFHFTFHFHTATFATAFFFHAFHTAALFTFFFLHLAHFFFLLHTFFHFHAAFFHFHFLFTTHFFATLFFHHFFTFFFHFFTFLFHFFTAAFFFLFTFFHTLHA', 'FFLTFFFFTFFFFFFLFFTTFLFFAFTHFFFFAAFFTFTHFFATFTFFFAHFFFFFAAATTFFAFAFHFLFHAFTHTAFFTFFHHFTTFTFFAFATFLAFAFHTLFTHFAAFALFHTAFFHALFFAFHFFFHFFLHFAHHTFTHFFFFTFHFHAAFLFTFHAALAFLFFFTHTTLTTLAAFFFFFHHTHAHFFFFFFFTF', 'HTTFFAFAHFTFFFLTFFTLLTTAHFTFHFFAFFLAFFATHFTFFFALLHFFTFFALFAFTFAFATTFFFFAFHAAAAFTFAFTFFAFTFFFFFFTTFFATTATFTFTFFFAHFFTFAFLAFFTFFHFFTHLFFTTHFFTFLFFHFFTAFFLAATFATFAATTFALFHHLFLFHLHFHHHFFLFTFAAFTFTTLFTFHAF', 'AAFFFFFTFFLFLFTHFTFAFFATFHHHHAFAFFFAFLHFTHHFHAHFFFHLAAFLFHFATFFFFHFLHFLFTTAAFFFFTFTTLFHFTFFFAFHTFLFLHFAATAFTFTHFHAFFTFFAHFFHFHTLFFFFLFHLFHTFLFFFHFAFFATFLFFAFAFFTFALFTAFFFHHTTTAFFHHFFTAAFTFFFFFFFFFFFAA', 'FFTFFFAFFFHFFTATHFFTTFALATHALAHHAFFHFFTTFFHAFAFFLHFHFFHHLHFFATHLLHFLAFAFFHLHAFFFFAATFFFFTLLHAFTLFFFFFFHAHLLTHFFFTFTALHATFHTAFFHFFHALFFFTTLHTAFFLFFFFFFFALFFFTTFALFFFFFTTFFTFFFTATHFTFFFTLFFFHTHHAFHAATTT', 'FFFFTAFTFLFFFHAHTLHLFAHTFLALAHFFLFHTFTTTFTAAFFFATFHHFHFFFAAFFTAHFFHFLHFHAFHAFFAFFHFFTHFTHHAFTATFATFHHTFFHATFFTTFAAFFFLTFTFFFTFFHTFFFFFHAHFFTAFFTHALTFTLHTFATHAFFTFFFFFTLFFTFFATFFFFFFAFTFHFFFTLAFHHFFFFT', 'LTFFFFLLFTFATFFFTFFTTFTFAFFFALFLFHFHTTHTAFFFFHFHHFHFTTFAHFAFATFFFFHHLFHTFFFFTFLATFLHLFTFFFTFAHFFAFFTTFFFFHFLFTTFHFHTTHHFFAAFAFFLFFAFTHFHFTFFHTFTTHAAALTLTFTTFLTFFAHTHFHTAFAFAAFFFHFFFLFLFFFFAHFATHAHTTHA', 'TTAFLFFTFFFFFTFATFFFLFTHFATFFFFTFTFALTFFFFFFHFFHFTFHTHTTFFFFFFFAFHFFHAFFFAFHAFFFTFHFTAATFFFFAFHAAFTLFTFLTFTTFATFTFHFLAFFFHTFFHLTTLFFFFLHHLFFAAFFFATTFFHLFFHFHFFFFFFFFLFHFTAFTFTHFFHFHAFFTTFFATFTTHFHFFTF', 'TFLTTFFTTHFHFHFHHAHHTTTFFFHLTFATAFHFFTATFHFHFTTAHTALFTLFFAFFFFFFHFAFHFFLHLFFAFFFFHFFHLFFHFHHFTFFHAFTLTFFATHFFFTFHFTHFFFHLFHTLAFHFFFTHATHAFFLTTHFFFFLFAFFFHFLFFTHTFTTFLFFFLFFFFFFHFFTFAAFHFFHFAATFTHHFFFF', 'TFLFFTFFLTHFHLAFHFTFFFAFFTTFTFFAFAHLTFFHFFFTFHFFFFTAAFTFHTFHFFTFHFHFTFFLLHFFTLHFLLLFTLFHFFFFTLHFFFFAFTFFFTHFTAAFLTFHLHFTTFAFFFFFFTFTTHHTTHTAHHHHAFFFAFFFFFFFFAFFTHTFTTLHLFFAFFFFATFFTTTFAAFFTFHLHFFTFFFF', 'TFHAHFFLTHHFHHFFHTFFFHFTTLFLHFAFFFFTFFAHTTTTHTFFLTATTAFFFTLFAHFFFAFFFHHHFHTATAFAAFFFFFAFFHHLFFTFLFFTFFTTFHFFFFFTHHAHTHFFHFFLAHLAFTFFFTAFHFFFTTHFFLLFAFFFFAHAFFHTFAHFFFTLFFTTAFAFFTHHFFFLAFAFFLTAFLFTFFFF', 'AFFHHHFHTHLTHFFFTFTAFFFHFFAAFFLFTFFFLATLAFFLAFFTFFHLTTFTFAFFFFAFFHAFHFFTTTFFFAFHFFAATFAAFTATHTFFTATHFTHTFFTFFFAFTFFFAFTFTFFFFLHFLFTFFFFFFFFFFFFFHFFFTLFFLFFFFFAFTFLFTFHFFLFLFTFFLFFFFFFLFTFLFFTTFFLTFAAF', 'FFLAFLAFFFFFFHALHFFFFFFLHFHFTATFAFFFTFFTLTAFAFATAFFFAFFFTLTAFFFFTTTFTFATFTAFFATAFFFTFFFAATLFFHATLFHHFLFHALFTHFLFHFAHLHLHFHFFFFLFFHFLFFFFAFFFTFFFFAFTHFFFFFTTTFFFTFFFFTFFHFFFATLFHFHFTTHFFFLFFFFFFHFFTFFF', 'LHFFFFFTFATAFFFFFFATFFHHTHFAFFFFTAFFAFFHTAFLHHFFFTFHFFHAFTTFHTFFFFHHFFFTTFAATFFFFFAHTFHFTFFAFTFLFFFFFATLTTFTFFFTHFTTAFFTLTAFFFFLLHHTLAATHTAFFTHLFALFFFFHFFFFHHAFFFFTFHFTLLLAHTFFFFFFFAFFTFFTFFAFLFLFHFFF', 'FAFTFFAFFAFLTAFFHATTFATFFFLFHTFTFAFHHAFHFTFFFFFFFFFFAFTFTLHFTFHFFATHFHHTHFFAFFAHFHFHFAFTLFHHAFLFLAFFLFALFLHFFATFFFFFTHLFTFFTFTLHFLFFTTFFHFAFFFHHAAAFTFFFLATFFFFAFTTFFHFFHAHHAFTFALFLAFFAAFFFFFFAFALLTFFF', 'FAFLHTFFTFFFFFALFTTTAATHFFFLHFTAFHFLLTHFFFFAFTTFFAFFFFHHFHFFTATAFFAHFHTFFTFFFFFLHFHFFTFFFLFTFHFFFFFFHFTTFAFHHFFFFFTLFFATFFFTTFFFALHFAAAFFFHFATHTFFTATTFFTFHFAHFFTFFFATHLFFFHFTFHFFHTFTFAFLFAALTFHFFFFFFH', 'FFTAFFFLFTFFFFHATFFFHFFLTFFLFALFTTTHFFHLTFFAAAFAFFFHFFFFFAFTFFAFTFTFFFHTFFLFFFFFTFAFLFTHFTFAFFTFTFHFTFTFAFTAHFFATFFHFHFFFFLTFTHFAFHHAALTTFTFAHLTFAAFFFAFFFFFFTFFFTFFFFLHAFFFTFFFLHLATFAAFFLLAFFHFFLFATFT', 'FTAFFFFHLFTTFFFFHHFFTHFFFFFALFFTLFFFFHFFTLFTFFFFFFFFLFFFAHFFFHFFHLFHHFTFFTFAFFFLAFFFHFFFFLLFFFAFAFFFHFLTHTFLFHLFFHHFAFHFHHFFTFLFHFHTFAFATFFFFFFFFFFFFHAFFFFAFFHATFFFFLAHFAFAFFFTFTATTAFTFATFFHTHFTTAFFTF', 'ATAHFFFFTTFHAFFAFFTFTHAFFFFLTFALFFFFTFFTHFAAHTAFFFAHTFTHATLTFTAHFLFTFHFLALTFFLAHFTFLFHFFTTFHFAFAFFFFFHHLHTFTFHFAHFFHTTFLFATFHFTAFFTTFFFFFLFFFAFLTFFFFFFLLAFLFATFFFAAAFHLFTFFFFFLTAFTLFFFHAFAHLFTTFFAFTFF', 'FFLATFFFTATFTHFTAAFTLFFTFTFFAFFFFAFHTAFAHLFFFLFFFFHFHFHFFHFFFAFFFFFAFALTFFAFTFAFAFALFFAFLTLTFTFTFFFFTFTHFTTALTFTFLATFFTFFFFFFFFHFTTLFFFTFLFFHTTTTAHTFLAHFHHLFLFFFFFHFFTLFHAFFFFTTTALFTFTTTFLAFFHHFFAFLAF', 'TAHFFFFLAFFTFFFLFTTTFFFFFLLTFTFFFAFAFFTFTFFFFFFFFTFTFFFLFFFFLAFFTFHFHFFAAAFAHAFFTFAFHFTFFFFFFTTAFFFFTAFFFFFFFFFTAFTFATFFFTFTFLFFFTATHFFTFFALFAAATFFFLTFHFFTTFFHFFFFFFFFAFFFFLFLTTFFAFFTFTHLFFFFFAFTAFALL', 'FTLLTFFLHFTFFHFTFFLHFFFTFHFAFFLFFTFFFFAFFFFHFFFFLFAFFAFTTFFFTFFHFFFATFFFLHTHFFFFFAAAAFFAHTTTAHALFTTTTFLTFTAHFHTLTHFLFFFFALLHFFAFFFFHAFHFFLFFFTFFFAFLHFAFHFLFFFTFTFFTFAFAFFTALFHAFFFFAHFAFFFFHATAAFLLAFFF', 'HHFFHFALFFFTHAFTHFHFFFFFFFHFFFFFHFFAHAFTHFFLTFTLFFAFHHTTHFFFFFFAFATFFAAAAFFLFFFHAAAFTFHLHTFHHTFFFFFFFFHHATTFFHLFHFFATHFFFTFFFHFFTFFHFLTTHTFHALTFTFFALFFFFFFATFFTFFTTHHTTFFTFFFHTFFLTTHFAHFLFAAFFFFFFFFFF', 'FFFFAAFTTFFAHFFLATFFLLHFFFFFHAFHFTTHFFTFFFFFFFTFATHTFHAFTHTTHFFTATTFFAFFFAFFALTAFFLTLLHFFFFAFTHTFFLHFFHFFAALAFFFLFFFFFFFFLLFTFFFFFHTFHFAFHFFFFFTATFFFFFFAFFTHFFFFAHFFFFAHTATTLHFAAFHFTFFTFTFFFFFFHFFATTF', 'FHFFFFHLTFHHHFFHLAFAFFFHFTHFALFFFAFFHAFLFFFFTAHFLHTFHFFTHTFFFAFAFFFLAHFHTHFAFFFAFFAFFHHFLLFFAFTFHFTFAFAFFFFTLTFFTAFTFATFHHFLLHFHHHATHFTFHFHFFFAHAAFTTLTAATFTATFFHAFFAFHFTAFFFTFFLFFFHFFATTHLFLHAFTFFFALF', 'HTFFAFTTTTAFFFTTFHAHFFFFAAFFFFFAAFLFTHTFFFAFHAFFAATTFFFFFTHFHAFATLFFALHFHAFTAFTTFFHFLFHHFFFFHHFTTFFLHTFFFFLFFFHFFTFFLLTFFAFLTFFAFFLFLALFAFLTTFAFFFLATTTFHFFFFTATFFFTFHFHAFTFAFTTFTTFFFFFTFLTFFLTTFAFFTHF', 'ATHFLFAFFATFAHFTHLTFAAFFHTFFTAFFFLAAFHHAHFFFTFTFAFFFFHFAAFFFHFFHFFLTFTALFTFFTFFFTHFLHTFFFFFFFFFALTTFFHFFFFFAFLFFFTFFLFHAATFAFHTHAFTFFHTFFTFTHTTTAFTLHFFLTHTAFFAFAHALTFFFHTHTFFFFHFFFFAAFLFTFHFFHFLTFFFTL', 'FAHFATLFTFFFFTAFFHFFLHAAFFFTFHHAAAFFHALHFFFFFFHHFHAAAFATFFFLLLFFFTFFTALFLFTHTTTTHAFHTTFLFFLFHTFFFLLFFTTFAFFFHFFHFATFAFFFFLFHATAFFAATFATFAFFFLFFFTFTFHTTTAHFFLLATHTFAHFAFATFTFFFFLHTFTHFTFLFAFFFFFFATFHFF', 'FFFFTATFATFFTFFAATTFTFHTFFFTLHFHHFFFFTFFFFHFFHHFFLTFFLFFHFFTHTFLTATLFFFAAFHFAFFFLFTFFTLLHFFHFFFFFHFFFFFAFFFHFHFFFLLFTHFFFHTFFTFFFFFFFFTTTFFFFFFFFFLAFFFAFTAFFTFTLTFFFFFFAAFFFFFFTFFAFFLFTHFFFAFHFTTAFTLF', 'FAHLFTFFFTTHFTHLFFFTTFHLFFFTFLAFLFHTTFTFFFFFFFFFFTTAFHATTTFAFFFFTFLFTFFFTLFFHTALHAFLAFTTTFTLHTFTLFHHLFHFHAFFFTFLLLFTFAFLFTFLHFTLAFFLAFHHFTHFFHHFFHAFTTLFAATTTFLLFFHFHFFTFTTFALTFTFHAFFATFFLHFTATAFFTFLHG'],
-}
-env = CampusEnv(MAPS["10x10_9"])
-agent = UCSAgent()
-agent.search(env)
+    def __init__(self, observer: SearchObserver = None):
+        self.hidden_dwarf = WeightedAStarAgent(observer=observer)
+
+    def search(self, env: CampusEnv, start=None, deadline=None) -> Tuple[List[int], float, int]:
+        return self.hidden_dwarf.search(env, 0.5, start, deadline)
+
+
+MAPS = MapStore()
+
+
+if __name__ == "__main__":
+    env = CampusEnv(MAPS["10x10_9"])
+    actions, total_cost, expanded = UCSAgent().search(env)
+    print(f"Total cost: {total_cost}, expanded: {expanded}")
+    print_solution(actions, env)
@@ -0,0 +1,108 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from CampusEnv import CampusEnv
+from Algorithms import (MAPS, AStarAgent, CampusGraph, CampusHeuristic, DFSGAgent, SearchTimeout, UCSAgent,
+                        WeightedAStarAgent)
+
+
+class Job(NamedTuple):
+    map_name: str
+    agent: str  # "DFSG", "UCS", "AStar" or "WAStar"
+    h_weight: Optional[float] = None  # WAStar only
+    start: Optional[int] = None  # defaults to the map's S tile
+    timeout: Optional[float] = None  # seconds
+
+
+class JobResult(NamedTuple):
+    index: int
+    job: Job
+    status: str  # "ok", "no path", "timeout" or "error"
+    actions: Optional[List[int]]
+    cost: Optional[float]
+    expanded: Optional[int]
+    time: float
+    error: Optional[str] = None
+
+
+def run_job(env: CampusEnv, job: Job):
+    deadline = None if job.timeout is None else time.perf_counter() + job.timeout
+    if job.agent == "DFSG":
+        return DFSGAgent().search(env, job.start, deadline)
+    if job.agent == "UCS":
+        return UCSAgent().search(env, job.start, deadline)
+    if job.agent == "AStar":
+        return AStarAgent().search(env, job.start, deadline)
+    if job.agent == "WAStar":
+        return WeightedAStarAgent().search(env, job.h_weight, job.start, deadline)
+    raise ValueError(f"Unknown agent {job.agent!r}")
+
+
+# Per-worker state: the compiled maps received once at startup, and the envs built from them
+_compiled = {}
+_envs = {}
+
+
+def _init_worker(compiled: Dict[str, tuple]) -> None:
+    _compiled.update(compiled)
+
+
+def _worker_env(map_name: str) -> CampusEnv:
+    if map_name not in _envs:
+        desc, graph, heuristic = _compiled[map_name]
+        env = CampusEnv(desc)
+        graph.bind(env)
+        heuristic.bind(env)
+        _envs[map_name] = env
+    return _envs[map_name]
+
+
+def _solve(index: int, job: Job) -> JobResult:
+    start = time.perf_counter()
+    try:
+        result = run_job(_worker_env(job.map_name), job)
+    except SearchTimeout:
+        return JobResult(index, job, "timeout", None, None, None, time.perf_counter() - start)
+    except Exception as e:
+        return JobResult(index, job, "error", None, None, None, time.perf_counter() - start, repr(e))
+    elapsed = time.perf_counter() - start
+    if result is None:
+        return JobResult(index, job, "no path", None, None, None, elapsed)
+    actions, cost, expanded = result
+    return JobResult(index, job, "ok", list(actions), cost, expanded, elapsed)
+
+
+def compile_maps(names: Iterable[str], maps=MAPS) -> Dict[str, tuple]:
+    """(rows, CampusGraph, CampusHeuristic) for each named map."""
+    compiled = {}
+    for name in names:
+        env = CampusEnv(maps[name])
+        compiled[name] = (maps[name], CampusGraph.of(env), CampusHeuristic.of(env))
+    return compiled
+
+
+def solve_batch(jobs: List[Job], maps=MAPS, workers: int = None) -> Iterator[JobResult]:
+    """Solves the jobs on a process pool, yielding each result as soon as it finishes.
+
+    Every map is compiled once here and shipped to each worker once, when the worker starts, so
+    jobs only carry their parameters. Results carry the job's index in jobs, since they arrive in
+    completion order. A job's timeout is enforced inside the search, which gives up cleanly and
+    frees the worker for the next job.
+    """
+    compiled = compile_maps(dict.fromkeys(job.map_name for job in jobs), maps)
+    with ProcessPoolExecutor(workers or os.cpu_count(), initializer=_init_worker, initargs=(compiled,)) as pool:
+        futures = [pool.submit(_solve, index, job) for index, job in enumerate(jobs)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+if __name__ == "__main__":
+    jobs = [Job(name, agent) for name in MAPS for agent in ("DFSG", "UCS", "AStar")]
+    jobs += [Job(name, "WAStar", weight) for name in MAPS for weight in (0.6, 0.75, 0.9)]
+    start = time.perf_counter()
+    for result in solve_batch(jobs):
+        print(f"{result.job.map_name:>10} {result.job.agent:>6} {result.job.h_weight or '':>4} "
+              f"{result.status:>8} cost={result.cost} expanded={result.expanded} {result.time:.4f}s")
+    print(f"{len(jobs)} jobs in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,132 @@
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+from CampusEnv import CampusEnv
+from Algorithms import MAPS, AStarAgent, CampusGraph, CampusHeuristic, DFSGAgent, UCSAgent, WeightedAStarAgent
+
+
+TILE_FREQUENCIES = {"F": 45, "T": 15, "A": 12, "L": 12, "H": 10, "P": 6}
+
+
+def random_map(nrow: int, ncol: int, seed: int) -> List[str]:
+    """A reproducible random map with S in the top-left corner and a G in the bottom-right."""
+    rng = random.Random(seed)
+    tiles = rng.choices(list(TILE_FREQUENCIES), weights=list(TILE_FREQUENCIES.values()), k=nrow * ncol)
+    tiles[0] = "S"
+    tiles[-1] = "G"
+    return ["".join(tiles[row * ncol:(row + 1) * ncol]) for row in range(nrow)]
+
+
+def agents(weights) -> Dict[str, object]:
+    result = {
+        "DFSG": lambda env: DFSGAgent().search(env),
+        "UCS": lambda env: UCSAgent().search(env),
+        "AStar": lambda env: AStarAgent().search(env),
+    }
+    for weight in weights:
+        result[f"WAStar_{weight}"] = lambda env, weight=weight: WeightedAStarAgent().search(env, weight)
+    return result
+
+
+def measure(search, env: CampusEnv, repeat: int) -> dict:
+    tracemalloc.start()
+    result = search(env)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search(env)
+        times.append(time.perf_counter() - start)
+    return {
+        "time": min(times),
+        "expanded": result[2] if result else None,
+        "cost": result[1] if result else None,
+        "length": len(result[0]) if result else None,
+        "peak_memory": peak,
+    }
+
+
+def run(maps: Dict[str, List[str]], weights, repeat: int) -> dict:
+    results = {}
+    for name, desc in maps.items():
+        env = CampusEnv(desc)
+        start = time.perf_counter()
+        CampusGraph.of(env)
+        CampusHeuristic.of(env)
+        results[name] = {"compile_time": time.perf_counter() - start}
+        for agent, search in agents(weights).items():
+            results[name][agent] = measure(search, env, repeat)
+            print(f"{name:>12} {agent:>12} {json.dumps(results[name][agent])}", file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, time_tolerance: float, time_slack: float,
+            memory_tolerance: float) -> List[str]:
+    """Regressions of results against baseline. Expansion counts, costs and path lengths must match
+    exactly, in either direction, since a cheaper UCS or A* path means the baseline or the search
+    is wrong; rerun with --save-baseline after an intended change. Time may grow by time_tolerance
+    (plus time_slack seconds for noise) and peak memory by memory_tolerance."""
+    regressions = []
+    for name, agents_ in baseline.items():
+        for agent, old in agents_.items():
+            if agent == "compile_time":
+                continue
+            new = results.get(name, {}).get(agent)
+            if new is None:
+                continue
+            where = f"{name}/{agent}"
+            for key in ("expanded", "cost", "length"):
+                if new[key] != old.get(key):
+                    regressions.append(f"{where}: {key} {old.get(key)} -> {new[key]}")
+            if new["time"] > old["time"] * (1 + time_tolerance) + time_slack:
+                regressions.append(f"{where}: time {old['time']:.4f}s -> {new['time']:.4f}s")
+            if new["peak_memory"] > old["peak_memory"] * (1 + memory_tolerance):
+                regressions.append(f"{where}: peak memory {old['peak_memory']} -> {new['peak_memory']}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the HW1 agents over MAPS and random maps.")
+    parser.add_argument("--maps", nargs="*", help="map names to run (default: all of MAPS)")
+    parser.add_argument("--weights", nargs="*", type=float, default=[0.6, 0.75, 0.9])
+    parser.add_argument("--random", nargs="*", type=int, default=[], metavar="SIZE",
+                        help="also run random SIZExSIZE maps, e.g. --random 1000")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against this JSON baseline and fail on regressions")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline instead")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative growth in time")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="allowed relative growth in peak memory")
+    parser.add_argument("--slack", type=float, default=0.005)
+    args = parser.parse_args(argv)
+
+    maps = {name: MAPS[name] for name in (args.maps or MAPS)}
+    for size in args.random:
+        maps[f"random_{size}x{size}_{args.seed}"] = random_map(size, size, args.seed)
+    results = run(maps, args.weights, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+    elif args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance, args.slack, args.memory_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import json
+import os
+from collections.abc import Mapping
+from typing import Dict, List
+
+import numpy as np
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TILES_PATH = os.path.join(HERE, "maps.bin")
+INDEX_PATH = os.path.join(HERE, "maps.json")
+
+
+class MapStore(Mapping):
+    """Read-only mapping from map name to map rows, backed by an on-disk tile store.
+
+    Every map is a row-major uint8 grid of tile letters in one flat file, and the JSON index gives
+    each map's offset and shape. Nothing is read until the first lookup: the index is loaded then,
+    the tile file is memory-mapped, and each map is decoded once on its own first access.
+    """
+
+    def __init__(self, tiles_path: str = TILES_PATH, index_path: str = INDEX_PATH) -> None:
+        self.tiles_path = tiles_path
+        self.index_path = index_path
+        self._index = None
+        self._tiles = None
+        self._maps = {}
+
+    @property
+    def index(self) -> Dict[str, List[int]]:
+        if self._index is None:
+            with open(self.index_path) as file:
+                self._index = json.load(file)
+        return self._index
+
+    def grid(self, name: str) -> np.ndarray:
+        """The map as a (nrow, ncol) uint8 view into the memory-mapped tile file."""
+        offset, nrow, ncol = self.index[name]
+        if self._tiles is None:
+            self._tiles = np.memmap(self.tiles_path, dtype=np.uint8, mode="r")
+        return self._tiles[offset:offset + nrow * ncol].reshape(nrow, ncol)
+
+    def __getitem__(self, name: str) -> List[str]:
+        if name not in self._maps:
+            self._maps[name] = [row.tobytes().decode("ascii") for row in self.grid(name)]
+        return self._maps[name]
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+def write_map_store(maps: Dict[str, List[str]], tiles_path: str = TILES_PATH, index_path: str = INDEX_PATH) -> None:
+    index = {}
+    offset = 0
+    with open(tiles_path, "wb") as file:
+        for name, rows in maps.items():
+            grid = np.array([list(row.encode("ascii")) for row in rows], dtype=np.uint8)
+            file.write(grid.tobytes())
+            index[name] = [offset, grid.shape[0], grid.shape[1]]
+            offset += grid.size
+    with open(index_path, "w") as file:
+        file.write("{\n" + ",\n".join(f"  {json.dumps(name)}: {json.dumps(entry)}" for name, entry in index.items()) + "\n}\n")
@@ -0,0 +1,136 @@
+import time
+from collections import Counter
+from typing import List
+
+from CampusEnv import CampusEnv
+from Algorithms import SearchObserver, print_solution
+
+
+class Observers(SearchObserver):
+    """Fans every event out to several observers."""
+
+    def __init__(self, *observers: SearchObserver) -> None:
+        self.observers = observers
+
+    def on_expand(self, state, g, open_size) -> None:
+        for observer in self.observers:
+            observer.on_expand(state, g, open_size)
+
+    def on_generate(self, state, parent, action, g) -> None:
+        for observer in self.observers:
+            observer.on_generate(state, parent, action, g)
+
+    def on_reopen(self, state, g) -> None:
+        for observer in self.observers:
+            observer.on_reopen(state, g)
+
+    def on_goal(self, state, actions, cost, expanded) -> None:
+        for observer in self.observers:
+            observer.on_goal(state, actions, cost, expanded)
+
+
+class ExpansionCounter(SearchObserver):
+    """Counts events, and how many times each state was expanded."""
+
+    def __init__(self) -> None:
+        self.expanded = 0
+        self.generated = 0
+        self.reopened = 0
+        self.per_state = Counter()
+
+    def on_expand(self, state, g, open_size) -> None:
+        self.expanded += 1
+        self.per_state[state] += 1
+
+    def on_generate(self, state, parent, action, g) -> None:
+        self.generated += 1
+
+    def on_reopen(self, state, g) -> None:
+        self.reopened += 1
+
+
+class OpenHighWater(SearchObserver):
+    """Largest open list (or DFS branch) seen at an expansion."""
+
+    def __init__(self) -> None:
+        self.high_water = 0
+
+    def on_expand(self, state, g, open_size) -> None:
+        if open_size > self.high_water:
+            self.high_water = open_size
+
+
+class PhaseTimer(SearchObserver):
+    """Splits wall time between selecting the next node and generating its children.
+
+    Time since the previous event is charged to "select" when it ends in an expansion and to
+    "generate" when it ends in a generated or reopened child.
+    """
+
+    def __init__(self) -> None:
+        self.phases = {"select": 0.0, "generate": 0.0}
+        self.last = None
+
+    def _charge(self, phase) -> None:
+        now = time.perf_counter()
+        if self.last is not None:
+            self.phases[phase] += now - self.last
+        self.last = now
+
+    def on_expand(self, state, g, open_size) -> None:
+        self._charge("select")
+
+    def on_generate(self, state, parent, action, g) -> None:
+        self._charge("generate")
+
+    def on_reopen(self, state, g) -> None:
+        self._charge("generate")
+
+    def on_goal(self, state, actions, cost, expanded) -> None:
+        self._charge("select")
+
+
+class TraceRecorder(SearchObserver):
+    """Records the event stream so a search can be inspected or replayed after it finishes."""
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def on_expand(self, state, g, open_size) -> None:
+        self.events.append(("expand", state, g))
+
+    def on_generate(self, state, parent, action, g) -> None:
+        self.events.append(("generate", state, parent, action, g))
+
+    def on_reopen(self, state, g) -> None:
+        self.events.append(("reopen", state, g))
+
+    def on_goal(self, state, actions, cost, expanded) -> None:
+        self.events.append(("goal", state, list(actions), cost))
+
+    def expansion_paths(self, initial_state) -> List[List[int]]:
+        """The action list leading to each expanded node, in expansion order."""
+        parent = {initial_state: None}
+        action = {}
+        paths = []
+        for event in self.events:
+            if event[0] == "generate":
+                parent[event[1]] = event[2]
+                action[event[1]] = event[3]
+            elif event[0] == "expand":
+                path = []
+                state = event[1]
+                while parent[state] is not None:
+                    path.append(action[state])
+                    state = parent[state]
+                path.reverse()
+                paths.append(path)
+        return paths
+
+    def replay(self, env: CampusEnv, sleep=0.1, arglist: list=[]) -> None:
+        """Renders every expanded node's path with print_solution, then the solution."""
+        for path in self.expansion_paths(env.get_initial_state()):
+            print_solution(path, env, sleep, arglist)
+        for event in self.events:
+            if event[0] == "goal":
+                print_solution(event[2], env, sleep, arglist)
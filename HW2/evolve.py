@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from WarehouseEnv import WarehouseEnv
+from submission import DNA, GA_WEIGHTS, AgentAlphaBeta, AgentGreedyImproved
+
+
+NUM_FEATURES = len(GA_WEIGHTS)
+FEATURE_MIN, FEATURE_MAX = 0, 100
+
+
+class Game(NamedTuple):
+    first: int  # population index of robot 0
+    second: int  # population index of robot 1
+    seed: int  # board seed
+
+
+def make_dna(weights) -> DNA:
+    dna = DNA(NUM_FEATURES, FEATURE_MIN, FEATURE_MAX)
+    dna.features = list(weights)
+    return dna
+
+
+def make_agent(dna: DNA, agent: str, node_limit: Optional[int] = None):
+    if agent == "greedy":
+        result = AgentGreedyImproved()
+        result.DNA = dna
+        return result
+    if agent == "alphabeta":
+        return AgentAlphaBeta(node_limit=node_limit, dna=dna)
+    raise ValueError(f"Unknown agent {agent!r}")
+
+
+def play_game(agents, seed: int, count_steps: int, time_limit: Optional[float] = 1.0, on_move=None) -> List[int]:
+    """Plays one game on the board generated from seed and returns the robots' balances.
+    on_move(robot_id, agent, operator, seconds) is called after every move, if given."""
+    env = WarehouseEnv()
+    env.generate(seed, 2 * count_steps)
+    while not env.done():
+        for i, agent in enumerate(agents):
+            if env.done():
+                break
+            start = time.perf_counter()
+            operator = agent.run_step(env, i, time_limit)
+            if on_move is not None:
+                on_move(i, agent, operator, time.perf_counter() - start)
+            env.apply_operator(i, operator)
+    return env.get_balances()
+
+
+def _play(job) -> List[int]:
+    first, second, seed, count_steps, agent, node_limit, time_limit = job
+    agents = [make_agent(make_dna(first), agent, node_limit), make_agent(make_dna(second), agent, node_limit)]
+    return play_game(agents, seed, count_steps, time_limit)
+
+
+def schedule(size: int, games: int, seed: int) -> List[Game]:
+    """games pairings per DNA against random opponents, each played once from either side of the
+    same board so neither DNA gains from the start position."""
+    rng = random.Random(seed)
+    result = []
+    for first in range(size):
+        for _ in range(games):
+            second = rng.randrange(size - 1)
+            second += second >= first
+            board = rng.randrange(2 ** 31)
+            result.append(Game(first, second, board))
+            result.append(Game(second, first, board))
+    return result
+
+
+def score(size: int, games: List[Game], balances: List[List[int]]) -> Tuple[List[float], List[int]]:
+    """Each DNA's points per game played (1 for a win, 0.5 for a draw), and its total credit
+    margin, which breaks ties between equal points."""
+    points = [0.0] * size
+    played = [0] * size
+    margins = [0] * size
+    for game, (first, second) in zip(games, balances):
+        for index, margin in ((game.first, first - second), (game.second, second - first)):
+            played[index] += 1
+            margins[index] += margin
+            if margin > 0:
+                points[index] += 1
+            elif margin == 0:
+                points[index] += 0.5
+    return [points[i] / played[i] if played[i] else 0.0 for i in range(size)], margins
+
+
+def next_generation(population: List[DNA], fitness: List[float], margins: List[int], elite: int) -> List[DNA]:
+    """Keeps the elite unchanged and breeds the rest with DNA.crossover, which also mutates, from
+    parents drawn out of the better half."""
+    ranked = sorted(range(len(population)), key=lambda i: (-fitness[i], -margins[i]))
+    parents = [population[i] for i in ranked[:max(2, len(population) // 2)]]
+    children = [make_dna(population[i].features) for i in ranked[:elite]]
+    while len(children) < len(population):
+        mother, father = random.sample(parents, 2)
+        children.append(mother.crossover(father))
+    return children
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    temp = path + ".tmp"
+    with open(temp, "w") as file:
+        json.dump(state, file, indent=2)
+    os.replace(temp, path)
+
+
+def evolve(size=16, generations=10, games=4, count_steps=100, agent="greedy", node_limit=None, time_limit=1.0,
+           elite=2, seed=None, workers=None, checkpoint=None, resume=False):
+    """Runs the GA and returns the final population, best first.
+
+    Every generation's board draws and breeding are seeded from seed and the generation number,
+    and results are gathered in schedule order, so a run is reproducible on any number of workers
+    as long as the agents are (greedy, or alphabeta with a node_limit and no time_limit). The
+    population is written to checkpoint after every generation, and resume continues from it with
+    the checkpoint's seed; seed defaults to it, and to 0 for a new run.
+    """
+    if resume and checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as file:
+            state = json.load(file)
+        if seed is not None and seed != state["seed"]:
+            raise ValueError(f"{checkpoint} was run with seed {state['seed']}, not {seed}")
+        seed = state["seed"]
+        population = [make_dna(weights) for weights in state["population"]]
+    else:
+        if size < 2:
+            raise ValueError(f"A population needs at least 2 DNAs to pair and breed, got {size}")
+        seed = 0 if seed is None else seed
+        random.seed(seed)
+        population = [make_dna(GA_WEIGHTS)] + [DNA(NUM_FEATURES, FEATURE_MIN, FEATURE_MAX) for _ in range(size - 1)]
+        state = {"seed": seed, "generation": 0, "population": [dna.features for dna in population], "history": []}
+
+    with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+        while state["generation"] < generations:
+            generation = state["generation"]
+            start = time.perf_counter()
+            games_ = schedule(len(population), games, seed * 1000003 + generation)
+            jobs = [(population[game.first].features, population[game.second].features, game.seed, count_steps,
+                     agent, node_limit, time_limit) for game in games_]
+            balances = list(pool.map(_play, jobs, chunksize=max(1, len(jobs) // (4 * (workers or os.cpu_count())))))
+            fitness, margins = score(len(population), games_, balances)
+            elapsed = time.perf_counter() - start
+            best = max(range(len(population)), key=lambda i: (fitness[i], margins[i]))
+            state["history"].append({"generation": generation, "best": fitness[best], "mean": sum(fitness) / len(fitness),
+                                     "best_weights": population[best].features, "games": len(jobs), "time": elapsed})
+            print(f"generation {generation}: best {fitness[best]:.3f} mean {sum(fitness) / len(fitness):.3f} "
+                  f"{len(jobs)} games in {elapsed:.2f}s ({len(jobs) / elapsed:.1f} games/s)", file=sys.stderr)
+
+            random.seed(seed * 1000003 + generation)
+            population = next_generation(population, fitness, margins, elite)
+            state["generation"] = generation + 1
+            state["population"] = [dna.features for dna in population]
+            if checkpoint:
+                save_checkpoint(checkpoint, state)
+    return population
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Evolve smart_heuristic weights by parallel self-play.")
+    parser.add_argument("--population", type=int, default=16)
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--games", type=int, default=4, help="pairings per DNA per generation, each played twice")
+    parser.add_argument("--steps", type=int, default=100, help="count_steps of every game")
+    parser.add_argument("--agent", choices=["greedy", "alphabeta"], default="greedy")
+    parser.add_argument("--node-limit", type=int, help="alphabeta node budget per move; replaces the time limit")
+    parser.add_argument("--time-limit", type=float, default=1.0)
+    parser.add_argument("--elite", type=int, default=2)
+    parser.add_argument("--seed", type=int, help="default 0, or the checkpoint's with --resume")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--checkpoint", default="evolve.json")
+    parser.add_argument("--resume", action="store_true")
+    args = parser.parse_args(argv)
+    if args.population < 2:
+        parser.error("--population must be at least 2")
+
+    population = evolve(args.population, args.generations, args.games, args.steps, args.agent, args.node_limit,
+                        None if args.node_limit else args.time_limit, args.elite, args.seed, args.workers,
+                        args.checkpoint, args.resume)
+    print(json.dumps(population[0].features))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import argparse
+import json
+import math
+import random
+import sys
+from typing import Dict, List
+
+from evolve import play_game
+from submission import (AgentAlphaBeta, AgentExpectimax, AgentGreedyImproved, AgentMinimax,
+                        AgentParallelAlphaBeta)
+
+
+AGENTS = {
+    "greedy": AgentGreedyImproved,
+    "minimax": AgentMinimax,
+    "alphabeta": AgentAlphaBeta,
+    "expectimax": AgentExpectimax,
+    "parallel": AgentParallelAlphaBeta,
+}
+
+
+def wilson(score: float, games: int, z: float = 1.96):
+    """Wilson score interval of a win rate measured over games."""
+    if games == 0:
+        return 0.0, 1.0
+    center = (score + z * z / (2 * games)) / (1 + z * z / games)
+    half = z / (1 + z * z / games) * math.sqrt(score * (1 - score) / games + z * z / (4 * games * games))
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def summarize(moves: List[dict], wins: int, draws: int, losses: int) -> dict:
+    games = wins + draws + losses
+    score = (wins + 0.5 * draws) / games if games else 0.0
+    low, high = wilson(score, games)
+    searched = [move for move in moves if "nodes" in move]
+    nodes = sum(move["nodes"] for move in searched)
+    search_time = sum(move["time"] for move in searched)
+    result = {"games": games, "wins": wins, "draws": draws, "losses": losses, "score": score,
+              "score_95": [low, high], "moves": len(moves),
+              "mean_move_time": sum(move["seconds"] for move in moves) / len(moves) if moves else None,
+              "max_move_time": max((move["seconds"] for move in moves), default=None),
+              "none_moves": sum(move["operator"] is None for move in moves)}
+    if searched:
+        rates = [move["tt_hit_rate"] for move in searched if move["tt_hit_rate"] is not None]
+        cutoffs = [move["cutoff_rate"] for move in searched if move["cutoff_rate"] is not None]
+        result.update({"mean_depth": sum(move["depth"] for move in searched) / len(searched),
+                       "nodes_per_second": nodes / search_time if search_time else None,
+                       "leaves": sum(move["leaves"] for move in searched),
+                       "tt_hit_rate": sum(rates) / len(rates) if rates else None,
+                       "cutoff_rate": sum(cutoffs) / len(cutoffs) if cutoffs else None,
+                       "fallbacks": sum(move["fallback"] for move in searched)})
+    return result
+
+
+def match(first: str, second: str, boards: int, time_limit: float, count_steps: int = 100, seed: int = 0) -> Dict[str, dict]:
+    """Plays first against second on seeded boards, each board once from either side.
+
+    Games run one at a time so the agents never compete for cores during a move. Every move's
+    telemetry comes from the agent's SearchControl.report(); agents without one only record their
+    move and its time.
+    """
+    rng = random.Random(seed)
+    seeds = [rng.randrange(2 ** 31) for _ in range(boards)]
+    names = [first, second] if first != second else [first + "_0", second + "_1"]
+    agents = {names[0]: AGENTS[first](), names[1]: AGENTS[second]()}
+    moves = {name: [] for name in names}
+    outcomes = {name: [0, 0, 0] for name in names}
+
+    for board in seeds:
+        for order in (names, names[::-1]):
+            def on_move(robot_id, agent, operator, seconds, order=order):
+                move = {"operator": operator, "seconds": seconds}
+                if hasattr(agent, "control"):
+                    move.update(agent.control.report(getattr(agent, "table", None)))
+                moves[order[robot_id]].append(move)
+
+            balances = play_game([agents[name] for name in order], board, count_steps, time_limit, on_move)
+            for robot_id, name in enumerate(order):
+                margin = balances[robot_id] - balances[1 - robot_id]
+                outcomes[name][0 if margin > 0 else 1 if margin == 0 else 2] += 1
+            print(f"board {board}: {order[0]} {balances[0]} - {balances[1]} {order[1]}", file=sys.stderr)
+
+    for agent in agents.values():
+        if hasattr(agent, "close"):
+            agent.close()
+    return {name: summarize(moves[name], *outcomes[name]) for name in names}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Play two HW2 agents against each other and report strength and search telemetry.")
+    parser.add_argument("first", choices=list(AGENTS))
+    parser.add_argument("second", choices=list(AGENTS))
+    parser.add_argument("--boards", type=int, default=10, help="seeded boards, each played from both sides")
+    parser.add_argument("--time-limit", type=float, default=1.0)
+    parser.add_argument("--steps", type=int, default=100, help="count_steps of every game")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = match(args.first, args.second, args.boards, args.time_limit, args.steps, args.seed)
+    for name, result in results.items():
+        low, high = result["score_95"]
+        line = (f"{name:>12}: {result['wins']}W {result['draws']}D {result['losses']}L  "
+                f"score {result['score']:.3f} [{low:.3f}, {high:.3f}]")
+        if "mean_depth" in result:
+            line += (f"  depth {result['mean_depth']:.1f}  {result['nodes_per_second'] or 0:.0f} nodes/s  "
+                     f"tt hits {result['tt_hit_rate'] or 0:.1%}  cutoffs {result['cutoff_rate'] or 0:.1%}  "
+                     f"fallbacks {result['fallbacks']}")
+        print(line + f"  max move {result['max_move_time']:.3f}s  none {result['none_moves']}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
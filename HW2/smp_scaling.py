@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+
+from WarehouseEnv import WarehouseEnv
+from submission import AgentParallelAlphaBeta
+
+
+def scaling(workers, seeds, time_limit: float, count_steps: int = 100):
+    """Mean completed depth and nodes per second of one AgentParallelAlphaBeta move, per worker count."""
+    results = {}
+    for count in workers:
+        agent = AgentParallelAlphaBeta(count)
+        depths, rates = [], []
+        for seed in seeds:
+            env = WarehouseEnv()
+            env.generate(seed, 2 * count_steps)
+            agent.run_step(env, 0, time_limit)
+            depths.append(agent.stats["depth"])
+            rates.append(agent.stats["nodes_per_second"])
+        agent.close()
+        results[count] = (sum(depths) / len(depths), sum(rates) / len(rates))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Depth and nodes/s of Lazy SMP alpha-beta from 1 to N workers.")
+    parser.add_argument("--workers", nargs="*", type=int, default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--seeds", type=int, default=5)
+    parser.add_argument("--time-limit", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    results = scaling(sorted(set(args.workers)), range(args.seeds), args.time_limit)
+    base = results[min(results)][1]
+    print(f"{os.cpu_count()} cores available; workers beyond that only share them")
+    for count, (depth, rate) in results.items():
+        print(f"{count:>3} workers: depth {depth:5.1f}  {rate:9.0f} nodes/s  x{rate / base:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
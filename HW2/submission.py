@@ -1,257 +1,1017 @@
-from Agent import Agent, AgentGreedy
-from WarehouseEnv import WarehouseEnv, manhattan_distance
-import random
-import func_timeout
-
-
-
-def smart_heuristic(env: WarehouseEnv, robot_id: int, dna):
-    # Get details about the robots
-    robot = env.get_robot(robot_id)
-    other_robot = env.get_robot((robot_id + 1) % 2)
-    bat_percent = robot.battery / 20
-    charger_gain = (min(20, bat_percent + robot.credit) - bat_percent)
-
-    # Endgame?
-    if env.done():
-        return float("inf") if robot.credit-other_robot.credit > 0 else -float("inf")
-
-    # Weight of each marker
-    marker_weights = {                             # These weights were generated using a genetic algorithm
-        "delta_credit": 47.470865087833594,
-        "delta_battery": 77.19133774735107,
-        "delta_pack": 51.244108828398836,
-        "credit": 67.87569668044786,
-        "battery": 30.80650586045808,
-        "pack_bonus": 36.65399952661515,
-        "distance_to_target": 25.441627225945602,  # This marker has NEGATIVE value
-        "distance_to_charger": 1.5621648126360552  # This marker has NEGATIVE value
-    }
-
-    # Calculate markers that give the robot advantage
-    if other_robot.battery == 0 and robot.credit-other_robot.credit > 0:
-        return float("inf")
-    markers = {}
-    markers["delta_credit"] = robot.credit - other_robot.credit
-    markers["credit"] = robot.credit
-    markers["delta_battery"] = robot.battery - other_robot.battery
-    markers["battery"] = robot.battery
-    has_pack = 1 if robot.package else 0
-    rival_has_pack = 1 if other_robot.package else 0
-    markers["delta_pack"] = has_pack - rival_has_pack
-    markers["pack_bonus"] = has_pack
-
-    if not robot.package:
-        closest_pack = -min([manhattan_distance(robot.position, pack.position) for pack in env.packages if pack.on_board])
-    markers["distance_to_target"] = closest_pack if not robot.package else -manhattan_distance(robot.position, robot.package.destination)
-
-    closest_charger = min([manhattan_distance(robot.position, charger.position) for charger in env.charge_stations])
-    markers["distance_to_charger"] = -(closest_charger+1) * charger_gain
-
-    return sum([markers[key] * marker_weights[key] for key in markers.keys()])
-
-
-class DNA:
-    def __init__(self, num_features, feature_min, feature_max, mutation_chance=0.1):
-        self.features = []
-        self.feature_min = feature_min
-        self.feature_max = feature_max
-        self.mutation_chance = mutation_chance
-        for feature in range(num_features):
-            self.features.append(random.random() * (feature_max-feature_min))
-
-    def __str__(self):
-        result = ""
-        for i, feature in enumerate(self.features):
-            result += str(i)+": "+str(self.features[i]) + "\n"
-        return result
-
-    def crossover(self, other):
-        transposed = DNA(len(self.features),
-                         self.feature_min, self.feature_max)
-        for feature in range(len(self.features)):
-            random_weight = random.random()
-            transposed.features[feature] = random_weight*(self.features[feature]) + \
-                (1-random_weight)*(other.features[feature])
-            if random.random() < self.mutation_chance:
-                transposed.features[feature] = random.random() * (self.feature_max-self.feature_min)
-        return transposed
-
-
-class AgentGreedyImproved(AgentGreedy):
-    def __init__(self):
-        super().__init__()
-        self.DNA = DNA(8, 0, 100)
-        self.genetic_worth = 0
-        self.wins = 0
-
-    def heuristic(self, env: WarehouseEnv, robot_id: int):
-        return smart_heuristic(env, robot_id, self.DNA)
-
-
-class AgentMinimax(Agent):
-    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
-        self.best_move = None
-        self.original = agent_id
-        iterations = 1
-        try:
-            func_timeout.func_timeout(time_limit-0.1, self.anytime_step, args=(env, self.original, iterations))
-        except func_timeout.FunctionTimedOut:
-            return self.best_move
-
-    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
-        operators = env.get_legal_operators(agent_id)
-        children = self.apply_moves(agent_id, env)
-        while True:
-            child_values = [self.value(child, agent_id, iterations) for child in children]
-            self.best_move = operators[child_values.index(max(child_values))]
-            iterations += 1
-
-    def value(self, state: WarehouseEnv, agent_id, iterations):
-        if iterations==0 or state.done():
-            return smart_heuristic(state, self.original, None)
-        if agent_id == self.original:
-            return self.max_value(state, agent_id, iterations)
-        else:
-            return self.min_value(state, agent_id, iterations)
-
-    def max_value(self, state: WarehouseEnv, agent_id, iterations):
-        new_agent_id = (agent_id + 1) % 2
-        children = self.apply_moves(agent_id, state)
-        return max([self.value(child, new_agent_id, iterations - 1) for child in children])
-
-    def min_value(self, state: WarehouseEnv, agent_id, iterations):
-        new_agent_id = (agent_id + 1) % 2
-        children = self.apply_moves(agent_id, state)
-        return min([self.value(child, new_agent_id, iterations - 1) for child in children])
-
-    def apply_moves(self, agent, env: WarehouseEnv):
-        operators = env.get_legal_operators(agent)
-        children = [env.clone() for op in operators]
-        for child, op in zip(children, operators):
-            child.apply_operator(agent, op)
-        return children
-
-
-class AgentAlphaBeta(Agent):
-    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
-        self.best_move = None
-        self.original = agent_id
-        iterations = 1
-        try:
-            func_timeout.func_timeout(time_limit - 0.1, self.anytime_step, args=(env, self.original, iterations))
-        except Exception:
-            return self.best_move
-
-    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
-        operators = env.get_legal_operators(agent_id)
-        children = AgentMinimax.apply_moves(AgentMinimax(), agent_id, env)
-        while True:
-            child_values = [self.value(child, agent_id, iterations) for child in children]
-            self.best_move = operators[child_values.index(max(child_values))]
-            iterations += 1
-            if iterations > 4:
-                raise Exception()
-
-    def value(self, state: WarehouseEnv, agent_id, iterations):
-        alpha = -float("inf")
-        beta = float("inf")
-        result = self.max_value(state, agent_id, iterations, alpha, beta)
-        return result
-
-    def max_value(self, state: WarehouseEnv, agent_id, iterations, alpha, beta):
-        if iterations==0 or state.done():
-            return smart_heuristic(state, agent_id, None)
-        new_agent_id = (agent_id + 1) % 2
-        children = AgentMinimax.apply_moves(AgentMinimax(), agent_id, state)
-        result = -float("inf")
-        for child in children:
-            result = max(result, self.min_value(child, new_agent_id, iterations-1, alpha, beta))
-            if result >= beta:
-                return result
-            alpha = max(alpha, result)
-        return result
-
-    def min_value(self, state: WarehouseEnv, agent_id, iterations, alpha, beta):
-        if iterations==0 or state.done():
-            return smart_heuristic(state, agent_id, None)
-        new_agent_id = (agent_id + 1) % 2
-        children = AgentMinimax.apply_moves(AgentMinimax(), agent_id, state)
-        result = float("inf")
-        for child in children:
-            result = min(result, self.max_value(child, new_agent_id, iterations - 1, alpha, beta))
-            if result <= alpha:
-                return result
-            beta = min(beta, result)
-        return result
-
-
-class AgentExpectimax(Agent):
-    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
-        self.best_move = None
-        self.original = agent_id
-        iterations = 1
-        try:
-            func_timeout.func_timeout(time_limit - 0.1, self.anytime_step, args=(env, self.original, iterations))
-        except func_timeout.FunctionTimedOut:
-            return self.best_move
-
-    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
-        operators = env.get_legal_operators(agent_id)
-        children = AgentMinimax.apply_moves(AgentMinimax(), agent_id, env)
-        while True:
-            child_values = [self.value(child, agent_id, iterations) for child in children]
-            self.best_move = operators[child_values.index(max(child_values))]
-            iterations += 1
-
-    def value(self, state: WarehouseEnv, agent_id, iterations):
-        if iterations == 0 or state.done():
-            return smart_heuristic(state, self.original, None)
-        if agent_id == self.original:
-            return self.max_value(state, agent_id, iterations)
-        else:
-            return self.exp_value(state, agent_id, iterations)
-
-    def max_value(self, state: WarehouseEnv, agent_id, iterations):
-        new_agent_id = (agent_id + 1) % 2
-        children = AgentMinimax.apply_moves(AgentMinimax(), agent_id, state)
-        return max([self.value(child, new_agent_id, iterations - 1) for child in children])
-
-    def exp_value(self, state: WarehouseEnv, agent_id, iterations):
-        new_agent_id = (agent_id + 1) % 2
-        moves = {"move north":2.0,
-                 "move south":2.0,
-                 "move east":1.0,
-                 "move west":1.0,
-                 "pick up":1.0,
-                 "charge":1.0,
-                 "drop off":1.0,
-                 "park":1.0}
-        operators = state.get_legal_operators(agent_id)
-        sum_chance = sum([moves[op] for op in operators])
-        children = [(state.clone(), op) for op in operators]
-        [child[0].apply_operator(agent_id, child[1]) for child in children]
-        return sum([(moves[child[1]]/sum_chance)*self.value(child[0], new_agent_id, iterations-1) for child in children])
-
-
-# here you can check specific paths to get to know the environment
-class AgentHardCoded(Agent):
-    def __init__(self):
-        self.step = 0
-        # specifiy the path you want to check - if a move is illegal - the agent will choose a random move
-        self.trajectory = ["move west", "move west", "move south"]
-
-    def run_step(self, env: WarehouseEnv, robot_id, time_limit):
-        if self.step == len(self.trajectory):
-            return self.run_random_step(env, robot_id, time_limit)
-        else:
-            op = self.trajectory[self.step]
-            if op not in env.get_legal_operators(robot_id):
-                op = self.run_random_step(env, robot_id, time_limit)
-            self.step += 1
-            return op
-
-    def run_random_step(self, env: WarehouseEnv, robot_id, time_limit):
-        operators, _ = self.successors(env, robot_id)
-
-        return random.choice(operators)
+from Agent import Agent, AgentGreedy
+from WarehouseEnv import WarehouseEnv, board_size
+import multiprocessing
+import queue
+import random
+import time
+import weakref
+from array import array
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+
+def smart_heuristic(env: WarehouseEnv, robot_id: int, dna):
+    evaluator = EVALUATOR if dna is None else Evaluator.of(dna)
+    return evaluator(env, robot_id)
+
+
+class DNA:
+    def __init__(self, num_features, feature_min, feature_max, mutation_chance=0.1):
+        self.features = []
+        self.feature_min = feature_min
+        self.feature_max = feature_max
+        self.mutation_chance = mutation_chance
+        for feature in range(num_features):
+            self.features.append(random.random() * (feature_max-feature_min))
+
+    def __str__(self):
+        result = ""
+        for i, feature in enumerate(self.features):
+            result += str(i)+": "+str(self.features[i]) + "\n"
+        return result
+
+    def crossover(self, other):
+        transposed = DNA(len(self.features),
+                         self.feature_min, self.feature_max)
+        for feature in range(len(self.features)):
+            random_weight = random.random()
+            transposed.features[feature] = random_weight*(self.features[feature]) + \
+                (1-random_weight)*(other.features[feature])
+            if random.random() < self.mutation_chance:
+                transposed.features[feature] = random.random() * (self.feature_max-self.feature_min)
+        return transposed
+
+
+# Heuristic markers, in the order of their weights in DNA.features
+FEATURES = ("delta_credit", "delta_battery", "delta_pack", "credit", "battery", "pack_bonus",
+            "distance_to_target", "distance_to_charger")
+
+# These weights were generated using a genetic algorithm
+GA_WEIGHTS = (47.470865087833594, 77.19133774735107, 51.244108828398836, 67.87569668044786,
+              30.80650586045808, 36.65399952661515, 25.441627225945602, 1.5621648126360552)
+
+
+class Evaluator:
+    """smart_heuristic compiled for one weight vector.
+
+    The weights are folded into one coefficient per robot field when the evaluator is built, so a
+    leaf is scored with a few multiplications and no dicts or lists. The two distance markers have
+    negative value. children() scores all the children of a state at once, through one matrix
+    product over a reused feature buffer.
+    """
+
+    _by_dna = weakref.WeakKeyDictionary()
+
+    def __init__(self, weights=GA_WEIGHTS):
+        if isinstance(weights, DNA):
+            weights = weights.features
+        self.weights = tuple(float(weight) for weight in weights)
+        delta_credit, delta_battery, delta_pack, credit, battery, pack_bonus, target, charger = self.weights
+        self.credit = delta_credit + credit
+        self.rival_credit = delta_credit
+        self.battery = delta_battery + battery
+        self.rival_battery = delta_battery
+        self.pack = delta_pack + pack_bonus
+        self.rival_pack = delta_pack
+        self.target = target
+        self.charger = charger
+        self.vector = np.array(self.weights)
+        self._allocate(16)
+
+    @classmethod
+    def of(cls, dna):
+        """The evaluator for dna's current weights, rebuilt only when they change. The cache keeps
+        a copy of the features it was built from, so checking them allocates nothing."""
+        cached = cls._by_dna.get(dna)
+        if cached is None or cached[0] != dna.features:
+            cached = cls._by_dna[dna] = (list(dna.features), cls(dna))
+        return cached[1]
+
+    def __call__(self, env: WarehouseEnv, robot_id: int):
+        robot = env.robots[robot_id]
+        other = env.robots[1 - robot_id]
+        if env.done():
+            return float("inf") if robot.credit > other.credit else -float("inf")
+        if other.battery == 0 and robot.credit > other.credit:
+            return float("inf")
+        x, y = robot.position
+        if robot.package is None:
+            target = None
+            for pack in env.packages:
+                if pack.on_board:
+                    px, py = pack.position
+                    distance = abs(x - px) + abs(y - py)
+                    if target is None or distance < target:
+                        target = distance
+            value = -self.rival_pack if other.package is not None else 0.0
+        else:
+            px, py = robot.package.destination
+            target = abs(x - px) + abs(y - py)
+            value = self.pack - self.rival_pack if other.package is not None else self.pack
+        charger = None
+        for station in env.charge_stations:
+            px, py = station.position
+            distance = abs(x - px) + abs(y - py)
+            if charger is None or distance < charger:
+                charger = distance
+        bat_percent = robot.battery / 20
+        charger_gain = min(20, bat_percent + robot.credit) - bat_percent
+        return (value + self.credit * robot.credit - self.rival_credit * other.credit
+                + self.battery * robot.battery - self.rival_battery * other.battery
+                - self.target * target - self.charger * (charger + 1) * charger_gain)
+
+    def features(self, env: WarehouseEnv, robot_id: int, row, offset=0):
+        """Writes env's markers into row[offset:offset + 8], or returns the terminal value when env
+        is decided."""
+        robot = env.robots[robot_id]
+        other = env.robots[1 - robot_id]
+        if env.done():
+            return float("inf") if robot.credit > other.credit else -float("inf")
+        if other.battery == 0 and robot.credit > other.credit:
+            return float("inf")
+        x, y = robot.position
+        if robot.package is None:
+            target = None
+            for pack in env.packages:
+                if pack.on_board:
+                    px, py = pack.position
+                    distance = abs(x - px) + abs(y - py)
+                    if target is None or distance < target:
+                        target = distance
+            has_pack = 0
+        else:
+            px, py = robot.package.destination
+            target = abs(x - px) + abs(y - py)
+            has_pack = 1
+        charger = None
+        for station in env.charge_stations:
+            px, py = station.position
+            distance = abs(x - px) + abs(y - py)
+            if charger is None or distance < charger:
+                charger = distance
+        bat_percent = robot.battery / 20
+        row[offset] = robot.credit - other.credit
+        row[offset + 1] = robot.battery - other.battery
+        row[offset + 2] = has_pack - (1 if other.package is not None else 0)
+        row[offset + 3] = robot.credit
+        row[offset + 4] = robot.battery
+        row[offset + 5] = has_pack
+        row[offset + 6] = -target
+        row[offset + 7] = -(charger + 1) * (min(20, bat_percent + robot.credit) - bat_percent)
+        return None
+
+    def bounds(self, env: WarehouseEnv, robot_id: int):
+        """(lower, upper) on this evaluator's value for robot_id at any non-terminal state reachable
+        from env within its remaining steps.
+
+        Each robot moves at most once per two steps and a drop pays at most twice the board's
+        diameter, which caps credit; battery only grows by charging credit. Every marker then has
+        an interval, and so does their weighted sum.
+        """
+        diameter = 2 * (board_size - 1)
+        moves = (getattr(env, "num_steps", 0) + 1) // 2 + 1
+        credits, batteries = [], []
+        for robot in (env.robots[robot_id], env.robots[1 - robot_id]):
+            credit = robot.credit + 2 * diameter * moves
+            credits.append(credit)
+            batteries.append(robot.battery + credit)
+        # The charger marker's gain is min(20, battery / 20 + credit) - battery / 20
+        gain = (min(0.0, 20 - batteries[0] / 20), 20.0)
+        charger = (min(gain[0] * (diameter + 1), 0.0), gain[1] * (diameter + 1))
+        terms = [
+            (0.0, -self.rival_pack, self.pack, self.pack - self.rival_pack),
+            (0.0, self.credit * credits[0]),
+            (0.0, -self.rival_credit * credits[1]),
+            (0.0, self.battery * batteries[0]),
+            (0.0, -self.rival_battery * batteries[1]),
+            (0.0, -self.target * diameter),
+            (-self.charger * charger[0], -self.charger * charger[1]),
+        ]
+        return sum(min(term) for term in terms), sum(max(term) for term in terms)
+
+    def children(self, state: WarehouseEnv, agent_id: int, operators, robot_id: int):
+        """The values for robot_id of the states agent_id reaches with each of operators.
+
+        Features are written into a flat array that a NumPy matrix views without copying, so the
+        whole batch is scored by one product with the weight vector.
+        """
+        count = len(operators)
+        if count > len(self.terminal):
+            self._allocate(count)
+        width = len(FEATURES)
+        for i, op in enumerate(operators):
+            record = apply_move(state, agent_id, op)
+            self.terminal[i] = self.features(state, robot_id, self.flat, i * width)
+            undo_move(state, record)
+        values = (self.matrix[:count] @ self.vector).tolist()
+        for i in range(count):
+            if self.terminal[i] is not None:
+                values[i] = self.terminal[i]
+        return values
+
+    def _allocate(self, rows):
+        self.flat = array("d", bytes(8 * rows * len(FEATURES)))
+        self.matrix = np.frombuffer(self.flat).reshape(rows, len(FEATURES))
+        self.terminal = [None] * rows
+
+
+EVALUATOR = Evaluator()
+
+
+class AgentGreedyImproved(AgentGreedy):
+    def __init__(self):
+        super().__init__()
+        self.DNA = DNA(len(GA_WEIGHTS), 0, 100)
+        self.DNA.features = list(GA_WEIGHTS)
+        self.genetic_worth = 0
+        self.wins = 0
+
+    def heuristic(self, env: WarehouseEnv, robot_id: int):
+        return smart_heuristic(env, robot_id, self.DNA)
+
+
+# Operators that only touch the env's counters and the acting robot's own fields
+SIMPLE_OPERATORS = frozenset(["park", "move north", "move south", "move east", "move west", "charge"])
+
+
+def apply_move(env: WarehouseEnv, robot_id: int, operator):
+    """Applies operator to env in place and returns the record undo_move needs to take it back.
+
+    The record holds shallow copies of the env's and the robot's fields. Operators that can move
+    packages around also save the env's lists, the fields of the objects in them and the state of
+    the env's random generators, so a spawned package disappears again on undo.
+    """
+    robot = env.get_robot(robot_id)
+    objects = None
+    if operator not in SIMPLE_OPERATORS:
+        objects = []
+        for value in env.__dict__.values():
+            if isinstance(value, list):
+                objects.append((value, list(value), [(item, item.__dict__.copy()) for item in value]))
+            elif isinstance(value, random.Random):
+                objects.append((value, value.getstate(), None))
+    record = (env.__dict__.copy(), robot, robot.__dict__.copy(), objects)
+    env.apply_operator(robot_id, operator)
+    return record
+
+
+def undo_move(env: WarehouseEnv, record) -> None:
+    env_fields, robot, robot_fields, objects = record
+    if objects is not None:
+        for value, saved, items in objects:
+            if items is None:
+                value.setstate(saved)
+            else:
+                value[:] = saved
+                for item, fields in items:
+                    item.__dict__.update(fields)
+    robot.__dict__.update(robot_fields)
+    env.__dict__.update(env_fields)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchControl:
+    """Time and node budget for one move's search.
+
+    Searches call tick() once per node. The clock is only read every check_every nodes, and
+    tick() raises SearchTimeout once the deadline (time_limit minus margin after creation) or the
+    node budget is spent. Between iterations of iterative deepening, should_deepen() predicts the
+    next iteration's time from the last ones and declines to start one that cannot finish.
+    The agents also count leaf evaluations and cutoffs on it, and report() sums the move up.
+    """
+
+    def __init__(self, time_limit=None, node_limit=None, margin=0.02, check_every=32):
+        self.start = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit - margin
+        self.node_limit = node_limit
+        self.check_mask = check_every - 1
+        self.nodes = 0
+        self.leaves = 0
+        self.cutoffs = 0
+        self.fallback = False
+        self.completed_depth = 0
+        self.iteration_times = []
+        self.last_iteration = self.start
+
+    def tick(self):
+        self.nodes += 1
+        if self.nodes & self.check_mask == 0:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            raise SearchTimeout()
+
+    def count(self, n):
+        """Counts n nodes at once, reading the clock if tick() would have for any of them."""
+        before = self.nodes
+        self.nodes += n
+        if self.nodes > before | self.check_mask:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            raise SearchTimeout()
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def report(self, table=None):
+        """Telemetry of this search. Nodes are visits, leaves included; the cutoff rate is over
+        the nodes that expanded children; fallback means no iteration completed."""
+        hits = table.hits if table is not None else 0
+        expanded = self.nodes - self.leaves - hits
+        return {"depth": self.completed_depth, "nodes": self.nodes, "leaves": self.leaves,
+                "tt_hit_rate": hits / table.probes if table is not None and table.probes else None,
+                "cutoff_rate": self.cutoffs / expanded if expanded > 0 else None,
+                "time": self.elapsed(), "fallback": self.fallback}
+
+    def finish_iteration(self, depth):
+        now = time.perf_counter()
+        self.iteration_times.append(now - self.last_iteration)
+        self.last_iteration = now
+        self.completed_depth = depth
+
+    def should_deepen(self, max_depth=None):
+        if max_depth is not None and self.completed_depth >= max_depth:
+            return False
+        if self.deadline is None or not self.iteration_times:
+            return True
+        times = self.iteration_times
+        growth = times[-1] / times[-2] if len(times) > 1 and times[-2] > 0 else 2.0
+        predicted = times[-1] * min(max(growth, 1.0), 8.0)
+        return time.perf_counter() + predicted < self.deadline
+
+
+class Zobrist:
+    """Zobrist hashing of WarehouseEnv states.
+
+    A state's hash XORs one random 64-bit key per feature: each robot's position, battery, credit
+    and carried package, every package waiting on the board, the steps left and the side to move.
+    A feature's key is drawn from a generator seeded with the feature itself, the first time it is
+    seen, so every process derives the same keys whatever order it meets the features in.
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.keys = {}
+
+    def key(self, feature):
+        key = self.keys.get(feature)
+        if key is None:
+            key = self.keys[feature] = random.Random(f"{self.seed}:{feature!r}").getrandbits(64)
+        return key
+
+    def hash(self, env: WarehouseEnv, to_move: int):
+        key = self.key
+        result = key(("to move", to_move)) ^ key(("steps", getattr(env, "num_steps", None)))
+        for robot_id in (0, 1):
+            robot = env.get_robot(robot_id)
+            result ^= key(("position", robot_id, robot.position))
+            result ^= key(("battery", robot_id, robot.battery))
+            result ^= key(("credit", robot_id, robot.credit))
+            if robot.package:
+                result ^= key(("carried", robot_id, robot.package.position, robot.package.destination))
+        for package in env.packages:
+            if package.on_board:
+                result ^= key(("on board", package.position, package.destination))
+        return result
+
+
+ZOBRIST = Zobrist()
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class TranspositionTable:
+    """Fixed-size table of search results indexed by the low bits of the Zobrist hash.
+
+    Each slot holds (hash, depth, flag, value, best move, generation), where flag says whether
+    value is exact or a lower/upper bound. A slot is overwritten by a search at least as deep, or
+    by any result once the old one is from an earlier move (new_search() starts a generation).
+    """
+
+    def __init__(self, size_bits=18):
+        self.mask = (1 << size_bits) - 1
+        self.slots = [None] * (1 << size_bits)
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def new_search(self):
+        self.generation += 1
+        self.probes = 0
+        self.hits = 0
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+
+    def lookup(self, key, depth, alpha=-float("inf"), beta=float("inf")):
+        """(value, move): value settles the node if the stored result is deep enough and exact
+        or outside (alpha, beta), else None; move is the stored best move, or None."""
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is None or entry[0] != key:
+            return None, None
+        if entry[1] >= depth:
+            flag, value = entry[2], entry[3]
+            if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                self.hits += 1
+                return value, entry[4]
+        return None, entry[4]
+
+    def store(self, key, depth, value, move, alpha=-float("inf"), beta=float("inf")):
+        """Stores value as searched with the window (alpha, beta)."""
+        slot = key & self.mask
+        entry = self.slots[slot]
+        if entry is None or entry[5] != self.generation or depth >= entry[1]:
+            flag = UPPER if value <= alpha else LOWER if value >= beta else EXACT
+            self.slots[slot] = (key, depth, flag, value, move, self.generation)
+
+
+OPERATORS = ("park", "move north", "move south", "move east", "move west", "pick up", "drop off", "charge")
+OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS, 1)}
+
+
+def _release_table(words, values, memory, owner):
+    words.release()
+    values.release()
+    memory.close()
+    if owner:
+        memory.unlink()
+
+
+class SharedTranspositionTable:
+    """TranspositionTable in a shared memory block, for processes searching the same position.
+
+    Each slot is three 64-bit words: the value, an info word packing flag, move, generation and
+    depth, and the hash XORed with the other two. Writes take no lock; a slot torn by concurrent
+    writers fails the XOR check and reads as empty. Pickling attaches to the same block by name.
+    The block is released by close(), or when the table is collected.
+    """
+
+    def __init__(self, size_bits=18, name=None):
+        self.size_bits = size_bits
+        self.mask = (1 << size_bits) - 1
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=24 << size_bits)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.words = self.memory.buf.cast("Q")
+        self.values = self.memory.buf.cast("d")
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.close = weakref.finalize(self, _release_table, self.words, self.values, self.memory, self.owner)
+        if self.owner:
+            self.clear()
+
+    def __getstate__(self):
+        return self.size_bits, self.memory.name, self.generation
+
+    def __setstate__(self, state):
+        size_bits, name, generation = state
+        self.__init__(size_bits, name)
+        self.generation = generation
+
+    def new_search(self):
+        self.generation += 1
+        self.probes = 0
+        self.hits = 0
+
+    def clear(self):
+        np.frombuffer(self.memory.buf, dtype=np.uint64)[:] = 0
+
+    def lookup(self, key, depth, alpha=-float("inf"), beta=float("inf")):
+        self.probes += 1
+        base = (key & self.mask) * 3
+        words = self.words
+        bits, info = words[base], words[base + 1]
+        if words[base + 2] ^ bits ^ info != key:
+            return None, None
+        value = self.values[base]
+        if words[base] != bits:
+            return None, None
+        code = (info >> 2) & 15
+        move = OPERATORS[code - 1] if code else None
+        if info >> 24 >= depth:
+            flag = info & 3
+            if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                self.hits += 1
+                return value, move
+        return None, move
+
+    def store(self, key, depth, value, move, alpha=-float("inf"), beta=float("inf")):
+        base = (key & self.mask) * 3
+        words = self.words
+        info = words[base + 1]
+        generation = self.generation & 0xffff
+        if (info >> 8) & 0xffff != generation or depth >= info >> 24:
+            flag = UPPER if value <= alpha else LOWER if value >= beta else EXACT
+            info = flag | OPERATOR_CODES.get(move, 0) << 2 | generation << 8 | depth << 24
+            self.values[base] = float(value)
+            words[base + 1] = info
+            words[base + 2] = key ^ words[base] ^ info
+
+
+def ordered(operators, first):
+    if first in operators:
+        operators.remove(first)
+        operators.insert(0, first)
+    return operators
+
+
+class AgentMinimax(Agent):
+    def __init__(self, node_limit=None, dna=None):
+        self.original = None
+        self.table = TranspositionTable()
+        self.node_limit = node_limit
+        self.evaluator = EVALUATOR if dna is None else Evaluator(dna)
+        self.control = SearchControl()
+
+    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
+        self.best_move = None
+        if self.original != agent_id:
+            self.table.clear()
+        self.original = agent_id
+        self.table.new_search()
+        self.control = SearchControl(time_limit, self.node_limit)
+        iterations = 1
+        return self.anytime_step(env, self.original, iterations)
+
+    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
+        operators = env.get_legal_operators(agent_id)
+        # Moves are made and unmade on a private copy, which a timeout may abandon mid-move
+        state = env.clone()
+        while True:
+            child_values = []
+            try:
+                for op in operators:
+                    record = apply_move(state, agent_id, op)
+                    child_values.append(self.value(state, (agent_id + 1) % 2, iterations))
+                    undo_move(state, record)
+            except SearchTimeout:
+                break
+            self.best_move = operators[child_values.index(max(child_values))]
+            self.control.finish_iteration(iterations)
+            if not self.control.should_deepen(getattr(env, "num_steps", None)):
+                break
+            iterations += 1
+        if self.best_move is None:
+            self.control.fallback = True
+            return operators[0]
+        return self.best_move
+
+    def value(self, state: WarehouseEnv, agent_id, iterations):
+        self.control.tick()
+        if iterations==0 or state.done():
+            self.control.leaves += 1
+            return self.evaluator(state, self.original)
+        key = ZOBRIST.hash(state, agent_id)
+        result, _ = self.table.lookup(key, iterations)
+        if result is not None:
+            return result
+        if agent_id == self.original:
+            result, move = self.max_value(state, agent_id, iterations)
+        else:
+            result, move = self.min_value(state, agent_id, iterations)
+        self.table.store(key, iterations, result, move)
+        return result
+
+    def max_value(self, state: WarehouseEnv, agent_id, iterations):
+        new_agent_id = (agent_id + 1) % 2
+        result, best = -float("inf"), None
+        for op in state.get_legal_operators(agent_id):
+            record = apply_move(state, agent_id, op)
+            value = self.value(state, new_agent_id, iterations - 1)
+            undo_move(state, record)
+            if value > result or best is None:
+                result, best = value, op
+        return result, best
+
+    def min_value(self, state: WarehouseEnv, agent_id, iterations):
+        new_agent_id = (agent_id + 1) % 2
+        result, best = float("inf"), None
+        for op in state.get_legal_operators(agent_id):
+            record = apply_move(state, agent_id, op)
+            value = self.value(state, new_agent_id, iterations - 1)
+            undo_move(state, record)
+            if value < result or best is None:
+                result, best = value, op
+        return result, best
+
+
+class AgentAlphaBeta(Agent):
+    # aspiration is the half-width of the root window around the previous iteration's value, or
+    # None to always search the root with a full window
+    def __init__(self, aspiration=None, node_limit=None, dna=None):
+        self.original = None
+        self.table = TranspositionTable()
+        self.aspiration = aspiration
+        self.node_limit = node_limit
+        self.evaluator = EVALUATOR if dna is None else Evaluator(dna)
+        self.control = SearchControl()
+        self.killers = {}
+        self.history = {}
+        self.depth = 0
+
+    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
+        self.best_move = None
+        if self.original != agent_id:
+            self.table.clear()
+        self.original = agent_id
+        self.table.new_search()
+        self.control = SearchControl(time_limit, self.node_limit)
+        self.killers = {}
+        self.history = {}
+        iterations = 1
+        return self.anytime_step(env, self.original, iterations)
+
+    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
+        operators = env.get_legal_operators(agent_id)
+        state = env.clone()
+        result = None
+        while True:
+            self.depth = iterations
+            try:
+                if self.aspiration is None or result is None or abs(result) == float("inf"):
+                    result, operators = self.root_value(state, agent_id, iterations, operators)
+                else:
+                    alpha, beta = result - self.aspiration, result + self.aspiration
+                    result, searched = self.root_value(state, agent_id, iterations, operators, alpha, beta)
+                    if alpha < result < beta:
+                        operators = searched
+                    else:
+                        result, operators = self.root_value(state, agent_id, iterations, operators)
+            except SearchTimeout:
+                break
+            self.best_move = operators[0]
+            self.control.finish_iteration(iterations)
+            if not self.control.should_deepen(getattr(env, "num_steps", None)):
+                break
+            iterations += 1
+        if self.best_move is None:
+            self.control.fallback = True
+            return operators[0]
+        return self.best_move
+
+    def root_value(self, state: WarehouseEnv, agent_id, iterations, operators,
+                   alpha=-float("inf"), beta=float("inf")):
+        """Alpha-beta over the root moves, with alpha carried from sibling to sibling.
+        Returns the root value and the moves reordered best first for the next iteration."""
+        new_agent_id = (agent_id + 1) % 2
+        result, values = -float("inf"), {}
+        for op in operators:
+            record = apply_move(state, agent_id, op)
+            values[op] = self.min_value(state, new_agent_id, iterations, alpha, beta)
+            undo_move(state, record)
+            result = max(result, values[op])
+            if result >= beta:
+                break
+            alpha = max(alpha, result)
+        # Sorting is stable, so searched moves keep their order among equals and unsearched ones go last
+        return result, sorted(operators, key=lambda op: -values.get(op, -float("inf")))
+
+    def order(self, operators, table_move, agent_id, iterations):
+        """The transposition table's move, then this ply's killer moves, then by history score."""
+        history = self.history
+        operators.sort(key=lambda op: -history.get((agent_id, op), 0))
+        for killer in reversed(self.killers.get(self.depth - iterations, ())):
+            ordered(operators, killer)
+        return ordered(operators, table_move)
+
+    def cutoff(self, op, agent_id, iterations):
+        self.control.cutoffs += 1
+        ply = self.depth - iterations
+        killers = self.killers.setdefault(ply, [])
+        if op not in killers:
+            killers.insert(0, op)
+            del killers[2:]
+        self.history[(agent_id, op)] = self.history.get((agent_id, op), 0) + iterations * iterations
+
+    def max_value(self, state: WarehouseEnv, agent_id, iterations, alpha, beta):
+        self.control.tick()
+        if iterations==0 or state.done():
+            self.control.leaves += 1
+            return self.evaluator(state, self.original)
+        key = ZOBRIST.hash(state, agent_id)
+        result, table_move = self.table.lookup(key, iterations, alpha, beta)
+        if result is not None:
+            return result
+        new_agent_id = (agent_id + 1) % 2
+        window = alpha, beta
+        result, best = -float("inf"), None
+        for op in self.order(state.get_legal_operators(agent_id), table_move, agent_id, iterations):
+            record = apply_move(state, agent_id, op)
+            value = self.min_value(state, new_agent_id, iterations-1, alpha, beta)
+            undo_move(state, record)
+            if value > result or best is None:
+                result, best = value, op
+            if result >= beta:
+                self.cutoff(op, agent_id, iterations)
+                break
+            alpha = max(alpha, result)
+        self.table.store(key, iterations, result, best, *window)
+        return result
+
+    def min_value(self, state: WarehouseEnv, agent_id, iterations, alpha, beta):
+        self.control.tick()
+        if iterations==0 or state.done():
+            self.control.leaves += 1
+            return self.evaluator(state, self.original)
+        key = ZOBRIST.hash(state, agent_id)
+        result, table_move = self.table.lookup(key, iterations, alpha, beta)
+        if result is not None:
+            return result
+        new_agent_id = (agent_id + 1) % 2
+        window = alpha, beta
+        result, best = float("inf"), None
+        for op in self.order(state.get_legal_operators(agent_id), table_move, agent_id, iterations):
+            record = apply_move(state, agent_id, op)
+            value = self.max_value(state, new_agent_id, iterations - 1, alpha, beta)
+            undo_move(state, record)
+            if value < result or best is None:
+                result, best = value, op
+            if result <= alpha:
+                self.cutoff(op, agent_id, iterations)
+                break
+            beta = min(beta, result)
+        self.table.store(key, iterations, result, best, *window)
+        return result
+
+
+def _lazy_smp_helper(index, table, jobs, results, aspiration, weights):
+    agent = AgentAlphaBeta(aspiration, dna=weights)
+    agent.table = table
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        env, agent_id, time_limit, generation = job
+        agent.original = agent_id
+        table.generation = generation
+        agent.control = SearchControl(time_limit)
+        agent.best_move = None
+        agent.killers = {}
+        agent.history = {}
+        # Odd helpers start a ply deeper, so the helpers are spread over two depths at any time
+        move = agent.anytime_step(env, agent_id, 1 + index % 2)
+        results.put((generation, move, agent.control.completed_depth, agent.control.nodes))
+
+
+class AgentParallelAlphaBeta(AgentAlphaBeta):
+    """Lazy SMP: AgentAlphaBeta searching on several processes that share a transposition table.
+
+    Every move, each of workers - 1 persistent helper processes runs the same iterative deepening
+    as this process on the same position, reading and filling one SharedTranspositionTable. All
+    searches stop at the deadline, less collect_margin to gather the helpers' results, and the
+    move of the deepest completed search is played, this process's winning ties. Helpers start
+    with the first move; close() stops them. The gain comes only from extra cores: workers
+    defaults to cpu_count(), and on a single core the processes just split the same time.
+    """
+
+    def __init__(self, workers=None, aspiration=None, dna=None, size_bits=18, collect_margin=0.05):
+        super().__init__(aspiration, dna=dna)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.table = SharedTranspositionTable(size_bits)
+        self.collect_margin = collect_margin
+        self.helpers = []
+        self.jobs = []
+        self.results = None
+        self.stats = {}
+
+    def start(self):
+        self.results = multiprocessing.Queue()
+        for index in range(1, self.workers):
+            jobs = multiprocessing.Queue()
+            helper = multiprocessing.Process(target=_lazy_smp_helper, daemon=True,
+                                             args=(index, self.table, jobs, self.results, self.aspiration,
+                                                   self.evaluator.weights))
+            helper.start()
+            self.helpers.append(helper)
+            self.jobs.append(jobs)
+
+    def close(self):
+        for jobs in self.jobs:
+            jobs.put(None)
+        for helper in self.helpers:
+            helper.join()
+        self.helpers, self.jobs = [], []
+
+    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
+        if self.workers > 1 and not self.helpers:
+            self.start()
+        self.best_move = None
+        if self.original != agent_id:
+            self.table.clear()
+        self.original = agent_id
+        self.table.new_search()
+        self.control = SearchControl(time_limit - self.collect_margin)
+        self.killers = {}
+        self.history = {}
+        for jobs in self.jobs:
+            jobs.put((env, agent_id, time_limit - self.collect_margin - self.control.elapsed(), self.table.generation))
+        move = self.anytime_step(env, self.original, 1)
+        depth, nodes, received = self.control.completed_depth, self.control.nodes, 0
+        deadline = self.control.start + time_limit - self.collect_margin / 2
+        while received < len(self.jobs):
+            try:
+                result = self.results.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            generation, helper_move, helper_depth, helper_nodes = result
+            if generation != self.table.generation:
+                continue
+            received += 1
+            nodes += helper_nodes
+            if helper_move is not None and helper_depth > depth:
+                depth, move = helper_depth, helper_move
+        self.depth = depth
+        self.stats = {"searches": 1 + received, "depth": depth, "nodes": nodes,
+                      "nodes_per_second": nodes / self.control.elapsed()}
+        return move
+
+
+# Relative chance of each opponent operator; a chance node spreads its probability over the legal ones
+CHANCE_WEIGHTS = {"move north": 2.0, "move south": 2.0, "move east": 1.0, "move west": 1.0,
+                  "pick up": 1.0, "charge": 1.0, "drop off": 1.0, "park": 1.0}
+
+_chance_tables = {}
+
+
+def chance_table(operators):
+    """(probability, probability left after it) for each of operators, built once per operator list."""
+    key = tuple(operators)
+    table = _chance_tables.get(key)
+    if table is None:
+        weights = [CHANCE_WEIGHTS[op] for op in operators]
+        total = sum(weights)
+        table = _chance_tables[key] = tuple((weight / total, sum(weights[i + 1:]) / total)
+                                            for i, weight in enumerate(weights))
+    return table
+
+
+class AgentExpectimax(Agent):
+    """Expectimax with Star1 pruning and a table of chance node results.
+
+    Every leaf lies within bounds, so a chance node whose searched children plus the upper bound
+    on the rest cannot beat the max node above it stops early. By default the bounds are derived
+    from the evaluator each move (Evaluator.bounds), widened by one so that a win, scored as the
+    upper bound, still beats every other leaf; a leaf outside them is clamped. Declared bounds
+    that a leaf falls outside of raise ValueError instead. Chance nodes are stored in a TranspositionTable under their Zobrist hash and
+    depth, flagged as exact or as a bound when they were cut off; the table is cleared whenever
+    the bounds change, since its values were scored against the old ones.
+    """
+
+    def __init__(self, node_limit=None, dna=None, bounds=None):
+        self.node_limit = node_limit
+        self.evaluator = EVALUATOR if dna is None else Evaluator(dna)
+        self.declared_bounds = bounds
+        self.bounds = bounds
+        self.original = None
+        self.table = TranspositionTable()
+        self.control = SearchControl()
+
+    def run_step(self, env: WarehouseEnv, agent_id, time_limit):
+        self.best_move = None
+        bounds = self.declared_bounds
+        if bounds is None:
+            lower, upper = self.evaluator.bounds(env, agent_id)
+            bounds = lower - 1, upper + 1
+        if self.original != agent_id or self.bounds != bounds:
+            self.table.clear()
+        self.original = agent_id
+        self.bounds = bounds
+        self.table.new_search()
+        self.control = SearchControl(time_limit, self.node_limit)
+        iterations = 1
+        return self.anytime_step(env, self.original, iterations)
+
+    def anytime_step(self, env: WarehouseEnv, agent_id, iterations):
+        operators = env.get_legal_operators(agent_id)
+        state = env.clone()
+        while True:
+            child_values = []
+            try:
+                for op in operators:
+                    record = apply_move(state, agent_id, op)
+                    alpha = max(child_values) if child_values else -float("inf")
+                    child_values.append(self.value(state, (agent_id + 1) % 2, iterations, alpha, float("inf")))
+                    undo_move(state, record)
+            except SearchTimeout:
+                break
+            self.best_move = operators[child_values.index(max(child_values))]
+            self.control.finish_iteration(iterations)
+            if not self.control.should_deepen(getattr(env, "num_steps", None)):
+                break
+            iterations += 1
+        if self.best_move is None:
+            self.control.fallback = True
+            return operators[0]
+        return self.best_move
+
+    def leaf(self, state: WarehouseEnv):
+        return self.clamp(self.evaluator(state, self.original))
+
+    def clamp(self, value):
+        """A leaf value within bounds: wins and losses become the bounds, and anything else
+        outside them is clamped, or an error when the bounds were declared."""
+        lower, upper = self.bounds
+        if lower <= value <= upper:
+            return value
+        if self.declared_bounds is not None and abs(value) != float("inf"):
+            raise ValueError(f"Leaf value {value} outside the declared bounds {self.bounds}")
+        return upper if value > upper else lower
+
+    def value(self, state: WarehouseEnv, agent_id, iterations, alpha=-float("inf"), beta=float("inf")):
+        self.control.tick()
+        if iterations == 0 or state.done():
+            self.control.leaves += 1
+            return self.leaf(state)
+        if agent_id == self.original:
+            return self.max_value(state, agent_id, iterations, alpha, beta)
+        else:
+            return self.exp_value(state, agent_id, iterations, alpha, beta)
+
+    def max_value(self, state: WarehouseEnv, agent_id, iterations, alpha=-float("inf"), beta=float("inf")):
+        new_agent_id = (agent_id + 1) % 2
+        operators = state.get_legal_operators(agent_id)
+        if iterations == 1:
+            self.control.count(len(operators))
+            self.control.leaves += len(operators)
+            return max(self.clamp(value) for value in self.evaluator.children(state, agent_id, operators, self.original))
+        result = -float("inf")
+        for op in operators:
+            record = apply_move(state, agent_id, op)
+            value = self.value(state, new_agent_id, iterations - 1, max(alpha, result), beta)
+            undo_move(state, record)
+            if value > result:
+                result = value
+                if result >= beta:
+                    self.control.cutoffs += 1
+                    break
+        return result
+
+    def exp_value(self, state: WarehouseEnv, agent_id, iterations, alpha=-float("inf"), beta=float("inf")):
+        new_agent_id = (agent_id + 1) % 2
+        key = ZOBRIST.hash(state, agent_id)
+        result, _ = self.table.lookup(key, iterations, alpha, beta)
+        if result is not None:
+            return result
+        operators = state.get_legal_operators(agent_id)
+        table = chance_table(operators)
+        lower, upper = self.bounds
+        clamp = self.clamp
+        if iterations == 1:
+            self.control.count(len(operators))
+            self.control.leaves += len(operators)
+            values = self.evaluator.children(state, agent_id, operators, self.original)
+            result = sum(p * clamp(value) for (p, _), value in zip(table, values))
+            self.table.store(key, iterations, result, None)
+            return result
+        result = 0.0
+        for op, (p, rest) in zip(operators, table):
+            # The window this child must fall outside of for the node to be decided whatever the rest are worth
+            child_alpha = (alpha - result - upper * rest) / p
+            child_beta = (beta - result - lower * rest) / p
+            record = apply_move(state, agent_id, op)
+            value = self.value(state, new_agent_id, iterations - 1, max(child_alpha, lower), min(child_beta, upper))
+            undo_move(state, record)
+            result += p * value
+            if result + upper * rest <= alpha:
+                self.control.cutoffs += 1
+                result += upper * rest
+                break
+            if result + lower * rest >= beta:
+                self.control.cutoffs += 1
+                result += lower * rest
+                break
+        self.table.store(key, iterations, result, None, alpha, beta)
+        return result
+
+
+# here you can check specific paths to get to know the environment
+class AgentHardCoded(Agent):
+    def __init__(self):
+        self.step = 0
+        # specifiy the path you want to check - if a move is illegal - the agent will choose a random move
+        self.trajectory = ["move west", "move west", "move south"]
+
+    def run_step(self, env: WarehouseEnv, robot_id, time_limit):
+        if self.step == len(self.trajectory):
+            return self.run_random_step(env, robot_id, time_limit)
+        else:
+            op = self.trajectory[self.step]
+            if op not in env.get_legal_operators(robot_id):
+                op = self.run_random_step(env, robot_id, time_limit)
+            self.step += 1
+            return op
+
+    def run_random_step(self, env: WarehouseEnv, robot_id, time_limit):
+        operators, _ = self.successors(env, robot_id)
+
+        return random.choice(operators)